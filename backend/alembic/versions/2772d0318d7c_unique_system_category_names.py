@@ -0,0 +1,82 @@
+"""De-duplicate system categories and index their names as unique.
+
+seed_system_categories inserts with ON CONFLICT (name) WHERE is_system, which
+needs this partial unique index. Older databases may hold several system rows
+per name (the previous seed could race with itself); references are moved to
+the oldest row of each name before the extras are deleted.
+
+Tables are created by Base.metadata.create_all at startup, so every step
+checks the live schema first: a fresh database already has the index, and a
+database without the table yet has nothing to migrate.
+
+Revision ID: 2772d0318d7c
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2772d0318d7c"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "uq_categories_system_name"
+
+# Columns pointing at categories.id that must follow a merged duplicate
+CATEGORY_REFERENCES = (
+    ("transactions", "category_id"),
+    ("recurring_patterns", "category_id"),
+    ("categories", "parent_id"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+    if "categories" not in tables:
+        return
+    if any(ix["name"] == INDEX_NAME for ix in inspector.get_indexes("categories")):
+        return
+
+    rows = bind.execute(
+        sa.text(
+            "SELECT id, name FROM categories WHERE is_system "
+            "ORDER BY name, created_at, id"
+        )
+    ).all()
+    kept: dict[str, object] = {}
+    for category_id, name in rows:
+        if name not in kept:
+            kept[name] = category_id
+            continue
+        for table, column in CATEGORY_REFERENCES:
+            if table in tables:
+                bind.execute(
+                    sa.text(f"UPDATE {table} SET {column} = :kept WHERE {column} = :dup"),
+                    {"kept": kept[name], "dup": category_id},
+                )
+        bind.execute(
+            sa.text("DELETE FROM categories WHERE id = :dup"), {"dup": category_id}
+        )
+
+    op.create_index(
+        INDEX_NAME,
+        "categories",
+        ["name"],
+        unique=True,
+        postgresql_where=sa.text("is_system"),
+        sqlite_where=sa.text("is_system"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(INDEX_NAME, table_name="categories")
@@ -0,0 +1,69 @@
+"""Index active bills by amount and audit events by entity and by user.
+
+ix_recurring_patterns_user_active_amount serves get_bills (a user's active
+bills, largest first). The audit indexes serve reconstruct_why and the
+keyset-paginated get_events_for_user; the latter supersedes the
+(user_id, timestamp) index some databases got from create_all, which is
+dropped.
+
+As in the earlier revisions, each step checks the live schema first.
+
+Revision ID: 3c082b0a75be
+Revises: 5e37d0cf8377
+Create Date: 2026-10-17 09:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c082b0a75be"
+down_revision: Union[str, Sequence[str], None] = "5e37d0cf8377"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BILLS_INDEX = "ix_recurring_patterns_user_active_amount"
+AUDIT_INDEXES = {
+    "ix_audit_log_events_entity_timestamp": ["entity_type", "entity_id", "timestamp"],
+    "ix_audit_log_events_user_timestamp_id": ["user_id", "timestamp", "id"],
+}
+SUPERSEDED_AUDIT_INDEX = "ix_audit_log_events_user_timestamp"
+
+
+def _index_names(inspector, table: str) -> set[str]:
+    return {ix["name"] for ix in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+
+    if "recurring_patterns" in tables and BILLS_INDEX not in _index_names(
+        inspector, "recurring_patterns"
+    ):
+        op.create_index(
+            BILLS_INDEX,
+            "recurring_patterns",
+            ["user_id", sa.text("estimated_amount DESC")],
+            postgresql_where=sa.text("is_active"),
+            sqlite_where=sa.text("is_active"),
+        )
+
+    if "audit_log_events" in tables:
+        existing = _index_names(inspector, "audit_log_events")
+        for name, columns in AUDIT_INDEXES.items():
+            if name not in existing:
+                op.create_index(name, "audit_log_events", columns)
+        if SUPERSEDED_AUDIT_INDEX in existing:
+            op.drop_index(SUPERSEDED_AUDIT_INDEX, table_name="audit_log_events")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in AUDIT_INDEXES:
+        op.drop_index(name, table_name="audit_log_events")
+    op.drop_index(BILLS_INDEX, table_name="recurring_patterns")
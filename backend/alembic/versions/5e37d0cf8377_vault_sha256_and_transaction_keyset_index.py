@@ -0,0 +1,53 @@
+"""Add vault_items.content_sha256 and the transactions keyset index.
+
+content_sha256 backs the vault download ETag; rows uploaded before it stay
+NULL and are served without one. ix_transactions_user_date_id serves the
+newest-first, keyset-paginated transaction listing.
+
+Like every revision here, each step checks the live schema first, since
+create_all at startup already builds both on a fresh database.
+
+Revision ID: 5e37d0cf8377
+Revises: 2772d0318d7c
+Create Date: 2026-10-17 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e37d0cf8377"
+down_revision: Union[str, Sequence[str], None] = "2772d0318d7c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_transactions_user_date_id"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+
+    if "vault_items" in tables and "content_sha256" not in {
+        column["name"] for column in inspector.get_columns("vault_items")
+    }:
+        op.add_column(
+            "vault_items", sa.Column("content_sha256", sa.String(64), nullable=True)
+        )
+
+    if "transactions" in tables and INDEX_NAME not in {
+        ix["name"] for ix in inspector.get_indexes("transactions")
+    }:
+        op.create_index(
+            INDEX_NAME, "transactions", ["user_id", "transaction_date", "id"]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(INDEX_NAME, table_name="transactions")
+    op.drop_column("vault_items", "content_sha256")
@@ -0,0 +1,42 @@
+"""Conditional GET support: weak ETags and 304 Not Modified for JSON payloads."""
+
+import hashlib
+
+import orjson
+from fastapi import Request
+from fastapi.responses import Response
+
+# Clients may store the payload but must revalidate it on every use.
+CACHE_CONTROL = "private, no-cache"
+
+
+def compute_etag(body: bytes) -> str:
+    """Weak ETag from a short BLAKE2b digest of the encoded body."""
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str | None) -> bool:
+    """True if the request's If-None-Match header covers `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header or etag is None:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in {tag.strip() for tag in header.split(",")}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def conditional_json(request: Request, content) -> Response:
+    """Serialize `content` once; answer 304 if the client already has it."""
+    body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    etag = compute_etag(body)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
@@ -1,4 +1,5 @@
-"""Middleware: request ID injection, structured access logging."""
+"""Middleware: request ID injection, structured access logging, DB session scope,
+request body size limits."""
 
 import hashlib
 import logging
@@ -8,6 +9,10 @@ import uuid
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.responses import ORJSONResponse
+from app.dependencies import AsyncScopedSession, db_session_scope
 
 logger = logging.getLogger("finitii.access")
 
@@ -50,6 +55,60 @@ class AccessLogMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class DBSessionMiddleware:
+    """Open a DB session scope per request and always release it at the end.
+
+    Plain ASGI (not BaseHTTPMiddleware) so the scope also covers streamed
+    response bodies, and the session is closed even if dependency teardown
+    never runs.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = db_session_scope.set(object())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await AsyncScopedSession.remove()
+            db_session_scope.reset(token)
+
+
+class BodySizeLimitMiddleware(BaseHTTPMiddleware):
+    """Reject oversized request bodies from Content-Length, before reading them.
+
+    `limits` maps path prefixes to a maximum body size in bytes. Requests
+    without a Content-Length (chunked) are left to the handler, which must
+    enforce its own limit while streaming.
+    """
+
+    def __init__(self, app: ASGIApp, limits: dict[str, int]) -> None:
+        super().__init__(app)
+        self.limits = limits
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            path = request.url.path
+            for prefix, max_bytes in self.limits.items():
+                if path.startswith(prefix) and int(content_length) > max_bytes:
+                    return ORJSONResponse(
+                        status_code=413,
+                        content={
+                            "error": True,
+                            "status_code": 413,
+                            "detail": "Request body too large.",
+                            "request_id": getattr(request.state, "request_id", None),
+                        },
+                    )
+        return await call_next(request)
+
+
 def _hash_user_id(uid: str) -> str:
     """Hash user ID for log privacy — first 12 chars of SHA-256."""
     return hashlib.sha256(str(uid).encode()).hexdigest()[:12]
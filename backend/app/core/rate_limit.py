@@ -13,7 +13,9 @@ from collections import defaultdict
 
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
+
+from app.core.responses import ORJSONResponse
 
 # (max_requests, window_seconds)
 _IP_RULES: list[tuple[str, int, int]] = [
@@ -78,9 +80,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
 
-def _rate_limit_response(request: Request) -> JSONResponse:
+def _rate_limit_response(request: Request) -> ORJSONResponse:
     request_id = getattr(request.state, "request_id", None)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=429,
         content={
             "error": True,
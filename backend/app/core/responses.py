@@ -0,0 +1,17 @@
+"""Response classes: orjson-encoded JSON for all API responses."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (~2-5x faster than json.dumps).
+
+    Content reaching render() has already been made JSON-compatible by
+    FastAPI (response_model / jsonable_encoder), so no default hook is needed.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -1,22 +1,86 @@
 """Dependency injection: DB sessions, common dependencies."""
 
 from collections.abc import AsyncGenerator
+from contextvars import ContextVar
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import orjson
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.config import settings
 
-engine = create_async_engine(settings.database_url, echo=settings.debug)
+
+def json_serializer(value: Any) -> str:
+    """Encode JSON columns (e.g. audit detail) with orjson instead of json.dumps."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _connect_args() -> dict[str, Any]:
+    """asyncpg-only connection options; other drivers get none."""
+    if not settings.database_url.startswith("postgresql+asyncpg"):
+        return {}
+    return {
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        "server_settings": {
+            "application_name": settings.app_name,
+            "jit": "on" if settings.db_jit else "off",
+        },
+    }
+
+
+engine = create_async_engine(
+    settings.database_url,
+    echo=settings.debug,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
+    query_cache_size=settings.db_query_cache_size,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
+    connect_args=_connect_args(),
+)
 
 async_session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Per-request scope key, set by DBSessionMiddleware. Every AsyncScopedSession()
+# call within one request returns the same session; the middleware closes it
+# and returns its connection to the pool once the response has been sent.
+db_session_scope: ContextVar[object | None] = ContextVar("db_session_scope", default=None)
+
+
+def _current_scope() -> object:
+    scope = db_session_scope.get()
+    if scope is None:
+        raise RuntimeError("DB session requested outside of a request scope")
+    return scope
+
+
+AsyncScopedSession = async_scoped_session(async_session_factory, scopefunc=_current_scope)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Yield an async DB session for request-scoped use."""
-    async with async_session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
+    """Yield the request-scoped async DB session, committing on success."""
+    session = AsyncScopedSession()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+
+
+async def release_connection(db: AsyncSession) -> None:
+    """Commit now so the session hands its pooled connection back.
+
+    For handlers about to do slow non-DB work (e.g. a file transfer) that
+    would otherwise pin a connection for its whole duration. The session
+    stays usable; its next query checks out a fresh connection.
+    """
+    await db.commit()
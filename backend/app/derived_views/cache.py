@@ -0,0 +1,72 @@
+"""Short-TTL caches for the dashboard derived views.
+
+The money graph summary, recurring patterns and bill summary views aggregate
+over a user's accounts, transactions and patterns, and dashboards poll them.
+Results are cached per user for 60s and dropped once the transaction of a
+service that writes those rows commits.
+Transaction list pages are cached for 30s, all of a user's pages under one
+entry so a single invalidation drops every page; each user keeps at most
+MAX_TRANSACTION_PAGES_PER_USER pages, evicting the oldest.
+"""
+
+import uuid
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+
+VIEW_CACHE_TTL_SECONDS = 60
+TRANSACTION_PAGE_TTL_SECONDS = 30
+MAX_TRANSACTION_PAGES_PER_USER = 32
+
+summary_cache = TTLCache(maxsize=10_000, ttl=VIEW_CACHE_TTL_SECONDS)
+recurring_cache = TTLCache(maxsize=10_000, ttl=VIEW_CACHE_TTL_SECONDS)
+bill_summary_cache = TTLCache(maxsize=10_000, ttl=VIEW_CACHE_TTL_SECONDS)
+# user_id -> TTLCache of (account_id, limit, offset, cursor) -> rows
+transaction_page_cache = TTLCache(maxsize=10_000, ttl=TRANSACTION_PAGE_TTL_SECONDS)
+
+
+def transaction_pages(user_id: uuid.UUID) -> TTLCache:
+    """The user's cached transaction pages, creating an empty entry if needed."""
+    pages = transaction_page_cache.get(user_id)
+    if pages is None:
+        pages = TTLCache(
+            maxsize=MAX_TRANSACTION_PAGES_PER_USER, ttl=TRANSACTION_PAGE_TTL_SECONDS
+        )
+        transaction_page_cache.set(user_id, pages)
+    return pages
+
+
+def invalidate_user_views(user_id: uuid.UUID) -> None:
+    """Drop every cached derived view for a user after a write."""
+    summary_cache.invalidate(user_id)
+    recurring_cache.invalidate(user_id)
+    bill_summary_cache.invalidate(user_id)
+    transaction_page_cache.invalidate(user_id)
+
+
+# Session.info key for user ids whose views drop when the transaction commits
+_PENDING_KEY = "pending_view_invalidations"
+
+
+def invalidate_user_views_on_commit(db: AsyncSession, user_id: uuid.UUID) -> None:
+    """Drop a user's cached views once db's current transaction commits.
+
+    The request commit runs after the response is sent; invalidating at write
+    time would let a read racing that commit re-cache pre-commit rows.
+    """
+    db.info.setdefault(_PENDING_KEY, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_user_views(user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_rolled_back(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
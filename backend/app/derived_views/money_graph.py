@@ -6,12 +6,12 @@ All views:
 - Include confidence and assumptions where applicable
 """
 
+import base64
 import uuid
-from collections import defaultdict
 from datetime import datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import select, func
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.account import Account
@@ -29,13 +29,26 @@ async def account_summary_view(
     db: AsyncSession,
     user_id: uuid.UUID,
 ) -> list[dict]:
-    """Accounts with balances, types, last synced. No raw provider IDs."""
+    """Accounts with balances, types, last synced. No raw provider IDs.
+
+    Only the projected columns are selected; no Account objects are built.
+    """
     result = await db.execute(
-        select(Account)
+        select(
+            Account.id,
+            Account.account_type,
+            Account.institution_name,
+            Account.account_name,
+            Account.current_balance,
+            Account.available_balance,
+            Account.currency,
+            Account.is_manual,
+            Account.last_synced_at,
+        )
         .where(Account.user_id == user_id)
         .order_by(Account.created_at.asc())
     )
-    accounts = result.scalars().all()
+    accounts = result.all()
 
     return [
         {
@@ -60,43 +73,131 @@ async def transaction_list_view(
     account_id: uuid.UUID | None = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: tuple[datetime, uuid.UUID] | None = None,
 ) -> list[dict]:
     """Transactions with resolved merchant name, category name, formatted amounts.
 
-    No raw provider transaction IDs exposed.
+    No raw provider transaction IDs exposed. Names are resolved by the join
+    in the same query, and only the projected columns are selected, so no
+    ORM objects are built per row.
+
+    Pass `cursor` (see decode_transaction_cursor) instead of `offset` to seek
+    past the previous page on the (user_id, transaction_date, id) index.
     """
     stmt = (
-        select(Transaction, Merchant, Category)
-        .outerjoin(Merchant, Transaction.merchant_id == Merchant.id)
-        .outerjoin(Category, Transaction.category_id == Category.id)
+        _transaction_view_select()
         .where(Transaction.user_id == user_id)
-        .order_by(Transaction.transaction_date.desc())
+        .order_by(Transaction.transaction_date.desc(), Transaction.id.desc())
     )
     if account_id:
         stmt = stmt.where(Transaction.account_id == account_id)
+    if cursor is not None:
+        stmt = stmt.where(
+            tuple_(Transaction.transaction_date, Transaction.id) < tuple_(*cursor)
+        )
     stmt = stmt.offset(offset).limit(limit)
 
     result = await db.execute(stmt)
     rows = result.all()
 
-    return [
-        {
-            "id": str(txn.id),
-            "account_id": str(txn.account_id),
-            "merchant_name": merchant.display_name if merchant else None,
-            "category_name": category.name if category else None,
-            "raw_description": txn.raw_description,
-            "normalized_description": txn.normalized_description,
-            "amount": str(txn.amount),
-            "currency": txn.currency,
-            "transaction_date": txn.transaction_date.isoformat()
-            if txn.transaction_date else None,
-            "posted_date": txn.posted_date.isoformat() if txn.posted_date else None,
-            "is_pending": txn.is_pending,
-            "transaction_type": txn.transaction_type.value,
-        }
-        for txn, merchant, category in rows
-    ]
+    return [_transaction_row(row, row.merchant_name, row.category_name) for row in rows]
+
+
+def encode_transaction_cursor(view: dict) -> str:
+    """Opaque cursor pointing just past `view`, a transaction_list_view row."""
+    raw = f"{view['transaction_date']}|{view['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_transaction_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Inverse of encode_transaction_cursor. Raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        date_part, id_part = raw.split("|")
+        return datetime.fromisoformat(date_part), uuid.UUID(id_part)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+async def get_transaction_view(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    transaction_id: uuid.UUID,
+) -> dict | None:
+    """One transaction by id, same shape as transaction_list_view. None if not the user's."""
+    result = await db.execute(
+        _transaction_view_select().where(
+            Transaction.id == transaction_id, Transaction.user_id == user_id
+        )
+    )
+    row = result.first()
+    if row is None:
+        return None
+    return _transaction_row(row, row.merchant_name, row.category_name)
+
+
+async def transaction_single_view(
+    db: AsyncSession,
+    txn: Transaction,
+) -> dict:
+    """Single transaction in the same shape as transaction_list_view.
+
+    Takes an already-loaded Transaction (e.g. just ingested). Merchant and
+    category are resolved through the session identity map, so a row the
+    service just touched costs no extra query.
+    """
+    merchant = await db.get(Merchant, txn.merchant_id) if txn.merchant_id else None
+    category = await db.get(Category, txn.category_id) if txn.category_id else None
+    return _transaction_row(
+        txn,
+        merchant.display_name if merchant else None,
+        category.name if category else None,
+    )
+
+
+def _transaction_view_select():
+    """Columns behind the transaction view, with names joined in."""
+    return (
+        select(
+            Transaction.id,
+            Transaction.account_id,
+            Transaction.raw_description,
+            Transaction.normalized_description,
+            Transaction.amount,
+            Transaction.currency,
+            Transaction.transaction_date,
+            Transaction.posted_date,
+            Transaction.is_pending,
+            Transaction.transaction_type,
+            Merchant.display_name.label("merchant_name"),
+            Category.name.label("category_name"),
+        )
+        .outerjoin(Merchant, Transaction.merchant_id == Merchant.id)
+        .outerjoin(Category, Transaction.category_id == Category.id)
+    )
+
+
+def _transaction_row(
+    txn,
+    merchant_name: str | None,
+    category_name: str | None,
+) -> dict:
+    """Project a Transaction (or a row of its columns) to the view dict."""
+    return {
+        "id": str(txn.id),
+        "account_id": str(txn.account_id),
+        "merchant_name": merchant_name,
+        "category_name": category_name,
+        "raw_description": txn.raw_description,
+        "normalized_description": txn.normalized_description,
+        "amount": str(txn.amount),
+        "currency": txn.currency,
+        "transaction_date": txn.transaction_date.isoformat()
+        if txn.transaction_date else None,
+        "posted_date": txn.posted_date.isoformat() if txn.posted_date else None,
+        "is_pending": txn.is_pending,
+        "transaction_type": txn.transaction_type.value,
+    }
 
 
 async def recurring_patterns_view(
@@ -105,10 +206,22 @@ async def recurring_patterns_view(
 ) -> list[dict]:
     """Patterns with merchant name, confidence, next expected date.
 
-    Confidence and assumptions always exposed.
+    Confidence and assumptions always exposed. Selects plain columns rather
+    than entities, so no ORM objects are built for this read-only view.
     """
     result = await db.execute(
-        select(RecurringPattern, Merchant, Category)
+        select(
+            RecurringPattern.id,
+            Merchant.display_name,
+            Category.name,
+            RecurringPattern.estimated_amount,
+            RecurringPattern.amount_variance,
+            RecurringPattern.frequency,
+            RecurringPattern.confidence,
+            RecurringPattern.next_expected_date,
+            RecurringPattern.last_observed_date,
+            RecurringPattern.is_active,
+        )
         .outerjoin(Merchant, RecurringPattern.merchant_id == Merchant.id)
         .outerjoin(Category, RecurringPattern.category_id == Category.id)
         .where(
@@ -121,25 +234,28 @@ async def recurring_patterns_view(
 
     return [
         {
-            "id": str(pattern.id),
-            "merchant_name": merchant.display_name if merchant else None,
-            "category_name": category.name if category else None,
-            "estimated_amount": str(pattern.estimated_amount),
-            "amount_variance": str(pattern.amount_variance),
-            "frequency": pattern.frequency.value,
-            "confidence": pattern.confidence.value,
+            "id": str(pattern_id),
+            "merchant_name": merchant_name,
+            "category_name": category_name,
+            "estimated_amount": str(estimated_amount),
+            "amount_variance": str(amount_variance),
+            "frequency": frequency.value,
+            "confidence": confidence.value,
             "assumptions": {
                 "interval_tolerance_days": INTERVAL_TOLERANCE_DAYS,
                 "amount_tolerance_pct": float(AMOUNT_TOLERANCE_FRACTION) * 100,
                 "detection_method": "interval_analysis",
             },
-            "next_expected_date": pattern.next_expected_date.isoformat()
-            if pattern.next_expected_date else None,
-            "last_observed_date": pattern.last_observed_date.isoformat()
-            if pattern.last_observed_date else None,
-            "is_active": pattern.is_active,
+            "next_expected_date": next_expected_date.isoformat()
+            if next_expected_date else None,
+            "last_observed_date": last_observed_date.isoformat()
+            if last_observed_date else None,
+            "is_active": is_active,
         }
-        for pattern, merchant, category in rows
+        for (
+            pattern_id, merchant_name, category_name, estimated_amount, amount_variance,
+            frequency, confidence, next_expected_date, last_observed_date, is_active,
+        ) in rows
     ]
 
 
@@ -149,7 +265,8 @@ async def money_graph_summary_view(
 ) -> dict:
     """Aggregate summary: total balance, monthly income/spending, top categories, top merchants.
 
-    Includes assumptions and confidence where applicable.
+    Includes assumptions and confidence where applicable. All aggregation
+    runs in SQL; no transaction rows are loaded into Python.
     """
     # Total balance across all accounts
     result = await db.execute(
@@ -161,57 +278,46 @@ async def money_graph_summary_view(
     # Monthly income and spending (last 30 days)
     now = datetime.now(timezone.utc)
     thirty_days_ago = now.replace(day=1) if now.day > 1 else now
-
-    # Get all transactions for this period
-    result = await db.execute(
-        select(Transaction)
-        .where(
-            Transaction.user_id == user_id,
-            Transaction.transaction_date >= thirty_days_ago,
-        )
+    in_period = (
+        Transaction.user_id == user_id,
+        Transaction.transaction_date >= thirty_days_ago,
     )
-    recent_txns = result.scalars().all()
 
-    monthly_income = sum(
-        t.amount for t in recent_txns if t.transaction_type == TransactionType.credit
-    )
-    monthly_spending = sum(
-        t.amount for t in recent_txns if t.transaction_type == TransactionType.debit
+    result = await db.execute(
+        select(Transaction.transaction_type, func.sum(Transaction.amount))
+        .where(*in_period)
+        .group_by(Transaction.transaction_type)
     )
+    totals = dict(result.all())
+    monthly_income = totals.get(TransactionType.credit, 0)
+    monthly_spending = totals.get(TransactionType.debit, 0)
 
     # Top categories by spend
-    category_spend: dict[uuid.UUID, Decimal] = defaultdict(Decimal)
-    for t in recent_txns:
-        if t.transaction_type == TransactionType.debit and t.category_id:
-            category_spend[t.category_id] += t.amount
-
-    top_category_ids = sorted(category_spend, key=lambda k: category_spend[k], reverse=True)[:5]
-    top_categories = []
-    for cid in top_category_ids:
-        result = await db.execute(select(Category).where(Category.id == cid))
-        cat = result.scalar_one_or_none()
-        if cat:
-            top_categories.append({
-                "name": cat.name,
-                "total_spent": str(category_spend[cid]),
-            })
+    spent = func.sum(Transaction.amount).label("total_spent")
+    result = await db.execute(
+        select(Category.name, spent)
+        .join(Category, Transaction.category_id == Category.id)
+        .where(*in_period, Transaction.transaction_type == TransactionType.debit)
+        .group_by(Category.id, Category.name)
+        .order_by(spent.desc())
+        .limit(5)
+    )
+    top_categories = [
+        {"name": name, "total_spent": str(total)} for name, total in result.all()
+    ]
 
     # Top merchants by spend
-    merchant_spend: dict[uuid.UUID, Decimal] = defaultdict(Decimal)
-    for t in recent_txns:
-        if t.transaction_type == TransactionType.debit and t.merchant_id:
-            merchant_spend[t.merchant_id] += t.amount
-
-    top_merchant_ids = sorted(merchant_spend, key=lambda k: merchant_spend[k], reverse=True)[:5]
-    top_merchants = []
-    for mid in top_merchant_ids:
-        result = await db.execute(select(Merchant).where(Merchant.id == mid))
-        m = result.scalar_one_or_none()
-        if m:
-            top_merchants.append({
-                "name": m.display_name,
-                "total_spent": str(merchant_spend[mid]),
-            })
+    result = await db.execute(
+        select(Merchant.display_name, spent)
+        .join(Merchant, Transaction.merchant_id == Merchant.id)
+        .where(*in_period, Transaction.transaction_type == TransactionType.debit)
+        .group_by(Merchant.id, Merchant.display_name)
+        .order_by(spent.desc())
+        .limit(5)
+    )
+    top_merchants = [
+        {"name": name, "total_spent": str(total)} for name, total in result.all()
+    ]
 
     return {
         "total_balance": str(total_balance),
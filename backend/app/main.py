@@ -4,12 +4,17 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.ext.asyncio import create_async_engine
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
 
 from app.config import settings
 from app.core.errors import register_error_handlers
-from app.core.middleware import RequestIDMiddleware, AccessLogMiddleware
+from app.core.middleware import (
+    AccessLogMiddleware, BodySizeLimitMiddleware, DBSessionMiddleware, RequestIDMiddleware,
+)
 from app.core.rate_limit import RateLimitMiddleware
+from app.core.responses import ORJSONResponse
+from app.dependencies import async_session_factory, engine
 from app.routers import (
     accounts, auth, bills, cheat_codes, coach, consent, forecast, goals,
     learn, money_graph, onboarding, practice, recurring, transactions, user,
@@ -31,7 +36,7 @@ logger = logging.getLogger("finitii")
 
 @asynccontextmanager
 async def lifespan(application: FastAPI):
-    """Create database tables on startup if they don't exist."""
+    """Create database tables and seed system categories and cheat codes on startup."""
     from app.models.base import Base
     # Import all models so Base.metadata is populated
     from app.models import (  # noqa: F401
@@ -39,12 +44,21 @@ async def lifespan(application: FastAPI):
         category, transaction, recurring, onboarding, goal, cheat_code,
         forecast, coach_memory, learn, practice, vault as vault_model,
     )
-    engine = create_async_engine(settings.database_url)
+    from app.services import category_service, coach_service
+    from app.services.cheat_code_seed import seed_cheat_codes
+
+    # Same pooled engine the request sessions use
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    await engine.dispose()
     logger.info("Database tables verified/created")
+    # Once per process, so request paths never need to seed
+    async with async_session_factory() as db:
+        await category_service.seed_system_categories(db)
+        definitions = await seed_cheat_codes(db)
+        await db.commit()
+    coach_service.warm_definition_cache(definitions)
     yield
+    await engine.dispose()
 
 
 app = FastAPI(
@@ -53,6 +67,7 @@ app = FastAPI(
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Middleware — order matters (last added = first executed)
@@ -61,10 +76,21 @@ cors_kwargs = {
     "allow_credentials": True,
     "allow_methods": ["*"],
     "allow_headers": ["*"],
-    "expose_headers": ["x-request-id"],
+    "expose_headers": ["x-request-id", "x-next-cursor"],
 }
 if settings.cors_allow_origin_regex:
     cors_kwargs["allow_origin_regex"] = settings.cors_allow_origin_regex
+# Innermost, where it still sees whole response bodies and can honour
+# minimum_size. Vault PDFs are skipped along with Starlette's image types:
+# downloads keep their Content-Length and their ETag stays on identity bytes.
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=1024,
+    compresslevel=5,
+    exclude_content_types=DEFAULT_EXCLUDED_CONTENT_TYPES + ("application/pdf",),
+)
+app.add_middleware(DBSessionMiddleware)
+app.add_middleware(BodySizeLimitMiddleware, limits={"/vault": vault.MAX_UPLOAD_BODY})
 app.add_middleware(CORSMiddleware, **cors_kwargs)
 app.add_middleware(RateLimitMiddleware)
 app.add_middleware(AccessLogMiddleware)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.types import JSON
@@ -13,6 +13,12 @@ class AuditLogEvent(Base):
     """Append-only audit log. No UPDATE or DELETE at application level."""
 
     __tablename__ = "audit_log_events"
+    __table_args__ = (
+        # reconstruct_why: one entity's history in order
+        Index("ix_audit_log_events_entity_timestamp", "entity_type", "entity_id", "timestamp"),
+        # get_events_for_user: a user's events in keyset order
+        Index("ix_audit_log_events_user_timestamp_id", "user_id", "timestamp", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=generate_uuid)
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, ForeignKey, String
+from sqlalchemy import Boolean, ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, TimestampMixin, generate_uuid
@@ -8,6 +8,16 @@ from app.models.base import Base, TimestampMixin, generate_uuid
 
 class Category(TimestampMixin, Base):
     __tablename__ = "categories"
+    __table_args__ = (
+        # One row per system category name, so seeding can dedup in the database
+        Index(
+            "uq_categories_system_name",
+            "name",
+            unique=True,
+            postgresql_where=text("is_system"),
+            sqlite_where=text("is_system"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=generate_uuid)
     user_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -3,7 +3,7 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Numeric, String
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Numeric, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, TimestampMixin, generate_uuid
@@ -33,6 +33,16 @@ class RecurringPattern(TimestampMixin, Base):
     """
 
     __tablename__ = "recurring_patterns"
+    __table_args__ = (
+        # Active bills per user, largest first (get_bills)
+        Index(
+            "ix_recurring_patterns_user_active_amount",
+            "user_id",
+            text("estimated_amount DESC"),
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=generate_uuid)
     user_id: Mapped[uuid.UUID] = mapped_column(
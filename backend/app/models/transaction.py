@@ -3,7 +3,7 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Numeric, String
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, TimestampMixin, generate_uuid
@@ -16,6 +16,10 @@ class TransactionType(str, enum.Enum):
 
 class Transaction(TimestampMixin, Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Newest-first listing and keyset pagination per user
+        Index("ix_transactions_user_date_id", "user_id", "transaction_date", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=generate_uuid)
     account_id: Mapped[uuid.UUID] = mapped_column(
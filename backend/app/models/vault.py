@@ -54,6 +54,9 @@ class VaultItem(TimestampMixin, Base):
         String(1000), unique=True, nullable=False
     )
     description: Mapped[str | None] = mapped_column(String(1000), nullable=True)
+    # Hex SHA-256 of the file bytes; the download ETag. Null for items
+    # uploaded before it was recorded.
+    content_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
     uploaded_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
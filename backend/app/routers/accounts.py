@@ -1,12 +1,13 @@
 """Account routes: list, create manual, update balance. Returns derived views."""
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+import uuid
+
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
 from app.dependencies import get_db
 from app.derived_views.money_graph import account_summary_view
-from app.models.account import AccountType
 from app.models.user import User
 from app.schemas.account import AccountBalanceUpdate, AccountCreate
 from app.services import account_service
@@ -14,16 +15,6 @@ from app.services import account_service
 router = APIRouter(prefix="/accounts", tags=["accounts"])
 
 
-def _parse_account_type(value: str) -> AccountType:
-    try:
-        return AccountType(value)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid account_type: {value}",
-        )
-
-
 @router.get("")
 async def list_accounts(
     db: AsyncSession = Depends(get_db),
@@ -40,11 +31,10 @@ async def create_manual(
     current_user: User = Depends(get_current_user),
 ):
     ip = request.client.host if request.client else None
-    acct_type = _parse_account_type(body.account_type)
     acct = await account_service.create_manual_account(
         db,
         user_id=current_user.id,
-        account_type=acct_type,
+        account_type=body.account_type,
         institution_name=body.institution_name,
         account_name=body.account_name,
         current_balance=body.current_balance,
@@ -59,27 +49,21 @@ async def create_manual(
 
 @router.patch("/{account_id}/balance")
 async def update_balance(
-    account_id: str,
+    account_id: uuid.UUID,
     body: AccountBalanceUpdate,
     request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    import uuid as uuid_mod
-
     ip = request.client.host if request.client else None
-    try:
-        aid = uuid_mod.UUID(account_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid account_id")
 
     await account_service.update_manual_balance(
         db,
-        account_id=aid,
+        account_id=account_id,
         new_balance=body.current_balance,
         user_id=current_user.id,
         available_balance=body.available_balance,
         ip_address=ip,
     )
     views = await account_summary_view(db, current_user.id)
-    return [v for v in views if v["id"] == account_id][0]
+    return [v for v in views if v["id"] == str(account_id)][0]
@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
 from app.dependencies import get_db
+from app.derived_views.cache import bill_summary_cache
 from app.models.user import User
 from app.schemas.bill import (
     BillRead,
@@ -41,8 +42,7 @@ async def list_bills(
     Bills are derived views over RecurringPattern.
     Confidence is always visible on every bill.
     """
-    bills = await bill_service.get_bills(db, current_user.id)
-    return bills
+    return await bill_service.get_bill_rows(db, current_user.id)
 
 
 @router.get("/summary", response_model=BillSummaryRead)
@@ -51,7 +51,10 @@ async def get_bill_summary(
     current_user: User = Depends(get_current_user),
 ):
     """Get bill summary: total monthly cost, confidence breakdown, counts."""
-    summary = await bill_service.get_bill_summary(db, current_user.id)
+    summary = bill_summary_cache.get(current_user.id)
+    if summary is None:
+        summary = await bill_service.get_bill_summary(db, current_user.id)
+        bill_summary_cache.set(current_user.id, summary)
     return summary
 
 
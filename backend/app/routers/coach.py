@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
+from app.core.etag import conditional_json
 from app.dependencies import get_db
 from app.models.coach_memory import CoachAggressiveness, CoachTone
 from app.models.user import User
@@ -23,10 +24,18 @@ from app.services import coach_memory_service, coach_service
 
 router = APIRouter(prefix="/coach", tags=["coach"])
 
-VALID_MODES = {"explain", "execute", "plan", "review", "recap"}
+_TONE_MAP: dict[str, CoachTone] = {t.value: t for t in CoachTone}
+_AGGRESSIVENESS_MAP: dict[str, CoachAggressiveness] = {
+    a.value: a for a in CoachAggressiveness
+}
 
-VALID_TONES = {t.value for t in CoachTone}
-VALID_AGGRESSIVENESS = {a.value for a in CoachAggressiveness}
+VALID_TONES = set(_TONE_MAP)
+VALID_AGGRESSIVENESS = set(_AGGRESSIVENESS_MAP)
+
+_TONE_ERR_DETAIL = f"tone must be one of: {', '.join(sorted(VALID_TONES))}"
+_AGGRESSIVENESS_ERR_DETAIL = (
+    f"aggressiveness must be one of: {', '.join(sorted(VALID_AGGRESSIVENESS))}"
+)
 
 
 @router.post("", response_model=CoachResponse)
@@ -39,12 +48,6 @@ async def coach(
     """Coach endpoint: explain, execute, plan, review, or recap mode."""
     ip = request.client.host if request.client else None
 
-    if body.mode not in VALID_MODES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Mode must be one of: {', '.join(sorted(VALID_MODES))}.",
-        )
-
     # Explain and execute require context_type and context_id
     if body.mode in ("explain", "execute"):
         if not body.context_type:
@@ -91,30 +94,34 @@ async def coach(
             user_id=current_user.id,
             ip_address=ip,
         )
-    elif body.mode == "recap":
+    else:
         result = await coach_service.recap(
             db,
             user_id=current_user.id,
             ip_address=ip,
         )
-    else:
-        raise HTTPException(status_code=400, detail="Unsupported mode.")
 
     return CoachResponse(**result)
 
 
 @router.get("/memory", response_model=CoachMemoryRead | None)
 async def get_memory(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get coach memory preferences. Returns null if no ai_memory consent."""
+    """Get coach memory preferences. Returns null if no ai_memory consent.
+
+    Sends an ETag; a matching If-None-Match gets 304 with no body.
+    """
     memory = await coach_memory_service.get_memory(
         db, user_id=current_user.id
     )
     if memory is None:
-        return None
-    return CoachMemoryRead.model_validate(memory)
+        return conditional_json(request, None)
+    return conditional_json(
+        request, CoachMemoryRead.model_validate(memory).model_dump(mode="json")
+    )
 
 
 @router.put("/memory", response_model=CoachMemoryRead)
@@ -130,22 +137,22 @@ async def update_memory(
     # Validate tone
     tone = None
     if body.tone is not None:
-        if body.tone not in VALID_TONES:
+        tone = _TONE_MAP.get(body.tone)
+        if tone is None:
             raise HTTPException(
                 status_code=400,
-                detail=f"tone must be one of: {', '.join(sorted(VALID_TONES))}",
+                detail=_TONE_ERR_DETAIL,
             )
-        tone = CoachTone(body.tone)
 
     # Validate aggressiveness
     aggressiveness = None
     if body.aggressiveness is not None:
-        if body.aggressiveness not in VALID_AGGRESSIVENESS:
+        aggressiveness = _AGGRESSIVENESS_MAP.get(body.aggressiveness)
+        if aggressiveness is None:
             raise HTTPException(
                 status_code=400,
-                detail=f"aggressiveness must be one of: {', '.join(sorted(VALID_AGGRESSIVENESS))}",
+                detail=_AGGRESSIVENESS_ERR_DETAIL,
             )
-        aggressiveness = CoachAggressiveness(body.aggressiveness)
 
     try:
         memory = await coach_memory_service.set_memory(
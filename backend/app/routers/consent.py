@@ -13,16 +13,6 @@ from app.services import consent_service
 router = APIRouter(prefix="/consent", tags=["consent"])
 
 
-def _parse_consent_type(value: str) -> ConsentType:
-    try:
-        return ConsentType(value)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid consent_type: {value}. Must be one of: {[e.value for e in ConsentType]}",
-        )
-
-
 @router.post("/grant", response_model=ConsentRecordRead)
 async def grant(
     body: ConsentGrant,
@@ -30,13 +20,12 @@ async def grant(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    consent_type = _parse_consent_type(body.consent_type)
     ip = request.client.host if request.client else None
     ua = request.headers.get("User-Agent")
     consent = await consent_service.grant_consent(
         db,
         user_id=current_user.id,
-        consent_type=consent_type,
+        consent_type=body.consent_type,
         ip_address=ip,
         user_agent=ua,
     )
@@ -50,12 +39,11 @@ async def revoke(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    consent_type = _parse_consent_type(body.consent_type)
     ip = request.client.host if request.client else None
     consent = await consent_service.revoke_consent(
         db,
         user_id=current_user.id,
-        consent_type=consent_type,
+        consent_type=body.consent_type,
         ip_address=ip,
     )
     if consent is None:
@@ -71,8 +59,5 @@ async def get_status(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    consents = {}
-    for ct in ConsentType:
-        granted = await consent_service.check_consent(db, current_user.id, ct)
-        consents[ct.value] = granted
-    return {"consents": consents}
+    granted = await consent_service.check_consents(db, current_user.id, ConsentType)
+    return {"consents": {ct.value: is_granted for ct, is_granted in granted.items()}}
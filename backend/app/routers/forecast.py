@@ -5,12 +5,17 @@ Endpoints:
 - GET /forecast/latest: Get the most recent forecast
 - GET /forecast/summary: Lightweight summary for dashboard
 - GET /forecast/history: Get recent forecast history
+- GET /forecast/history.ndjson: Same history streamed as NDJSON
 """
 
+import uuid
+
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
+from app.core.cache import TTLCache
 from app.dependencies import get_db
 from app.models.user import User
 from app.schemas.forecast import ForecastRead, ForecastSummaryRead
@@ -18,6 +23,25 @@ from app.services import forecast_service
 
 router = APIRouter(prefix="/forecast", tags=["forecast"])
 
+# Latest snapshot / summary per user for dashboard polling. /summary reuses a
+# cached full snapshot when present. Dropped whenever a forecast is computed.
+_latest_cache = TTLCache(maxsize=10_000, ttl=30)
+_summary_cache = TTLCache(maxsize=10_000, ttl=30)
+
+_NOT_FOUND_DETAIL = "No forecast found. Compute one first."
+
+
+async def _get_latest(db: AsyncSession, user_id: uuid.UUID) -> ForecastRead:
+    cached = _latest_cache.get(user_id)
+    if cached is not None:
+        return cached
+    snapshot = await forecast_service.get_latest_forecast(db, user_id)
+    if not snapshot:
+        raise HTTPException(status_code=404, detail=_NOT_FOUND_DETAIL)
+    latest = ForecastRead.model_validate(snapshot)
+    _latest_cache.set(user_id, latest)
+    return latest
+
 
 @router.post("/compute", response_model=ForecastRead, status_code=201)
 async def compute_forecast(
@@ -30,7 +54,12 @@ async def compute_forecast(
     with volatility bands, confidence, assumptions, and urgency score.
     """
     snapshot = await forecast_service.compute_forecast(db, current_user.id)
+    # Commit before answering (get_db's commit runs after the response is
+    # sent) and before dropping the caches, so a GET right after the 201
+    # cannot re-cache the previous snapshot.
     await db.commit()
+    _latest_cache.invalidate(current_user.id)
+    _summary_cache.invalidate(current_user.id)
     return snapshot
 
 
@@ -40,10 +69,7 @@ async def get_latest_forecast(
     current_user: User = Depends(get_current_user),
 ):
     """Get the most recent forecast snapshot."""
-    snapshot = await forecast_service.get_latest_forecast(db, current_user.id)
-    if not snapshot:
-        raise HTTPException(status_code=404, detail="No forecast found. Compute one first.")
-    return snapshot
+    return await _get_latest(db, current_user.id)
 
 
 @router.get("/summary", response_model=ForecastSummaryRead)
@@ -52,10 +78,15 @@ async def get_forecast_summary(
     current_user: User = Depends(get_current_user),
 ):
     """Get a lightweight forecast summary for the dashboard."""
-    snapshot = await forecast_service.get_latest_forecast(db, current_user.id)
-    if not snapshot:
-        raise HTTPException(status_code=404, detail="No forecast found. Compute one first.")
-    return snapshot
+    summary = _summary_cache.get(current_user.id) or _latest_cache.get(current_user.id)
+    if summary is not None:
+        return summary
+    row = await forecast_service.get_latest_summary(db, current_user.id)
+    if row is None:
+        raise HTTPException(status_code=404, detail=_NOT_FOUND_DETAIL)
+    summary = ForecastSummaryRead.model_validate(row)
+    _summary_cache.set(current_user.id, summary)
+    return summary
 
 
 @router.get("/history", response_model=list[ForecastSummaryRead])
@@ -71,3 +102,22 @@ async def get_forecast_history(
         db, current_user.id, limit=limit
     )
     return snapshots
+
+
+@router.get("/history.ndjson")
+async def stream_forecast_history(
+    limit: int = 10,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Stream recent forecast history as NDJSON, one summary per line."""
+    if limit < 1 or limit > 50:
+        raise HTTPException(status_code=400, detail="Limit must be between 1 and 50")
+
+    async def lines():
+        async for snapshot in forecast_service.stream_forecast_history(
+            db, current_user.id, limit=limit
+        ):
+            yield ForecastSummaryRead.model_validate(snapshot).model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
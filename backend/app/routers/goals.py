@@ -7,7 +7,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
 from app.dependencies import get_db
-from app.models.goal import GoalPriority, GoalType
 from app.models.user import User
 from app.schemas.goal import ConstraintCreate, ConstraintRead, GoalCreate, GoalRead
 from app.services import goal_service
@@ -15,26 +14,6 @@ from app.services import goal_service
 router = APIRouter(prefix="/goals", tags=["goals"])
 
 
-def _parse_goal_type(value: str) -> GoalType:
-    try:
-        return GoalType(value)
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid goal_type: {value}",
-        )
-
-
-def _parse_priority(value: str) -> GoalPriority:
-    try:
-        return GoalPriority(value)
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid priority: {value}",
-        )
-
-
 @router.post("", status_code=201, response_model=GoalRead)
 async def create_goal(
     body: GoalCreate,
@@ -43,17 +22,14 @@ async def create_goal(
     current_user: User = Depends(get_current_user),
 ):
     ip = request.client.host if request.client else None
-    goal_type = _parse_goal_type(body.goal_type)
-    priority = _parse_priority(body.priority)
-
     goal = await goal_service.create_goal(
         db,
         user_id=current_user.id,
-        goal_type=goal_type,
+        goal_type=body.goal_type,
         title=body.title,
         description=body.description,
         target_amount=body.target_amount,
-        priority=priority,
+        priority=body.priority,
         target_date=body.target_date,
         ip_address=ip,
     )
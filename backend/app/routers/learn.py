@@ -6,9 +6,12 @@ Phase 7: Learn + Practice
 import uuid as uuid_mod
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
+from app.core.etag import conditional_json, etag_matches, not_modified
 from app.dependencies import get_db
 from app.models.user import User
 from app.schemas.learn import (
@@ -21,16 +24,30 @@ from app.services import learn_service
 
 router = APIRouter(prefix="/learn", tags=["learn"])
 
+_lesson_list_adapter = TypeAdapter(list[LessonRead])
+
 
 @router.get("/lessons", response_model=list[LessonRead])
 async def list_lessons(
+    request: Request,
     category: str | None = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List all active lessons, optionally filtered by category."""
+    """List all active lessons, optionally filtered by category.
+
+    Lessons only change when seeded, so a client revalidating the last ETag
+    served for this category gets a 304 without querying the DB.
+    """
+    known_etag = learn_service.lesson_list_etags.get(category)
+    if etag_matches(request, known_etag):
+        return not_modified(known_etag)
+
     lessons = await learn_service.get_lessons(db, category=category)
-    return [LessonRead.model_validate(l) for l in lessons]
+    payload = _lesson_list_adapter.dump_python(lessons, mode="json")
+    response = conditional_json(request, payload)
+    learn_service.lesson_list_etags.set(category, response.headers["ETag"])
+    return response
 
 
 @router.get("/lessons/{lesson_id}", response_model=LessonRead)
@@ -57,8 +74,23 @@ async def list_progress(
     current_user: User = Depends(get_current_user),
 ):
     """Get all lesson progress for the current user."""
-    progress = await learn_service.get_user_progress(db, user_id=current_user.id)
-    return [LessonProgressRead.model_validate(p) for p in progress]
+    return await learn_service.get_user_progress(db, user_id=current_user.id)
+
+
+@router.get("/progress.ndjson")
+async def stream_progress(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Stream all lesson progress for the current user as NDJSON."""
+
+    async def lines():
+        async for progress in learn_service.stream_user_progress(
+            db, user_id=current_user.id
+        ):
+            yield LessonProgressRead.model_validate(progress).model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.get("/progress/{lesson_id}", response_model=LessonProgressRead | None)
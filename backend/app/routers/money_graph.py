@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
 from app.dependencies import get_db
+from app.derived_views.cache import summary_cache
 from app.derived_views.money_graph import money_graph_summary_view
 from app.models.user import User
 
@@ -16,4 +17,8 @@ async def summary(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return await money_graph_summary_view(db, current_user.id)
+    view = summary_cache.get(current_user.id)
+    if view is None:
+        view = await money_graph_summary_view(db, current_user.id)
+        summary_cache.set(current_user.id, view)
+    return view
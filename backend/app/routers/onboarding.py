@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
+from app.core.etag import conditional_json
 from app.dependencies import get_db
 from app.models.onboarding import OnboardingStep
 from app.models.user import User
@@ -12,14 +13,21 @@ from app.services import onboarding_service
 
 router = APIRouter(prefix="/onboarding", tags=["onboarding"])
 
+_STEP_MAP: dict[str, OnboardingStep] = {s.value: s for s in OnboardingStep}
+_STEP_ERR_DETAIL = f"Invalid step. Must be one of: {list(_STEP_MAP)}"
+
 
 @router.get("/state", response_model=OnboardingStateRead)
 async def get_state(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    """Get onboarding state. Sends an ETag; a matching If-None-Match gets 304."""
     state = await onboarding_service.get_state(db, current_user.id)
-    return state
+    return conditional_json(
+        request, OnboardingStateRead.model_validate(state).model_dump(mode="json")
+    )
 
 
 @router.post("/advance")
@@ -32,12 +40,11 @@ async def advance(
     """Advance onboarding by completing the given step."""
     ip = request.client.host if request.client else None
 
-    try:
-        onboarding_step = OnboardingStep(step)
-    except ValueError:
+    onboarding_step = _STEP_MAP.get(step)
+    if onboarding_step is None:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid step: {step}. Must be one of: {[s.value for s in OnboardingStep]}",
+            detail=_STEP_ERR_DETAIL,
         )
 
     try:
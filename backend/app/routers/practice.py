@@ -37,8 +37,7 @@ async def list_scenarios(
     current_user: User = Depends(get_current_user),
 ):
     """List all active scenarios, optionally filtered by category."""
-    scenarios = await practice_service.get_scenarios(db, category=category)
-    return [ScenarioRead.model_validate(s) for s in scenarios]
+    return await practice_service.get_scenarios(db, category=category)
 
 
 @router.get("/scenarios/{scenario_id}", response_model=ScenarioRead)
@@ -72,10 +71,9 @@ async def list_runs(
             sid = uuid_mod.UUID(scenario_id)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid scenario_id")
-    runs = await practice_service.get_user_runs(
+    return await practice_service.get_user_runs(
         db, user_id=current_user.id, scenario_id=sid
     )
-    return [ScenarioRunRead.model_validate(r) for r in runs]
 
 
 @router.get("/runs/{run_id}", response_model=ScenarioRunRead)
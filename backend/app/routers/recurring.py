@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
 from app.dependencies import get_db
+from app.derived_views.cache import recurring_cache
 from app.derived_views.money_graph import recurring_patterns_view
 from app.models.user import User
 from app.services import recurring_service
@@ -17,7 +18,11 @@ async def list_patterns(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return await recurring_patterns_view(db, current_user.id)
+    view = recurring_cache.get(current_user.id)
+    if view is None:
+        view = await recurring_patterns_view(db, current_user.id)
+        recurring_cache.set(current_user.id, view)
+    return view
 
 
 @router.post("/detect")
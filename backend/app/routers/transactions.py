@@ -1,49 +1,61 @@
 """Transaction routes: list, create manual, recategorize. Returns derived views."""
 
-import uuid as uuid_mod
+import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
 from app.dependencies import get_db
-from app.derived_views.money_graph import transaction_list_view
-from app.models.transaction import TransactionType
+from app.derived_views.cache import transaction_pages
+from app.derived_views.money_graph import (
+    decode_transaction_cursor,
+    encode_transaction_cursor,
+    get_transaction_view,
+    transaction_list_view,
+    transaction_single_view,
+)
 from app.models.user import User
 from app.schemas.transaction import TransactionCreate, TransactionRecategorize
-from app.services import category_service, transaction_service
+from app.services import transaction_service
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
 
-def _parse_transaction_type(value: str) -> TransactionType:
-    try:
-        return TransactionType(value)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid transaction_type: {value}",
-        )
-
-
 @router.get("")
 async def list_transactions(
-    account_id: str | None = None,
-    limit: int = 100,
-    offset: int = 0,
+    response: Response,
+    account_id: uuid.UUID | None = None,
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    aid = None
-    if account_id:
+    """List transactions, newest first.
+
+    A full page carries an X-Next-Cursor header; pass it back as `cursor` to
+    fetch the next page without an OFFSET scan.
+    """
+    seek = None
+    if cursor:
         try:
-            aid = uuid_mod.UUID(account_id)
+            seek = decode_transaction_cursor(cursor)
         except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid account_id")
-
-    return await transaction_list_view(
-        db, current_user.id, account_id=aid, limit=limit, offset=offset
-    )
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    key = (account_id, limit, offset, cursor)
+    pages = transaction_pages(current_user.id)
+    page = pages.get(key)
+    if page is None:
+        page = await transaction_list_view(
+            db, current_user.id,
+            account_id=account_id, limit=limit, offset=offset, cursor=seek,
+        )
+        pages.set(key, page)
+    if page and len(page) == limit:
+        response.headers["X-Next-Cursor"] = encode_transaction_cursor(page[-1])
+    return page
 
 
 @router.post("", status_code=201)
@@ -54,10 +66,6 @@ async def create_transaction(
     current_user: User = Depends(get_current_user),
 ):
     ip = request.client.host if request.client else None
-    txn_type = _parse_transaction_type(body.transaction_type)
-
-    # Seed categories if needed
-    await category_service.seed_system_categories(db)
 
     txn = await transaction_service.ingest_transaction(
         db,
@@ -65,7 +73,7 @@ async def create_transaction(
         user_id=current_user.id,
         raw_description=body.raw_description,
         amount=body.amount,
-        transaction_type=txn_type,
+        transaction_type=body.transaction_type,
         transaction_date=body.transaction_date,
         posted_date=body.posted_date,
         is_pending=body.is_pending,
@@ -74,34 +82,25 @@ async def create_transaction(
         ip_address=ip,
     )
 
-    # Return as derived view
-    views = await transaction_list_view(db, current_user.id, limit=1)
-    if views:
-        return views[0]
-    return {"id": str(txn.id)}
+    # Return as derived view, serialized from the row just written
+    return await transaction_single_view(db, txn)
 
 
 @router.patch("/{transaction_id}/category")
 async def recategorize(
-    transaction_id: str,
+    transaction_id: uuid.UUID,
     body: TransactionRecategorize,
     request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     ip = request.client.host if request.client else None
-    try:
-        tid = uuid_mod.UUID(transaction_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid transaction_id")
-
     await transaction_service.recategorize(
         db,
-        transaction_id=tid,
+        transaction_id=transaction_id,
         category_id=body.category_id,
         user_id=current_user.id,
         ip_address=ip,
     )
 
-    views = await transaction_list_view(db, current_user.id, limit=200)
-    return [v for v in views if v["id"] == transaction_id][0]
+    return await get_transaction_view(db, current_user.id, transaction_id)
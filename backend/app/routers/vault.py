@@ -5,20 +5,40 @@ Phase 8: Vault — receipts & documents lite.
 Files are served only through authenticated endpoints (no public access).
 """
 
-import uuid as uuid_mod
+import uuid
+from pathlib import Path
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
-from fastapi.responses import Response
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
-from app.dependencies import get_db
+from app.core.etag import conditional_json, etag_matches
+from app.dependencies import get_db, release_connection
 from app.models.user import User
 from app.schemas.vault import LinkTransactionRequest, VaultItemRead
 from app.services import vault_service
 
 router = APIRouter(prefix="/vault", tags=["vault"])
 
+_vault_list_adapter = TypeAdapter(list[VaultItemRead])
+
+# Downloads are content-addressed by ETag and never change
+DOWNLOAD_CACHE_CONTROL = "private, max-age=3600, immutable"
+
+# Upload read size: caps per-request memory regardless of file size
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Largest request body accepted on /vault: the file limit plus room for the
+# multipart envelope and form fields. Enforced from Content-Length in main.py.
+MAX_UPLOAD_BODY = vault_service.MAX_FILE_SIZE + (64 << 10)
+
+
+async def _iter_upload(file: UploadFile):
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
 
 @router.post("", response_model=VaultItemRead, status_code=201)
 async def upload_file(
@@ -26,111 +46,112 @@ async def upload_file(
     file: UploadFile = File(...),
     item_type: str = Form("receipt"),
     description: str | None = Form(None),
-    transaction_id: str | None = Form(None),
+    transaction_id: uuid.UUID | None = Form(None),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Upload a receipt or document to the vault."""
     ip = request.client.host if request.client else None
 
-    data = await file.read()
     content_type = file.content_type or "application/octet-stream"
     filename = file.filename or "unnamed"
 
-    txn_id = None
-    if transaction_id:
-        try:
-            txn_id = uuid_mod.UUID(transaction_id)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid transaction_id")
-
+    # Don't hold a pooled connection while the file body streams to storage
+    await release_connection(db)
     try:
         item = await vault_service.upload(
             db,
             user_id=current_user.id,
             filename=filename,
             content_type=content_type,
-            data=data,
+            data=_iter_upload(file),
             item_type=item_type,
             description=description,
-            transaction_id=txn_id,
+            transaction_id=transaction_id,
             ip_address=ip,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    return VaultItemRead.model_validate(item)
+    return item
 
 
 @router.get("", response_model=list[VaultItemRead])
 async def list_items(
     item_type: str | None = None,
-    transaction_id: str | None = None,
+    transaction_id: uuid.UUID | None = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List vault items for the current user."""
-    txn_id = None
-    if transaction_id:
-        try:
-            txn_id = uuid_mod.UUID(transaction_id)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid transaction_id")
+    """List vault items for the current user.
 
+    Serialized in one pydantic-core pass straight to JSON bytes.
+    """
     items = await vault_service.list_items(
-        db, user_id=current_user.id, item_type=item_type, transaction_id=txn_id
+        db, user_id=current_user.id, item_type=item_type, transaction_id=transaction_id
     )
-    return [VaultItemRead.model_validate(i) for i in items]
+    return Response(_vault_list_adapter.dump_json(items), media_type="application/json")
 
 
 @router.get("/{item_id}", response_model=VaultItemRead)
 async def get_item(
-    item_id: str,
+    item_id: uuid.UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get vault item metadata."""
-    try:
-        iid = uuid_mod.UUID(item_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid item_id")
+    """Get vault item metadata.
+
+    Metadata can change (transaction link), so it is revalidated by ETag.
+    """
     try:
-        item = await vault_service.get_item(db, item_id=iid, user_id=current_user.id)
+        item = await vault_service.get_item(db, item_id=item_id, user_id=current_user.id)
     except ValueError:
         raise HTTPException(status_code=404, detail="Vault item not found")
-    return VaultItemRead.model_validate(item)
+    return conditional_json(request, VaultItemRead.model_validate(item).model_dump(mode="json"))
 
 
 @router.get("/{item_id}/download")
 async def download_file(
-    item_id: str,
+    item_id: uuid.UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Download vault file (authenticated access only)."""
-    try:
-        iid = uuid_mod.UUID(item_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid item_id")
+    """Download vault file (authenticated access only).
+
+    File bytes never change after upload, so the response is cacheable by
+    the client as immutable and a matching If-None-Match gets a bodiless 304.
+    """
     try:
-        item, data = await vault_service.get_file_data(
-            db, item_id=iid, user_id=current_user.id
+        item, source = await vault_service.open_file(
+            db, item_id=item_id, user_id=current_user.id
         )
     except ValueError:
         raise HTTPException(status_code=404, detail="Vault item not found")
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="File not found in storage")
 
-    return Response(
-        content=data,
-        media_type=item.content_type,
-        headers={"Content-Disposition": f'attachment; filename="{item.filename}"'},
-    )
+    # Metadata is all the DB work; free the connection before sending the body
+    await release_connection(db)
+    headers = {"Cache-Control": DOWNLOAD_CACHE_CONTROL}
+    if item.content_sha256:
+        headers["ETag"] = f'"{item.content_sha256}"'
+        if etag_matches(request, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+    if isinstance(source, Path):
+        return FileResponse(
+            source, media_type=item.content_type, filename=item.filename, headers=headers
+        )
+    headers["Content-Disposition"] = f'attachment; filename="{item.filename}"'
+    # Size recorded at upload, so clients can show progress without a stat
+    headers["Content-Length"] = str(item.file_size)
+    return StreamingResponse(source, media_type=item.content_type, headers=headers)
 
 
 @router.post("/{item_id}/link-transaction", response_model=VaultItemRead)
 async def link_transaction(
-    item_id: str,
+    item_id: uuid.UUID,
     body: LinkTransactionRequest,
     request: Request,
     db: AsyncSession = Depends(get_db),
@@ -138,62 +159,46 @@ async def link_transaction(
 ):
     """Link a vault item to a transaction."""
     ip = request.client.host if request.client else None
-    try:
-        iid = uuid_mod.UUID(item_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid item_id")
-    try:
-        txn_id = uuid_mod.UUID(body.transaction_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid transaction_id")
     try:
         item = await vault_service.link_to_transaction(
-            db, item_id=iid, user_id=current_user.id,
-            transaction_id=txn_id, ip_address=ip,
+            db, item_id=item_id, user_id=current_user.id,
+            transaction_id=body.transaction_id, ip_address=ip,
         )
     except ValueError:
         raise HTTPException(status_code=404, detail="Vault item not found")
-    return VaultItemRead.model_validate(item)
+    return item
 
 
 @router.post("/{item_id}/unlink-transaction", response_model=VaultItemRead)
 async def unlink_transaction(
-    item_id: str,
+    item_id: uuid.UUID,
     request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Unlink a vault item from its transaction."""
     ip = request.client.host if request.client else None
-    try:
-        iid = uuid_mod.UUID(item_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid item_id")
     try:
         item = await vault_service.unlink_transaction(
-            db, item_id=iid, user_id=current_user.id, ip_address=ip,
+            db, item_id=item_id, user_id=current_user.id, ip_address=ip,
         )
     except ValueError:
         raise HTTPException(status_code=404, detail="Vault item not found")
-    return VaultItemRead.model_validate(item)
+    return item
 
 
 @router.delete("/{item_id}", status_code=204)
 async def delete_item(
-    item_id: str,
+    item_id: uuid.UUID,
     request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Delete a vault item (DB row + storage file)."""
     ip = request.client.host if request.client else None
-    try:
-        iid = uuid_mod.UUID(item_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid item_id")
     try:
         await vault_service.delete_item(
-            db, item_id=iid, user_id=current_user.id, ip_address=ip,
+            db, item_id=item_id, user_id=current_user.id, ip_address=ip,
         )
     except ValueError:
         raise HTTPException(status_code=404, detail="Vault item not found")
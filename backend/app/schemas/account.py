@@ -4,9 +4,12 @@ from decimal import Decimal
 
 from pydantic import BaseModel, Field
 
+from app.models.account import AccountType
+from app.schemas.base import ORMModel
+
 
 class AccountCreate(BaseModel):
-    account_type: str = Field(..., description="checking, savings, credit_card, loan, other")
+    account_type: AccountType
     institution_name: str = Field(..., max_length=255)
     account_name: str = Field(..., max_length=255)
     current_balance: Decimal = Field(default=Decimal("0.00"))
@@ -19,7 +22,7 @@ class AccountBalanceUpdate(BaseModel):
     available_balance: Decimal | None = None
 
 
-class AccountRead(BaseModel):
+class AccountRead(ORMModel):
     id: uuid.UUID
     account_type: str
     institution_name: str
@@ -31,5 +34,3 @@ class AccountRead(BaseModel):
     last_synced_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
-
-    model_config = {"from_attributes": True}
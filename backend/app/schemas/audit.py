@@ -1,10 +1,10 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel
+from app.schemas.base import ORMModel
 
 
-class AuditLogEventRead(BaseModel):
+class AuditLogEventRead(ORMModel):
     id: uuid.UUID
     user_id: uuid.UUID
     event_type: str
@@ -14,5 +14,3 @@ class AuditLogEventRead(BaseModel):
     detail: dict | None = None
     timestamp: datetime
     ip_address: str | None = None
-
-    model_config = {"from_attributes": True}
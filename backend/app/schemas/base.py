@@ -0,0 +1,10 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class ORMModel(BaseModel):
+    """Base for read schemas built from ORM objects.
+
+    Frozen: response models are never mutated after validation.
+    """
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -6,8 +6,10 @@ from decimal import Decimal
 
 from pydantic import BaseModel
 
+from app.schemas.base import ORMModel
 
-class BillRead(BaseModel):
+
+class BillRead(ORMModel):
     """A bill/subscription — derived view over RecurringPattern."""
     id: uuid.UUID
     label: str | None = None
@@ -22,8 +24,6 @@ class BillRead(BaseModel):
     merchant_id: uuid.UUID | None = None
     category_id: uuid.UUID | None = None
 
-    model_config = {"from_attributes": True}
-
 
 class CreateManualBillRequest(BaseModel):
     label: str
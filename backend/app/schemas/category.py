@@ -2,6 +2,8 @@ import uuid
 
 from pydantic import BaseModel, Field
 
+from app.schemas.base import ORMModel
+
 
 class CategoryCreate(BaseModel):
     name: str = Field(..., max_length=100)
@@ -9,11 +11,9 @@ class CategoryCreate(BaseModel):
     icon: str | None = None
 
 
-class CategoryRead(BaseModel):
+class CategoryRead(ORMModel):
     id: uuid.UUID
     name: str
     parent_id: uuid.UUID | None = None
     is_system: bool
     icon: str | None = None
-
-    model_config = {"from_attributes": True}
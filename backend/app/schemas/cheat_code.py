@@ -4,8 +4,10 @@ from decimal import Decimal
 
 from pydantic import BaseModel
 
+from app.schemas.base import ORMModel
 
-class CheatCodeRead(BaseModel):
+
+class CheatCodeRead(ORMModel):
     id: uuid.UUID
     code: str
     title: str
@@ -17,10 +19,8 @@ class CheatCodeRead(BaseModel):
     potential_savings_min: Decimal | None = None
     potential_savings_max: Decimal | None = None
 
-    model_config = {"from_attributes": True}
-
 
-class RecommendationRead(BaseModel):
+class RecommendationRead(ORMModel):
     id: uuid.UUID
     cheat_code: CheatCodeRead
     rank: int
@@ -28,20 +28,16 @@ class RecommendationRead(BaseModel):
     confidence: str
     is_quick_win: bool
 
-    model_config = {"from_attributes": True}
-
 
-class StepRunRead(BaseModel):
+class StepRunRead(ORMModel):
     step_number: int
     status: str
     started_at: datetime | None = None
     completed_at: datetime | None = None
     notes: str | None = None
 
-    model_config = {"from_attributes": True}
 
-
-class RunRead(BaseModel):
+class RunRead(ORMModel):
     id: uuid.UUID
     cheat_code: CheatCodeRead
     status: str
@@ -51,8 +47,6 @@ class RunRead(BaseModel):
     completed_steps: int
     steps: list[StepRunRead] = []
 
-    model_config = {"from_attributes": True}
-
 
 class StartRunRequest(BaseModel):
     recommendation_id: uuid.UUID
@@ -74,7 +68,7 @@ class ReportOutcomeRequest(BaseModel):
     user_satisfaction: int | None = None
 
 
-class OutcomeRead(BaseModel):
+class OutcomeRead(ORMModel):
     id: uuid.UUID
     run_id: uuid.UUID
     outcome_type: str
@@ -85,5 +79,3 @@ class OutcomeRead(BaseModel):
     verification_status: str
     notes: str | None = None
     user_satisfaction: int | None = None
-
-    model_config = {"from_attributes": True}
@@ -1,10 +1,15 @@
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.schemas.base import ORMModel
+
+CoachMode = Literal["explain", "execute", "plan", "review", "recap"]
+
 
 class CoachRequest(BaseModel):
-    mode: str = Field(..., description="explain, execute, plan, review, or recap")
+    mode: CoachMode = Field(..., description="explain, execute, plan, review, or recap")
     context_type: str | None = Field(
         None, description="Type of entity being discussed (required for explain/execute)"
     )
@@ -24,14 +29,12 @@ class CoachResponse(BaseModel):
     wins: list[dict] | None = None   # Phase 6: review mode returns wins
 
 
-class CoachMemoryRead(BaseModel):
+class CoachMemoryRead(ORMModel):
     id: UUID
     user_id: UUID
     tone: str
     aggressiveness: str
 
-    model_config = {"from_attributes": True}
-
 
 class CoachMemoryUpdate(BaseModel):
     tone: str | None = Field(
@@ -3,25 +3,26 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+from app.models.consent import ConsentType
+from app.schemas.base import ORMModel
+
 
 class ConsentGrant(BaseModel):
-    consent_type: str = Field(..., description="One of: data_access, ai_memory, terms_of_service")
+    consent_type: ConsentType = Field(..., description="One of: data_access, ai_memory, terms_of_service")
 
 
 class ConsentRevoke(BaseModel):
-    consent_type: str = Field(..., description="One of: data_access, ai_memory, terms_of_service")
+    consent_type: ConsentType = Field(..., description="One of: data_access, ai_memory, terms_of_service")
 
 
-class ConsentStatus(BaseModel):
+class ConsentStatus(ORMModel):
     consent_type: str
     granted: bool
     granted_at: datetime | None = None
     revoked_at: datetime | None = None
 
-    model_config = {"from_attributes": True}
-
 
-class ConsentRecordRead(BaseModel):
+class ConsentRecordRead(ORMModel):
     id: uuid.UUID
     user_id: uuid.UUID
     consent_type: str
@@ -30,5 +31,3 @@ class ConsentRecordRead(BaseModel):
     revoked_at: datetime | None = None
     ip_address: str | None = None
     user_agent: str | None = None
-
-    model_config = {"from_attributes": True}
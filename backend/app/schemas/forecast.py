@@ -6,6 +6,8 @@ from decimal import Decimal
 
 from pydantic import BaseModel
 
+from app.schemas.base import ORMModel
+
 
 class DailyBalanceRead(BaseModel):
     day: int
@@ -15,7 +17,7 @@ class DailyBalanceRead(BaseModel):
     high: Decimal
 
 
-class ForecastRead(BaseModel):
+class ForecastRead(ORMModel):
     id: uuid.UUID
     safe_to_spend_today: Decimal
     safe_to_spend_week: Decimal
@@ -30,10 +32,8 @@ class ForecastRead(BaseModel):
     urgency_factors: dict
     computed_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
-class ForecastSummaryRead(BaseModel):
+class ForecastSummaryRead(ORMModel):
     """Lightweight forecast summary for dashboard."""
     safe_to_spend_today: Decimal
     safe_to_spend_week: Decimal
@@ -41,5 +41,3 @@ class ForecastSummaryRead(BaseModel):
     confidence: str
     urgency_score: int
     computed_at: datetime
-
-    model_config = {"from_attributes": True}
@@ -4,17 +4,20 @@ from decimal import Decimal
 
 from pydantic import BaseModel, Field
 
+from app.models.goal import GoalPriority, GoalType
+from app.schemas.base import ORMModel
+
 
 class GoalCreate(BaseModel):
-    goal_type: str
+    goal_type: GoalType
     title: str = Field(..., max_length=255)
     description: str | None = None
     target_amount: Decimal | None = None
-    priority: str = "medium"
+    priority: GoalPriority = GoalPriority.medium
     target_date: datetime | None = None
 
 
-class GoalRead(BaseModel):
+class GoalRead(ORMModel):
     id: uuid.UUID
     goal_type: str
     title: str
@@ -25,8 +28,6 @@ class GoalRead(BaseModel):
     target_date: datetime | None = None
     is_active: bool
 
-    model_config = {"from_attributes": True}
-
 
 class ConstraintCreate(BaseModel):
     constraint_type: str = Field(..., max_length=100)
@@ -35,11 +36,9 @@ class ConstraintCreate(BaseModel):
     notes: str | None = None
 
 
-class ConstraintRead(BaseModel):
+class ConstraintRead(ORMModel):
     id: uuid.UUID
     constraint_type: str
     label: str
     amount: Decimal | None = None
     notes: str | None = None
-
-    model_config = {"from_attributes": True}
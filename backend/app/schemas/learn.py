@@ -3,8 +3,10 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from app.schemas.base import ORMModel
 
-class LessonRead(BaseModel):
+
+class LessonRead(ORMModel):
     id: UUID
     code: str
     title: str
@@ -15,10 +17,8 @@ class LessonRead(BaseModel):
     estimated_minutes: int
     display_order: int
 
-    model_config = {"from_attributes": True}
-
 
-class LessonProgressRead(BaseModel):
+class LessonProgressRead(ORMModel):
     id: UUID
     user_id: UUID
     lesson_id: UUID
@@ -27,8 +27,6 @@ class LessonProgressRead(BaseModel):
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
-    model_config = {"from_attributes": True}
-
 
 class StartLessonRequest(BaseModel):
     lesson_id: str
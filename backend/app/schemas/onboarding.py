@@ -1,15 +1,13 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel
+from app.schemas.base import ORMModel
 
 
-class OnboardingStateRead(BaseModel):
+class OnboardingStateRead(ORMModel):
     current_step: str
     consent_completed_at: datetime | None = None
     account_completed_at: datetime | None = None
     goals_completed_at: datetime | None = None
     top_3_completed_at: datetime | None = None
     first_win_completed_at: datetime | None = None
-
-    model_config = {"from_attributes": True}
@@ -3,8 +3,10 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from app.schemas.base import ORMModel
 
-class ScenarioRead(BaseModel):
+
+class ScenarioRead(ORMModel):
     id: UUID
     code: str
     title: str
@@ -17,10 +19,8 @@ class ScenarioRead(BaseModel):
     estimated_minutes: int
     display_order: int
 
-    model_config = {"from_attributes": True}
-
 
-class ScenarioRunRead(BaseModel):
+class ScenarioRunRead(ORMModel):
     id: UUID
     user_id: UUID
     scenario_id: UUID
@@ -33,8 +33,6 @@ class ScenarioRunRead(BaseModel):
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
-    model_config = {"from_attributes": True}
-
 
 class StartScenarioRequest(BaseModel):
     scenario_id: str
@@ -2,10 +2,10 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import BaseModel
+from app.schemas.base import ORMModel
 
 
-class RecurringPatternRead(BaseModel):
+class RecurringPatternRead(ORMModel):
     id: uuid.UUID
     merchant_name: str | None = None
     category_name: str | None = None
@@ -17,5 +17,3 @@ class RecurringPatternRead(BaseModel):
     next_expected_date: datetime | None = None
     last_observed_date: datetime | None = None
     is_active: bool
-
-    model_config = {"from_attributes": True}
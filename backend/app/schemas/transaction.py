@@ -4,12 +4,15 @@ from decimal import Decimal
 
 from pydantic import BaseModel, Field
 
+from app.models.transaction import TransactionType
+from app.schemas.base import ORMModel
+
 
 class TransactionCreate(BaseModel):
     account_id: uuid.UUID
     raw_description: str = Field(..., max_length=500)
     amount: Decimal = Field(..., gt=0)
-    transaction_type: str = Field(..., description="debit or credit")
+    transaction_type: TransactionType
     transaction_date: datetime
     posted_date: datetime | None = None
     is_pending: bool = False
@@ -21,7 +24,7 @@ class TransactionRecategorize(BaseModel):
     category_id: uuid.UUID
 
 
-class TransactionRead(BaseModel):
+class TransactionRead(ORMModel):
     id: uuid.UUID
     account_id: uuid.UUID
     merchant_name: str | None = None
@@ -35,5 +38,3 @@ class TransactionRead(BaseModel):
     is_pending: bool
     transaction_type: str
     created_at: datetime
-
-    model_config = {"from_attributes": True}
@@ -3,17 +3,17 @@ from datetime import datetime
 
 from pydantic import BaseModel, EmailStr, Field
 
+from app.schemas.base import ORMModel
+
 
 class UserCreate(BaseModel):
     email: str = Field(..., max_length=255)
     password: str = Field(..., min_length=8, max_length=128)
 
 
-class UserRead(BaseModel):
+class UserRead(ORMModel):
     id: uuid.UUID
     email: str
     status: str
     created_at: datetime
     updated_at: datetime
-
-    model_config = {"from_attributes": True}
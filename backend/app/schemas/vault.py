@@ -3,8 +3,10 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from app.schemas.base import ORMModel
 
-class VaultItemRead(BaseModel):
+
+class VaultItemRead(ORMModel):
     id: UUID
     user_id: UUID
     transaction_id: UUID | None = None
@@ -15,8 +17,6 @@ class VaultItemRead(BaseModel):
     description: str | None = None
     uploaded_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
 class LinkTransactionRequest(BaseModel):
-    transaction_id: str
+    transaction_id: UUID
@@ -4,16 +4,26 @@ All operations audit-logged.
 """
 
 import uuid
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.derived_views.cache import invalidate_user_views_on_commit
 from app.models.account import Account, AccountType
+from app.models.base import generate_uuid
 from app.models.connection import Connection
 from app.services import audit_service
 
+# A user's accounts, oldest first (get_accounts)
+_USER_ACCOUNTS = (
+    select(Account)
+    .where(Account.user_id == bindparam("user_id"))
+    .order_by(Account.created_at.asc())
+)
+
 
 async def create_manual_account(
     db: AsyncSession,
@@ -29,6 +39,7 @@ async def create_manual_account(
 ) -> Account:
     """Create a manual account (is_manual=True, no connection)."""
     acct = Account(
+        id=generate_uuid(),
         user_id=user_id,
         account_type=account_type,
         institution_name=institution_name,
@@ -40,7 +51,7 @@ async def create_manual_account(
         connection_id=None,
     )
     db.add(acct)
-    await db.flush()
+    invalidate_user_views_on_commit(db, user_id)
 
     await audit_service.log_event(
         db,
@@ -57,6 +68,9 @@ async def create_manual_account(
         ip_address=ip_address,
     )
 
+    # Entity and audit row go out in the same flush
+    await db.flush()
+
     return acct
 
 
@@ -70,16 +84,18 @@ async def update_manual_balance(
     ip_address: str | None = None,
 ) -> Account:
     """Update the balance on a manual account. Logged to audit."""
-    result = await db.execute(
-        select(Account).where(Account.id == account_id, Account.user_id == user_id)
-    )
-    acct = result.scalar_one()
+    acct = (
+        await db.scalars(
+            select(Account).where(Account.id == account_id, Account.user_id == user_id)
+        )
+    ).one()
 
     old_balance = acct.current_balance
     acct.current_balance = new_balance
     if available_balance is not None:
         acct.available_balance = available_balance
     await db.flush()
+    invalidate_user_views_on_commit(db, user_id)
 
     await audit_service.log_event(
         db,
@@ -112,7 +128,76 @@ async def create_linked_account(
     ip_address: str | None = None,
 ) -> Account:
     """Create a linked account from a provider connection."""
+    acct = await _add_linked_account(
+        db,
+        user_id=user_id,
+        connection_id=connection_id,
+        account_type=account_type,
+        institution_name=institution_name,
+        account_name=account_name,
+        current_balance=current_balance,
+        available_balance=available_balance,
+        currency=currency,
+        synced_at=datetime.now(timezone.utc),
+        ip_address=ip_address,
+    )
+    invalidate_user_views_on_commit(db, user_id)
+    await db.flush()
+
+    return acct
+
+
+async def bulk_create_linked_accounts(
+    db: AsyncSession,
+    *,
+    user_id: uuid.UUID,
+    connection_id: uuid.UUID,
+    accounts: list[dict],
+    ip_address: str | None = None,
+) -> list[Account]:
+    """Create several linked accounts from one provider sync.
+
+    Each entry in `accounts` takes the same keys as create_linked_account
+    (account_type, institution_name, account_name, and optionally
+    current_balance, available_balance, currency). All accounts share one
+    last_synced_at stamp, so every row carries plain bound values and the
+    flush sends a single executemany INSERT per table.
+    """
+    synced_at = datetime.now(timezone.utc)
+    created = [
+        await _add_linked_account(
+            db,
+            user_id=user_id,
+            connection_id=connection_id,
+            synced_at=synced_at,
+            ip_address=ip_address,
+            **spec,
+        )
+        for spec in accounts
+    ]
+    invalidate_user_views_on_commit(db, user_id)
+    await db.flush()
+
+    return created
+
+
+async def _add_linked_account(
+    db: AsyncSession,
+    *,
+    user_id: uuid.UUID,
+    connection_id: uuid.UUID,
+    account_type: AccountType,
+    institution_name: str,
+    account_name: str,
+    current_balance: Decimal = Decimal("0.00"),
+    available_balance: Decimal | None = None,
+    currency: str = "USD",
+    synced_at: datetime,
+    ip_address: str | None = None,
+) -> Account:
+    """Add a linked account and its audit event to the session, unflushed."""
     acct = Account(
+        id=generate_uuid(),
         user_id=user_id,
         connection_id=connection_id,
         account_type=account_type,
@@ -122,10 +207,9 @@ async def create_linked_account(
         available_balance=available_balance,
         currency=currency,
         is_manual=False,
-        last_synced_at=datetime.now(timezone.utc),
+        last_synced_at=synced_at,
     )
     db.add(acct)
-    await db.flush()
 
     await audit_service.log_event(
         db,
@@ -149,11 +233,7 @@ async def create_linked_account(
 async def get_accounts(
     db: AsyncSession,
     user_id: uuid.UUID,
-) -> list[Account]:
+) -> Sequence[Account]:
     """Get all accounts for a user."""
-    result = await db.execute(
-        select(Account)
-        .where(Account.user_id == user_id)
-        .order_by(Account.created_at.asc())
-    )
-    return list(result.scalars().all())
+    result = await db.scalars(_USER_ACCOUNTS, {"user_id": user_id})
+    return result.all()
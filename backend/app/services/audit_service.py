@@ -4,13 +4,24 @@ All writes are append-only. No update or delete methods are exposed.
 """
 
 import uuid
-from datetime import datetime
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.audit import AuditLogEvent
 
+# One entity's history, oldest first (reconstruct_why / stream_why)
+_ENTITY_HISTORY = (
+    select(AuditLogEvent)
+    .where(
+        AuditLogEvent.entity_type == bindparam("entity_type"),
+        AuditLogEvent.entity_id == bindparam("entity_id"),
+    )
+    .order_by(AuditLogEvent.timestamp.asc())
+)
+
 
 async def log_event(
     db: AsyncSession,
@@ -23,8 +34,17 @@ async def log_event(
     detail: dict | None = None,
     ip_address: str | None = None,
 ) -> AuditLogEvent:
-    """Create an append-only audit log event."""
+    """Create an append-only audit log event.
+
+    The event is only added to the session, not flushed: audit rows from one
+    request are written together in a single batched INSERT at the next
+    autoflush or commit instead of one round trip per event. id and timestamp
+    are assigned here so the returned event is complete and ordering follows
+    call order.
+    """
     event = AuditLogEvent(
+        id=uuid.uuid4(),
+        timestamp=datetime.now(timezone.utc),
         user_id=user_id,
         event_type=event_type,
         entity_type=entity_type,
@@ -34,7 +54,6 @@ async def log_event(
         ip_address=ip_address,
     )
     db.add(event)
-    await db.flush()
     return event
 
 
@@ -45,41 +64,64 @@ async def get_events_for_user(
     event_type: str | None = None,
     entity_type: str | None = None,
     limit: int = 100,
-    offset: int = 0,
-) -> list[AuditLogEvent]:
-    """Retrieve audit events for a user, with optional filters."""
+    after: tuple[datetime, uuid.UUID] | None = None,
+) -> Sequence[AuditLogEvent]:
+    """Retrieve audit events for a user, with optional filters.
+
+    Keyset-paginated on (timestamp, id): pass the last event's
+    event_cursor(...) as `after` to fetch the next page.
+    """
     stmt = (
         select(AuditLogEvent)
         .where(AuditLogEvent.user_id == user_id)
-        .order_by(AuditLogEvent.timestamp.asc())
+        .order_by(AuditLogEvent.timestamp.asc(), AuditLogEvent.id.asc())
     )
     if event_type is not None:
         stmt = stmt.where(AuditLogEvent.event_type == event_type)
     if entity_type is not None:
         stmt = stmt.where(AuditLogEvent.entity_type == entity_type)
-    stmt = stmt.offset(offset).limit(limit)
+    if after is not None:
+        stmt = stmt.where(tuple_(AuditLogEvent.timestamp, AuditLogEvent.id) > tuple_(*after))
+    stmt = stmt.limit(limit)
 
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return result.scalars().all()
+
+
+def event_cursor(event: AuditLogEvent) -> tuple[datetime, uuid.UUID]:
+    """Keyset position of `event`, for get_events_for_user(after=...)."""
+    return event.timestamp, event.id
 
 
 async def reconstruct_why(
     db: AsyncSession,
     entity_type: str,
     entity_id: uuid.UUID,
-) -> list[AuditLogEvent]:
+) -> Sequence[AuditLogEvent]:
     """Return the chain of audit events explaining 'why' for a given entity.
 
     Returns all events related to the specified entity, ordered chronologically.
     This allows reconstructing the full decision/action history.
     """
-    stmt = (
-        select(AuditLogEvent)
-        .where(
-            AuditLogEvent.entity_type == entity_type,
-            AuditLogEvent.entity_id == entity_id,
-        )
-        .order_by(AuditLogEvent.timestamp.asc())
+    result = await db.scalars(
+        _ENTITY_HISTORY, {"entity_type": entity_type, "entity_id": entity_id}
     )
-    result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return result.all()
+
+
+async def stream_why(
+    db: AsyncSession,
+    entity_type: str,
+    entity_id: uuid.UUID,
+) -> AsyncIterator[AuditLogEvent]:
+    """Yield the same chain as reconstruct_why from a server-side cursor.
+
+    Rows are fetched in batches of 500, so long histories are never held
+    in memory all at once.
+    """
+    result = await db.stream_scalars(
+        _ENTITY_HISTORY.execution_options(yield_per=500),
+        {"entity_type": entity_type, "entity_id": entity_id},
+    )
+    async for event in result:
+        yield event
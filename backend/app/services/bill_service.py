@@ -11,34 +11,92 @@ All actions audit-logged. No automation or negotiation.
 """
 
 import uuid
+from collections.abc import Sequence
 from datetime import datetime, timezone
-from decimal import Decimal
+from decimal import ROUND_HALF_EVEN, Decimal
 
-from sqlalchemy import select
+from sqlalchemy import Numeric, Row, bindparam, case, func, select, type_coerce, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.derived_views.cache import invalidate_user_views_on_commit
+from app.models.base import generate_uuid
 from app.models.recurring import Confidence, Frequency, RecurringPattern
 from app.services import audit_service
 
+# Active bills per user, largest first (get_bills)
+_ACTIVE_BILLS = (
+    select(RecurringPattern)
+    .where(
+        RecurringPattern.user_id == bindparam("user_id"),
+        RecurringPattern.is_active == True,  # noqa: E712
+    )
+    .order_by(RecurringPattern.estimated_amount.desc())
+)
+# Same listing as plain column rows, for read-only API responses
+_ACTIVE_BILL_ROWS = (
+    select(
+        RecurringPattern.id,
+        RecurringPattern.label,
+        RecurringPattern.estimated_amount,
+        RecurringPattern.frequency,
+        RecurringPattern.confidence,
+        RecurringPattern.next_expected_date,
+        RecurringPattern.last_observed_date,
+        RecurringPattern.is_essential,
+        RecurringPattern.is_manual,
+        RecurringPattern.is_active,
+        RecurringPattern.merchant_id,
+        RecurringPattern.category_id,
+    )
+    .where(
+        RecurringPattern.user_id == bindparam("user_id"),
+        RecurringPattern.is_active == True,  # noqa: E712
+    )
+    .order_by(RecurringPattern.estimated_amount.desc())
+)
+_BILL_BY_ID = select(RecurringPattern).where(
+    RecurringPattern.id == bindparam("bill_id"),
+    RecurringPattern.user_id == bindparam("user_id"),
+)
+
+_FREQ_BY_VALUE: dict[str, Frequency] = {f.value: f for f in Frequency}
+_VALID_FREQUENCIES = [f.value for f in Frequency]
+
+
+def _parse_frequency(frequency: str) -> Frequency:
+    """Look up a Frequency by value. Raises ValueError listing valid values."""
+    freq = _FREQ_BY_VALUE.get(frequency)
+    if freq is None:
+        raise ValueError(
+            f"Invalid frequency '{frequency}'. Must be one of: {_VALID_FREQUENCIES}"
+        )
+    return freq
+
 
 async def get_bills(
     db: AsyncSession,
     user_id: uuid.UUID,
-) -> list[RecurringPattern]:
+) -> Sequence[RecurringPattern]:
     """Get all active bills/subscriptions for a user.
 
     Bills are a derived view over RecurringPattern.
     Confidence is always visible on every returned bill.
     """
-    result = await db.execute(
-        select(RecurringPattern)
-        .where(
-            RecurringPattern.user_id == user_id,
-            RecurringPattern.is_active == True,  # noqa: E712
-        )
-        .order_by(RecurringPattern.estimated_amount.desc())
-    )
-    return list(result.scalars().all())
+    result = await db.scalars(_ACTIVE_BILLS, {"user_id": user_id})
+    return result.all()
+
+
+async def get_bill_rows(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+) -> Sequence[Row]:
+    """Same bills as get_bills, as column rows rather than ORM objects.
+
+    For read-only listings that are serialized straight to the response;
+    skips identity-map and instrumentation overhead per bill.
+    """
+    result = await db.execute(_ACTIVE_BILL_ROWS, {"user_id": user_id})
+    return result.all()
 
 
 async def get_bill(
@@ -47,13 +105,8 @@ async def get_bill(
     user_id: uuid.UUID,
 ) -> RecurringPattern:
     """Get a single bill by ID. Raises NoResultFound if not found."""
-    result = await db.execute(
-        select(RecurringPattern).where(
-            RecurringPattern.id == bill_id,
-            RecurringPattern.user_id == user_id,
-        )
-    )
-    return result.scalar_one()
+    result = await db.scalars(_BILL_BY_ID, {"bill_id": bill_id, "user_id": user_id})
+    return result.one()
 
 
 async def create_manual_bill(
@@ -75,17 +128,13 @@ async def create_manual_bill(
     - confidence=high (user explicitly stated it)
     - No merchant_id (user-entered)
     """
-    # Validate frequency
-    try:
-        freq = Frequency(frequency)
-    except ValueError:
-        valid = [f.value for f in Frequency]
-        raise ValueError(f"Invalid frequency '{frequency}'. Must be one of: {valid}")
+    freq = _parse_frequency(frequency)
 
     if estimated_amount <= 0:
         raise ValueError("estimated_amount must be positive")
 
     bill = RecurringPattern(
+        id=generate_uuid(),
         user_id=user_id,
         merchant_id=None,  # Manual bills have no merchant
         category_id=category_id,
@@ -101,7 +150,7 @@ async def create_manual_bill(
         label=label,
     )
     db.add(bill)
-    await db.flush()
+    invalidate_user_views_on_commit(db, user_id)
 
     await audit_service.log_event(
         db,
@@ -120,6 +169,8 @@ async def create_manual_bill(
         ip_address=ip_address,
     )
 
+    await db.flush()
+
     return bill
 
 
@@ -134,18 +185,26 @@ async def toggle_essential(
     """Toggle the essential flag on a bill.
 
     Essential bills are suppressed from cancellation recommendations.
+    The flag is flipped with a single UPDATE ... RETURNING; only when no row
+    changed (bill missing or already at the requested value) is the bill
+    loaded, which raises NoResultFound if it does not exist.
     """
-    result = await db.execute(
-        select(RecurringPattern).where(
+    bill = await db.scalar(
+        update(RecurringPattern)
+        .where(
             RecurringPattern.id == bill_id,
             RecurringPattern.user_id == user_id,
+            RecurringPattern.is_essential != is_essential,
         )
+        .values(is_essential=is_essential)
+        .returning(RecurringPattern)
     )
-    bill = result.scalar_one()
-
-    old_value = bill.is_essential
-    bill.is_essential = is_essential
-    await db.flush()
+    if bill is not None:
+        old_value = not is_essential
+        invalidate_user_views_on_commit(db, user_id)
+    else:
+        bill = await get_bill(db, bill_id, user_id)
+        old_value = bill.is_essential
 
     await audit_service.log_event(
         db,
@@ -177,57 +236,59 @@ async def update_bill(
     is_essential: bool | None = None,
     ip_address: str | None = None,
 ) -> RecurringPattern:
-    """Update a manual bill's fields. Only manual bills can be fully edited."""
-    result = await db.execute(
-        select(RecurringPattern).where(
-            RecurringPattern.id == bill_id,
-            RecurringPattern.user_id == user_id,
-        )
-    )
-    bill = result.scalar_one()
+    """Update a manual bill's fields. Only manual bills can be fully edited.
+
+    Fields equal to their current value are ignored; if nothing changes the
+    bill is returned as-is with no write and no audit event.
+    """
+    bill = await get_bill(db, bill_id, user_id)
 
+    updates = {}
     changes = {}
 
-    if label is not None:
+    if label is not None and label != bill.label:
+        updates["label"] = label
         changes["label"] = {"old": bill.label, "new": label}
-        bill.label = label
 
     if estimated_amount is not None:
         if estimated_amount <= 0:
             raise ValueError("estimated_amount must be positive")
-        changes["estimated_amount"] = {"old": str(bill.estimated_amount), "new": str(estimated_amount)}
-        bill.estimated_amount = estimated_amount
+        if estimated_amount != bill.estimated_amount:
+            updates["estimated_amount"] = estimated_amount
+            changes["estimated_amount"] = {"old": str(bill.estimated_amount), "new": str(estimated_amount)}
 
     if frequency is not None:
-        try:
-            freq = Frequency(frequency)
-        except ValueError:
-            valid = [f.value for f in Frequency]
-            raise ValueError(f"Invalid frequency '{frequency}'. Must be one of: {valid}")
-        changes["frequency"] = {"old": bill.frequency.value, "new": frequency}
-        bill.frequency = freq
-
-    if next_expected_date is not None:
+        freq = _parse_frequency(frequency)
+        if freq != bill.frequency:
+            updates["frequency"] = freq
+            changes["frequency"] = {"old": bill.frequency.value, "new": frequency}
+
+    if next_expected_date is not None and next_expected_date != bill.next_expected_date:
+        updates["next_expected_date"] = next_expected_date
         changes["next_expected_date"] = {"new": str(next_expected_date)}
-        bill.next_expected_date = next_expected_date
 
-    if is_essential is not None:
+    if is_essential is not None and is_essential != bill.is_essential:
+        updates["is_essential"] = is_essential
         changes["is_essential"] = {"old": bill.is_essential, "new": is_essential}
-        bill.is_essential = is_essential
 
+    if not updates:
+        return bill
+
+    for field, value in updates.items():
+        setattr(bill, field, value)
     await db.flush()
+    invalidate_user_views_on_commit(db, user_id)
 
-    if changes:
-        await audit_service.log_event(
-            db,
-            user_id=user_id,
-            event_type="bill.updated",
-            entity_type="RecurringPattern",
-            entity_id=bill.id,
-            action="update_bill",
-            detail={"changes": changes},
-            ip_address=ip_address,
-        )
+    await audit_service.log_event(
+        db,
+        user_id=user_id,
+        event_type="bill.updated",
+        entity_type="RecurringPattern",
+        entity_id=bill.id,
+        action="update_bill",
+        detail={"changes": changes},
+        ip_address=ip_address,
+    )
 
     return bill
 
@@ -239,17 +300,21 @@ async def deactivate_bill(
     user_id: uuid.UUID,
     ip_address: str | None = None,
 ) -> RecurringPattern:
-    """Deactivate a bill (soft-delete). Removes from forecast calculations."""
-    result = await db.execute(
-        select(RecurringPattern).where(
+    """Deactivate a bill (soft-delete). Removes from forecast calculations.
+
+    Issued as one UPDATE ... RETURNING; raises NoResultFound if not found.
+    """
+    result = await db.scalars(
+        update(RecurringPattern)
+        .where(
             RecurringPattern.id == bill_id,
             RecurringPattern.user_id == user_id,
         )
+        .values(is_active=False)
+        .returning(RecurringPattern)
     )
-    bill = result.scalar_one()
-
-    bill.is_active = False
-    await db.flush()
+    bill = result.one()
+    invalidate_user_views_on_commit(db, user_id)
 
     await audit_service.log_event(
         db,
@@ -265,6 +330,18 @@ async def deactivate_bill(
     return bill
 
 
+_DEC_ONE = Decimal("1")
+
+# Frequency -> monthly multiplier for the summary query
+_MONTHLY_MULTIPLIERS: dict[Frequency, Decimal] = {
+    Frequency.weekly: Decimal("4.33"),
+    Frequency.biweekly: Decimal("2.17"),
+    Frequency.monthly: _DEC_ONE,
+    Frequency.quarterly: Decimal("0.33"),
+    Frequency.annual: Decimal("0.083"),
+}
+
+
 async def get_bill_summary(
     db: AsyncSession,
     user_id: uuid.UUID,
@@ -272,40 +349,44 @@ async def get_bill_summary(
     """Get a summary of the user's bills.
 
     Returns total monthly cost, counts by confidence, essential count.
+    Computed as one aggregate query; bill rows are not loaded.
     """
-    bills = await get_bills(db, user_id)
-
-    total_monthly = Decimal("0.00")
-    by_confidence = {"high": 0, "medium": 0, "low": 0}
-    essential_count = 0
-    manual_count = 0
-
-    for bill in bills:
-        # Normalize to monthly estimate
-        monthly = _to_monthly(bill.estimated_amount, bill.frequency)
-        total_monthly += monthly
-        by_confidence[bill.confidence.value] += 1
-        if bill.is_essential:
-            essential_count += 1
-        if bill.is_manual:
-            manual_count += 1
+    amount = RecurringPattern.estimated_amount
+    monthly = case(
+        *(
+            (RecurringPattern.frequency == freq, amount * multiplier)
+            for freq, multiplier in _MONTHLY_MULTIPLIERS.items()
+            if multiplier != _DEC_ONE
+        ),
+        else_=amount,
+    )
+    # Summed exactly (multipliers have at most 3 places); the total is rounded
+    # to cents in Python, half to even, as round() did before
+    total_expr = type_coerce(func.coalesce(func.sum(monthly), 0), Numeric(16, 5))
+
+    result = await db.execute(
+        select(
+            func.count(),
+            total_expr,
+            func.count().filter(RecurringPattern.confidence == Confidence.high),
+            func.count().filter(RecurringPattern.confidence == Confidence.medium),
+            func.count().filter(RecurringPattern.confidence == Confidence.low),
+            func.count().filter(RecurringPattern.is_essential == True),  # noqa: E712
+            func.count().filter(RecurringPattern.is_manual == True),  # noqa: E712
+        ).where(
+            RecurringPattern.user_id == user_id,
+            RecurringPattern.is_active == True,  # noqa: E712
+        )
+    )
+    total, total_monthly, high, medium, low, essential, manual = result.one()
 
     return {
-        "total_bills": len(bills),
-        "total_monthly_estimate": total_monthly,
-        "by_confidence": by_confidence,
-        "essential_count": essential_count,
-        "manual_count": manual_count,
+        "total_bills": total,
+        "total_monthly_estimate": Decimal(total_monthly).quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_EVEN
+        ),
+        "by_confidence": {"high": high, "medium": medium, "low": low},
+        "essential_count": essential,
+        "manual_count": manual,
     }
 
-
-def _to_monthly(amount: Decimal, frequency: Frequency) -> Decimal:
-    """Convert an amount to its monthly equivalent."""
-    multipliers = {
-        Frequency.weekly: Decimal("4.33"),
-        Frequency.biweekly: Decimal("2.17"),
-        Frequency.monthly: Decimal("1"),
-        Frequency.quarterly: Decimal("0.33"),
-        Frequency.annual: Decimal("0.083"),
-    }
-    return round(amount * multipliers.get(frequency, Decimal("1")), 2)
@@ -4,92 +4,90 @@ System categories are not deletable by users.
 """
 
 import uuid
+from collections.abc import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.base import generate_uuid
 from app.models.category import Category, SYSTEM_CATEGORIES
 from app.services import audit_service
 
-
-async def seed_system_categories(db: AsyncSession) -> list[Category]:
-    """Seed all system categories if they don't already exist. Idempotent."""
-    result = await db.execute(
-        select(Category).where(Category.is_system == True)  # noqa: E712
+# Category by id, and the system / per-user category listings by name
+_CATEGORY_BY_ID = select(Category).where(Category.id == bindparam("category_id"))
+_SYSTEM_CATEGORIES = (
+    select(Category)
+    .where(Category.is_system == True)  # noqa: E712
+    .order_by(Category.name)
+)
+_USER_CATEGORIES = (
+    select(Category)
+    .where(
+        (Category.is_system == True) | (Category.user_id == bindparam("user_id"))  # noqa: E712
     )
-    existing = {c.name for c in result.scalars().all()}
-
-    created = []
-    for cat_def in SYSTEM_CATEGORIES:
-        if cat_def["name"] not in existing:
-            cat = Category(
-                name=cat_def["name"],
-                icon=cat_def.get("icon"),
-                is_system=True,
-                user_id=None,
-            )
-            db.add(cat)
-            created.append(cat)
+    .order_by(Category.name)
+)
 
-    if created:
-        await db.flush()
 
-    return created
-
-
-async def get_system_categories(db: AsyncSession) -> list[Category]:
-    """Return all system categories."""
-    result = await db.execute(
-        select(Category)
-        .where(Category.is_system == True)  # noqa: E712
-        .order_by(Category.name)
+async def seed_system_categories(db: AsyncSession) -> list[Category]:
+    """Seed all system categories if they don't already exist. Idempotent.
+
+    One INSERT ... ON CONFLICT DO NOTHING against the partial unique index on
+    system category names; returns only the rows actually inserted.
+    """
+    insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    stmt = (
+        insert(Category)
+        .on_conflict_do_nothing(
+            index_elements=[Category.name],
+            index_where=Category.is_system,
+        )
+        .returning(Category)
     )
-    return list(result.scalars().all())
+    rows = [
+        {
+            "name": cat_def["name"],
+            "icon": cat_def.get("icon"),
+            "is_system": True,
+            "user_id": None,
+        }
+        for cat_def in SYSTEM_CATEGORIES
+    ]
+    result = await db.scalars(stmt, rows)
+    return list(result.all())
+
+
+async def get_system_categories(db: AsyncSession) -> Sequence[Category]:
+    """Return all system categories."""
+    result = await db.scalars(_SYSTEM_CATEGORIES)
+    return result.all()
 
 
-async def get_categories_for_user(db: AsyncSession, user_id: uuid.UUID) -> list[Category]:
+async def get_categories_for_user(db: AsyncSession, user_id: uuid.UUID) -> Sequence[Category]:
     """Return system categories + user's custom categories."""
-    result = await db.execute(
-        select(Category)
-        .where(
-            (Category.is_system == True) | (Category.user_id == user_id)  # noqa: E712
-        )
-        .order_by(Category.name)
-    )
-    return list(result.scalars().all())
+    result = await db.scalars(_USER_CATEGORIES, {"user_id": user_id})
+    return result.all()
 
 
 async def get_category_by_id(db: AsyncSession, category_id: uuid.UUID) -> Category | None:
-    result = await db.execute(select(Category).where(Category.id == category_id))
-    return result.scalar_one_or_none()
+    return await db.scalar(_CATEGORY_BY_ID, {"category_id": category_id})
 
 
 async def get_category_by_name(
     db: AsyncSession, name: str, user_id: uuid.UUID | None = None
 ) -> Category | None:
-    """Find a category by name. Checks system categories first, then user's."""
-    # Try system category
-    result = await db.execute(
-        select(Category).where(
-            Category.name == name,
-            Category.is_system == True,  # noqa: E712
-        )
-    )
-    cat = result.scalar_one_or_none()
-    if cat is not None:
-        return cat
-
-    # Try user category
+    """Find a category by name. Prefers a system category, then the user's."""
+    owner = Category.is_system == True  # noqa: E712
     if user_id is not None:
-        result = await db.execute(
-            select(Category).where(
-                Category.name == name,
-                Category.user_id == user_id,
-            )
-        )
-        return result.scalar_one_or_none()
-
-    return None
+        owner = or_(owner, Category.user_id == user_id)
+    return await db.scalar(
+        select(Category)
+        .where(Category.name == name, owner)
+        .order_by(Category.is_system.desc())
+        .limit(1)
+    )
 
 
 async def create_user_category(
@@ -103,6 +101,7 @@ async def create_user_category(
 ) -> Category:
     """Create a custom category for a user."""
     cat = Category(
+        id=generate_uuid(),
         user_id=user_id,
         name=name,
         parent_id=parent_id,
@@ -110,7 +109,6 @@ async def create_user_category(
         is_system=False,
     )
     db.add(cat)
-    await db.flush()
 
     await audit_service.log_event(
         db,
@@ -123,4 +121,6 @@ async def create_user_category(
         ip_address=ip_address,
     )
 
+    await db.flush()
+
     return cat
@@ -4,9 +4,21 @@ Phase 2: 5 minimal codes. Phase 3: expanded to ≥25.
 All codes are actionable, no automation of money movement.
 """
 
-from sqlalchemy import select
+import asyncio
+import functools
+import uuid
+from collections.abc import Mapping
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any
+
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import JSON, TypeDecorator
 
+from app.dependencies import json_serializer
 from app.models.cheat_code import CheatCodeCategory, CheatCodeDefinition, CheatCodeDifficulty
 
 # ─── Categories shorthand ───
@@ -565,48 +577,105 @@ SEED_CHEAT_CODES = [
     },
 ]
 
+# Freeze the seed once at import: savings bounds parsed to Decimal, steps as
+# tuples, each code a read-only mapping that lines up 1:1 with the columns.
+SEED_CHEAT_CODES: tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType({
+        **data,
+        "steps": tuple(data["steps"]),
+        "potential_savings_min": (
+            Decimal(data["potential_savings_min"]) if data["potential_savings_min"] else None
+        ),
+        "potential_savings_max": (
+            Decimal(data["potential_savings_max"]) if data["potential_savings_max"] else None
+        ),
+    })
+    for data in SEED_CHEAT_CODES
+)
+
+_SEED_CODES = tuple(data["code"] for data in SEED_CHEAT_CODES)
+
+
+class _EncodedJSON(TypeDecorator):
+    """JSON column bind for values that are already serialized strings."""
+
+    impl = JSON
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        return None
+
+
+@functools.cache
+def _seed_rows() -> tuple[dict[str, Any], ...]:
+    """Insert rows with steps pre-serialized, built on the first insert only.
+
+    The seed is static, so steps are encoded once per process rather than by
+    the JSON column's bind processor on every seed; restarts against a seeded
+    database never build them at all.
+    """
+    return tuple(
+        {
+            **{key: value for key, value in data.items() if key != "steps"},
+            "steps_json": json_serializer(data["steps"]),
+        }
+        for data in SEED_CHEAT_CODES
+    )
+
+
+_SEED_INSERT_VALUES = {"steps": bindparam("steps_json", type_=_EncodedJSON())}
+
+# Ids of the seeded definitions, in seed order, once this process has seeded.
+_seeded_ids: tuple[uuid.UUID, ...] | None = None
+_seed_lock = asyncio.Lock()
+
 
 async def seed_cheat_codes(db: AsyncSession) -> list[CheatCodeDefinition]:
     """Seed the cheat code definitions library.
 
     Idempotent: skips codes that already exist (by unique code field).
     Returns all seeded/existing definitions.
+
+    A single INSERT ... ON CONFLICT (code) DO NOTHING does the existence
+    check and the insert together, so concurrent workers seeding at startup
+    cannot race each other. It is skipped when every code is already present.
+    Once this process has seeded, later calls reload the definitions by id.
     """
-    from decimal import Decimal
+    global _seeded_ids
 
-    results = []
-    for data in SEED_CHEAT_CODES:
-        existing = await db.execute(
-            select(CheatCodeDefinition).where(
-                CheatCodeDefinition.code == data["code"]
+    async with _seed_lock:
+        if _seeded_ids is not None:
+            result = await db.execute(
+                select(CheatCodeDefinition).where(CheatCodeDefinition.id.in_(_seeded_ids))
             )
-        )
-        existing_def = existing.scalar_one_or_none()
-        if existing_def:
-            results.append(existing_def)
-            continue
+            by_id = {d.id: d for d in result.scalars().all()}
+            # A different (or reset) database misses some ids: seed it again.
+            if len(by_id) == len(_seeded_ids):
+                return [by_id[id_] for id_ in _seeded_ids]
+
+        definitions = await _seed(db)
+        _seeded_ids = tuple(d.id for d in definitions)
+        return definitions
+
 
-        definition = CheatCodeDefinition(
-            code=data["code"],
-            title=data["title"],
-            description=data["description"],
-            category=data["category"],
-            difficulty=data["difficulty"],
-            estimated_minutes=data["estimated_minutes"],
-            steps=data["steps"],
-            potential_savings_min=(
-                Decimal(data["potential_savings_min"])
-                if data["potential_savings_min"]
-                else None
-            ),
-            potential_savings_max=(
-                Decimal(data["potential_savings_max"])
-                if data["potential_savings_max"]
-                else None
-            ),
+async def _seed(db: AsyncSession) -> list[CheatCodeDefinition]:
+    # Fast path for restarts on an already seeded database: skip the insert.
+    seeded = await db.scalar(
+        select(func.count())
+        .select_from(CheatCodeDefinition)
+        .where(CheatCodeDefinition.code.in_(_SEED_CODES))
+    )
+    if seeded < len(_SEED_CODES):
+        insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+        await db.execute(
+            insert(CheatCodeDefinition.__table__)
+            .values(_SEED_INSERT_VALUES)
+            .on_conflict_do_nothing(index_elements=["code"]),
+            _seed_rows(),
         )
-        db.add(definition)
-        results.append(definition)
 
-    await db.flush()
-    return results
+    result = await db.execute(
+        select(CheatCodeDefinition).where(CheatCodeDefinition.code.in_(_SEED_CODES))
+    )
+    by_code = {d.code: d for d in result.scalars().all()}
+    return [by_code[code] for code in _SEED_CODES]
@@ -5,9 +5,11 @@ All state transitions audit-logged.
 """
 
 import uuid
+from collections.abc import Sequence
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, case, func, insert, literal, select, update
+from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.cheat_code import (
@@ -19,6 +21,17 @@ from app.models.cheat_code import (
 )
 from app.services import audit_service
 
+# A user's run by id, and its steps in order
+_RUN_BY_ID = select(CheatCodeRun).where(
+    CheatCodeRun.id == bindparam("run_id"),
+    CheatCodeRun.user_id == bindparam("user_id"),
+)
+_RUN_STEPS = (
+    select(StepRun)
+    .where(StepRun.run_id == bindparam("run_id"))
+    .order_by(StepRun.step_number.asc())
+)
+
 
 async def start_run(
     db: AsyncSession,
@@ -31,21 +44,15 @@ async def start_run(
 
     Creates a CheatCodeRun + StepRun records for each step.
     """
-    # Get the recommendation
+    # Get the recommendation's cheat code definition
     result = await db.execute(
-        select(Recommendation).where(
+        select(CheatCodeDefinition)
+        .join(Recommendation, Recommendation.cheat_code_id == CheatCodeDefinition.id)
+        .where(
             Recommendation.id == recommendation_id,
             Recommendation.user_id == user_id,
         )
     )
-    rec = result.scalar_one()
-
-    # Get the cheat code definition
-    result = await db.execute(
-        select(CheatCodeDefinition).where(
-            CheatCodeDefinition.id == rec.cheat_code_id
-        )
-    )
     definition = result.scalar_one()
 
     total_steps = len(definition.steps)
@@ -63,16 +70,18 @@ async def start_run(
     db.add(run)
     await db.flush()
 
-    # Create step runs
-    for step_data in definition.steps:
-        step = StepRun(
-            run_id=run.id,
-            step_number=step_data["step_number"],
-            status=RunStatus.not_started,
-        )
-        db.add(step)
-
-    await db.flush()
+    # Create step runs in one executemany INSERT
+    await db.execute(
+        insert(StepRun),
+        [
+            {
+                "run_id": run.id,
+                "step_number": step_data["step_number"],
+                "status": RunStatus.not_started,
+            }
+            for step_data in definition.steps
+        ],
+    )
 
     await audit_service.log_event(
         db,
@@ -84,7 +93,7 @@ async def start_run(
         detail={
             "cheat_code": definition.code,
             "total_steps": total_steps,
-            "recommendation_id": str(recommendation_id),
+            "recommendation_id": recommendation_id,
         },
         ip_address=ip_address,
     )
@@ -106,51 +115,70 @@ async def complete_step(
     Returns the updated StepRun.
     Also updates the parent run's completed_steps count.
     If all steps completed, marks the run as completed.
+    Both writes are guarded UPDATE ... RETURNING statements, so concurrent
+    completions of the same run cannot double-count or lose a step. Raises
+    NoResultFound if the run isn't the user's in-progress run, including one
+    paused or archived between the two writes; the caller's rollback then
+    undoes the step.
     """
-    # Verify the run belongs to this user and is in progress
-    run_result = await db.execute(
-        select(CheatCodeRun).where(
-            CheatCodeRun.id == run_id,
-            CheatCodeRun.user_id == user_id,
-            CheatCodeRun.status == RunStatus.in_progress,
-        )
+    now = datetime.now(timezone.utc)
+    # Only steps of this user's in-progress run may be touched
+    owned_run = select(CheatCodeRun.id).where(
+        CheatCodeRun.id == run_id,
+        CheatCodeRun.user_id == user_id,
+        CheatCodeRun.status == RunStatus.in_progress,
     )
-    run = run_result.scalar_one()
-
-    # Get the step
-    step_result = await db.execute(
-        select(StepRun).where(
-            StepRun.run_id == run_id,
+    mark_step = (
+        update(StepRun)
+        .where(
+            StepRun.run_id.in_(owned_run.scalar_subquery()),
             StepRun.step_number == step_number,
         )
+        .values(
+            status=RunStatus.completed,
+            started_at=func.coalesce(StepRun.started_at, literal(now, StepRun.started_at.type)),
+            completed_at=now,
+            notes=notes,
+        )
+        .returning(StepRun)
     )
-    step = step_result.scalar_one()
 
-    # Mark step as completed
-    now = datetime.now(timezone.utc)
-    if step.started_at is None:
-        step.started_at = now
-    step.completed_at = now
-    step.status = RunStatus.completed
-    step.notes = notes
-    await db.flush()
-
-    # Update run's completed_steps count
-    completed_result = await db.execute(
-        select(StepRun).where(
-            StepRun.run_id == run_id,
-            StepRun.status == RunStatus.completed,
+    # The status guard makes the first completion of a step win exactly once,
+    # even under concurrent requests; a repeat only refreshes time and notes.
+    step = (
+        await db.scalars(mark_step.where(StepRun.status != RunStatus.completed))
+    ).one_or_none()
+    newly_completed = step is not None
+    if step is None:
+        step = (await db.scalars(mark_step)).one()
+
+    # Count the step and complete the run in the same UPDATE, from the row's
+    # own values, so concurrent completions cannot lose an increment.
+    finishes = CheatCodeRun.completed_steps + int(newly_completed) >= CheatCodeRun.total_steps
+    result = await db.scalars(
+        update(CheatCodeRun)
+        .where(
+            CheatCodeRun.id == run_id,
+            CheatCodeRun.user_id == user_id,
+            CheatCodeRun.status == RunStatus.in_progress,
+        )
+        .values(
+            completed_steps=CheatCodeRun.completed_steps + int(newly_completed),
+            status=case(
+                (finishes, literal(RunStatus.completed, CheatCodeRun.status.type)),
+                else_=CheatCodeRun.status,
+            ),
+            completed_at=case(
+                (finishes, literal(now, CheatCodeRun.completed_at.type)),
+                else_=CheatCodeRun.completed_at,
+            ),
         )
+        .returning(CheatCodeRun)
     )
-    completed_steps = len(completed_result.scalars().all())
-    run.completed_steps = completed_steps
-
-    # If all steps completed, mark run as completed
-    if completed_steps >= run.total_steps:
-        run.status = RunStatus.completed
-        run.completed_at = now
-
-    await db.flush()
+    run = result.one_or_none()
+    if run is None:
+        raise NoResultFound(f"Run {run_id} is no longer in progress")
+    completed_steps = run.completed_steps
 
     await audit_service.log_event(
         db,
@@ -160,7 +188,7 @@ async def complete_step(
         entity_id=step.id,
         action="complete_step",
         detail={
-            "run_id": str(run_id),
+            "run_id": run_id,
             "step_number": step_number,
             "completed_steps": completed_steps,
             "total_steps": run.total_steps,
@@ -179,26 +207,17 @@ async def get_run(
     user_id: uuid.UUID,
 ) -> CheatCodeRun:
     """Get a specific run for a user."""
-    result = await db.execute(
-        select(CheatCodeRun).where(
-            CheatCodeRun.id == run_id,
-            CheatCodeRun.user_id == user_id,
-        )
-    )
+    result = await db.execute(_RUN_BY_ID, {"run_id": run_id, "user_id": user_id})
     return result.scalar_one()
 
 
 async def get_run_steps(
     db: AsyncSession,
     run_id: uuid.UUID,
-) -> list[StepRun]:
+) -> Sequence[StepRun]:
     """Get all steps for a run."""
-    result = await db.execute(
-        select(StepRun)
-        .where(StepRun.run_id == run_id)
-        .order_by(StepRun.step_number.asc())
-    )
-    return list(result.scalars().all())
+    result = await db.scalars(_RUN_STEPS, {"run_id": run_id})
+    return result.all()
 
 
 async def get_user_runs(
@@ -206,7 +225,7 @@ async def get_user_runs(
     user_id: uuid.UUID,
     *,
     status: RunStatus | None = None,
-) -> list[CheatCodeRun]:
+) -> Sequence[CheatCodeRun]:
     """Get all runs for a user, optionally filtered by status."""
     stmt = (
         select(CheatCodeRun)
@@ -215,28 +234,49 @@ async def get_user_runs(
     )
     if status is not None:
         stmt = stmt.where(CheatCodeRun.status == status)
-    result = await db.execute(stmt)
-    return list(result.scalars().all())
+    result = await db.scalars(stmt)
+    return result.all()
 
 
-async def pause_run(
+async def _transition(
     db: AsyncSession,
     *,
     run_id: uuid.UUID,
     user_id: uuid.UUID,
-    ip_address: str | None = None,
+    from_status: RunStatus,
+    to_status: RunStatus,
 ) -> CheatCodeRun:
-    """Pause an in-progress run."""
-    result = await db.execute(
-        select(CheatCodeRun).where(
+    """Move a run between statuses with one guarded UPDATE ... RETURNING.
+
+    The status check and the write are a single statement, so two concurrent
+    requests cannot both apply the transition. Raises NoResultFound if the run
+    doesn't exist, isn't the user's, or isn't in from_status.
+    """
+    result = await db.scalars(
+        update(CheatCodeRun)
+        .where(
             CheatCodeRun.id == run_id,
             CheatCodeRun.user_id == user_id,
-            CheatCodeRun.status == RunStatus.in_progress,
+            CheatCodeRun.status == from_status,
         )
+        .values(status=to_status)
+        .returning(CheatCodeRun)
+    )
+    return result.one()
+
+
+async def pause_run(
+    db: AsyncSession,
+    *,
+    run_id: uuid.UUID,
+    user_id: uuid.UUID,
+    ip_address: str | None = None,
+) -> CheatCodeRun:
+    """Pause an in-progress run."""
+    run = await _transition(
+        db, run_id=run_id, user_id=user_id,
+        from_status=RunStatus.in_progress, to_status=RunStatus.paused,
     )
-    run = result.scalar_one()
-    run.status = RunStatus.paused
-    await db.flush()
 
     await audit_service.log_event(
         db,
@@ -260,16 +300,10 @@ async def resume_run(
     ip_address: str | None = None,
 ) -> CheatCodeRun:
     """Resume a paused run."""
-    result = await db.execute(
-        select(CheatCodeRun).where(
-            CheatCodeRun.id == run_id,
-            CheatCodeRun.user_id == user_id,
-            CheatCodeRun.status == RunStatus.paused,
-        )
+    run = await _transition(
+        db, run_id=run_id, user_id=user_id,
+        from_status=RunStatus.paused, to_status=RunStatus.in_progress,
     )
-    run = result.scalar_one()
-    run.status = RunStatus.in_progress
-    await db.flush()
 
     await audit_service.log_event(
         db,
@@ -293,12 +327,7 @@ async def abandon_run(
     ip_address: str | None = None,
 ) -> CheatCodeRun:
     """Abandon a run (user gives up or decides not to complete)."""
-    result = await db.execute(
-        select(CheatCodeRun).where(
-            CheatCodeRun.id == run_id,
-            CheatCodeRun.user_id == user_id,
-        )
-    )
+    result = await db.execute(_RUN_BY_ID, {"run_id": run_id, "user_id": user_id})
     run = result.scalar_one()
 
     if run.status in (RunStatus.completed, RunStatus.archived):
@@ -335,12 +364,7 @@ async def archive_run(
     ip_address: str | None = None,
 ) -> CheatCodeRun:
     """Archive a completed run."""
-    result = await db.execute(
-        select(CheatCodeRun).where(
-            CheatCodeRun.id == run_id,
-            CheatCodeRun.user_id == user_id,
-        )
-    )
+    result = await db.execute(_RUN_BY_ID, {"run_id": run_id, "user_id": user_id})
     run = result.scalar_one()
 
     if run.status != RunStatus.completed:
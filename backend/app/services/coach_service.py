@@ -16,12 +16,16 @@ Coach memory (tone, aggressiveness) personalizes output when ai_memory consent g
 
 import uuid
 from collections import defaultdict
+from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from types import MappingProxyType
 
-from sqlalchemy import select, func
+from sqlalchemy import inspect, select
+from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
 from app.models.cheat_code import (
     CheatCodeDefinition,
     CheatCodeOutcome,
@@ -212,18 +216,9 @@ async def explain(
     """
     caveats: list[str] = []
 
-    if context_type == "recurring_pattern":
-        response, template, inputs, caveats = await _explain_recurring(
-            db, user_id, context_id
-        )
-    elif context_type == "recommendation":
-        response, template, inputs, caveats = await _explain_recommendation(
-            db, user_id, context_id
-        )
-    elif context_type == "cheat_code":
-        response, template, inputs, caveats = await _explain_cheat_code(
-            db, context_id
-        )
+    handler = _EXPLAIN_HANDLERS.get(context_type)
+    if handler is not None:
+        response, template, inputs, caveats = await handler(db, user_id, context_id)
     else:
         response = f"Explanation not available for context type: {context_type}"
         template = "unknown"
@@ -339,10 +334,16 @@ async def plan(
     template_key = "general"
     template_inputs: dict = {"tone_opener": tone_opener}
 
+    definitions = await _get_definitions(
+        db,
+        {run.cheat_code_id for run in paused_runs[:1]}
+        | {rec.cheat_code_id for rec in recommendations},
+    )
+
     # Priority 1: Resume paused runs (max 1 step)
     if paused_runs:
         run = paused_runs[0]
-        defn = await _get_definition(db, run.cheat_code_id)
+        defn = definitions.get(run.cheat_code_id)
         if defn:
             steps.append({
                 "step_number": len(steps) + 1,
@@ -367,7 +368,7 @@ async def plan(
         )
         if already_running:
             continue
-        defn = await _get_definition(db, rec.cheat_code_id)
+        defn = definitions.get(rec.cheat_code_id)
         if defn:
             steps.append({
                 "step_number": len(steps) + 1,
@@ -500,11 +501,14 @@ async def review(
     archived_runs = await _get_runs_by_status(db, user_id, RunStatus.archived)
     all_done_runs = completed_runs + archived_runs
 
+    definitions = await _get_definitions(db, {run.cheat_code_id for run in all_done_runs})
+    outcomes = await _get_outcomes_for_runs(db, [run.id for run in all_done_runs])
+
     wins: list[dict] = []
     total_savings = Decimal("0.00")
     for run in all_done_runs:
-        defn = await _get_definition(db, run.cheat_code_id)
-        outcome = await _get_outcome_for_run(db, run.id)
+        defn = definitions.get(run.cheat_code_id)
+        outcome = outcomes.get(run.id)
         win_entry: dict = {
             "title": defn.title if defn else "Unknown",
             "code_id": str(run.cheat_code_id),
@@ -733,22 +737,16 @@ async def _explain_recurring(
 ) -> tuple[str, str, dict, list[str]]:
     """Build explanation for a recurring pattern."""
     result = await db.execute(
-        select(RecurringPattern).where(
+        select(RecurringPattern, Merchant.display_name)
+        .outerjoin(Merchant, Merchant.id == RecurringPattern.merchant_id)
+        .where(
             RecurringPattern.id == pattern_id,
             RecurringPattern.user_id == user_id,
         )
     )
-    pattern = result.scalar_one()
-
-    # Get merchant name
-    merchant_name = "Unknown"
-    if pattern.merchant_id:
-        m_result = await db.execute(
-            select(Merchant).where(Merchant.id == pattern.merchant_id)
-        )
-        merchant = m_result.scalar_one_or_none()
-        if merchant:
-            merchant_name = merchant.display_name
+    pattern, merchant_name = result.one()
+    if merchant_name is None:
+        merchant_name = "Unknown"
 
     confidence_note = CONFIDENCE_NOTES.get(pattern.confidence.value, "")
 
@@ -781,18 +779,14 @@ async def _explain_recommendation(
 ) -> tuple[str, str, dict, list[str]]:
     """Build explanation for a recommendation."""
     result = await db.execute(
-        select(Recommendation).where(
+        select(Recommendation, CheatCodeDefinition)
+        .join(CheatCodeDefinition, CheatCodeDefinition.id == Recommendation.cheat_code_id)
+        .where(
             Recommendation.id == recommendation_id,
             Recommendation.user_id == user_id,
         )
     )
-    rec = result.scalar_one()
-
-    # Get cheat code definition
-    def_result = await db.execute(
-        select(CheatCodeDefinition).where(CheatCodeDefinition.id == rec.cheat_code_id)
-    )
-    definition = def_result.scalar_one()
+    rec, definition = result.one()
 
     inputs = {
         "title": definition.title,
@@ -815,13 +809,13 @@ async def _explain_recommendation(
 
 async def _explain_cheat_code(
     db: AsyncSession,
+    user_id: uuid.UUID,
     cheat_code_id: uuid.UUID,
 ) -> tuple[str, str, dict, list[str]]:
-    """Build explanation for a cheat code definition."""
-    result = await db.execute(
-        select(CheatCodeDefinition).where(CheatCodeDefinition.id == cheat_code_id)
-    )
-    definition = result.scalar_one()
+    """Build explanation for a cheat code definition (not user-specific)."""
+    definition = await _get_definition(db, cheat_code_id)
+    if definition is None:
+        raise NoResultFound(f"Cheat code {cheat_code_id} not found")
 
     savings_note = ""
     if definition.potential_savings_min and definition.potential_savings_max:
@@ -844,6 +838,13 @@ async def _explain_cheat_code(
     return response, "cheat_code", inputs, []
 
 
+_EXPLAIN_HANDLERS = {
+    "recurring_pattern": _explain_recurring,
+    "recommendation": _explain_recommendation,
+    "cheat_code": _explain_cheat_code,
+}
+
+
 # --- Private helpers for Plan/Review/Recap ---
 
 def _ensure_tz(dt: datetime) -> datetime:
@@ -910,22 +911,84 @@ async def _get_active_bills(
     return list(result.scalars().all())
 
 
+# Cheat code definitions by id; seed data, so entries only age out.
+_definition_cache = TTLCache(maxsize=1024, ttl=300)
+
+
 async def _get_definition(
     db: AsyncSession, cheat_code_id: uuid.UUID
 ) -> CheatCodeDefinition | None:
-    result = await db.execute(
+    """Load a cheat code definition, served from _definition_cache when warm.
+
+    Definitions are seed data, so a transient column-only copy is cached and
+    returned, hit or miss: it belongs to no session and cannot be expired by
+    another request's rollback, and its steps are read-only.
+    """
+    cached = _definition_cache.get(cheat_code_id)
+    if cached is not None:
+        return cached
+    definition = await db.scalar(
         select(CheatCodeDefinition).where(CheatCodeDefinition.id == cheat_code_id)
     )
-    return result.scalar_one_or_none()
+    if definition is None:
+        return None
+    return warm_definition_cache([definition])[0]
+
+
+async def _get_definitions(
+    db: AsyncSession, cheat_code_ids: Iterable[uuid.UUID]
+) -> dict[uuid.UUID, CheatCodeDefinition]:
+    """Batch form of _get_definition: cache hits plus one IN query for misses."""
+    definitions: dict[uuid.UUID, CheatCodeDefinition] = {}
+    missing: list[uuid.UUID] = []
+    for cheat_code_id in cheat_code_ids:
+        cached = _definition_cache.get(cheat_code_id)
+        if cached is not None:
+            definitions[cheat_code_id] = cached
+        else:
+            missing.append(cheat_code_id)
+    if missing:
+        loaded = (
+            await db.scalars(
+                select(CheatCodeDefinition).where(CheatCodeDefinition.id.in_(missing))
+            )
+        ).all()
+        definitions.update(
+            (definition.id, definition) for definition in warm_definition_cache(loaded)
+        )
+    return definitions
 
 
-async def _get_outcome_for_run(
-    db: AsyncSession, run_id: uuid.UUID
-) -> CheatCodeOutcome | None:
-    result = await db.execute(
-        select(CheatCodeOutcome).where(CheatCodeOutcome.run_id == run_id)
+def warm_definition_cache(
+    definitions: Iterable[CheatCodeDefinition],
+) -> list[CheatCodeDefinition]:
+    """Cache detached copies of loaded definitions, e.g. right after seeding.
+
+    Returns the cached copies. They are shared by every request for the TTL,
+    so steps is frozen into a tuple of read-only mappings.
+    """
+    copies = []
+    for definition in definitions:
+        values = {
+            attr.key: getattr(definition, attr.key)
+            for attr in inspect(CheatCodeDefinition).column_attrs
+        }
+        values["steps"] = tuple(MappingProxyType(dict(step)) for step in values["steps"])
+        copy = CheatCodeDefinition(**values)
+        _definition_cache.set(definition.id, copy)
+        copies.append(copy)
+    return copies
+
+
+async def _get_outcomes_for_runs(
+    db: AsyncSession, run_ids: list[uuid.UUID]
+) -> dict[uuid.UUID, CheatCodeOutcome]:
+    if not run_ids:
+        return {}
+    result = await db.scalars(
+        select(CheatCodeOutcome).where(CheatCodeOutcome.run_id.in_(run_ids))
     )
-    return result.scalar_one_or_none()
+    return {outcome.run_id: outcome for outcome in result}
 
 
 def _estimate_monthly_total(bills: list[RecurringPattern]) -> Decimal:
@@ -5,14 +5,45 @@ AI memory consent defaults to OFF (not granted) — must be explicitly granted.
 """
 
 import uuid
+from collections.abc import Iterable
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.models.base import generate_uuid
 from app.models.consent import ConsentRecord, ConsentType
 from app.services import audit_service
 
+# Built once at import: consent checks run on most AI-facing requests.
+_ACTIVE_CONSENT = select(ConsentRecord).where(
+    ConsentRecord.user_id == bindparam("user_id"),
+    ConsentRecord.consent_type == bindparam("consent_type"),
+    ConsentRecord.granted == True,  # noqa: E712
+    ConsentRecord.revoked_at == None,  # noqa: E711
+)
+
+# Key in AsyncSession.info for the (user_id, consent_type) pairs already seen
+# active in this session. Sessions are per request, so this is request-scoped.
+_ACTIVE_CACHE_KEY = "active_consents"
+
+
+def _active_cache(db: AsyncSession) -> set[tuple[uuid.UUID, ConsentType]]:
+    return db.info.setdefault(_ACTIVE_CACHE_KEY, set())
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_rolled_back(session: Session, previous_transaction) -> None:
+    # Any rollback, savepoints included, may undo a grant the cache recorded
+    session.info.pop(_ACTIVE_CACHE_KEY, None)
+
+
+def forget_consents(db: AsyncSession, user_id: uuid.UUID) -> None:
+    """Drop a user's cached active consents after bulk consent changes."""
+    cache = _active_cache(db)
+    cache.difference_update({key for key in cache if key[0] == user_id})
+
 
 async def grant_consent(
     db: AsyncSession,
@@ -30,6 +61,7 @@ async def grant_consent(
         return existing
 
     consent = ConsentRecord(
+        id=generate_uuid(),
         user_id=user_id,
         consent_type=consent_type,
         granted=True,
@@ -37,7 +69,7 @@ async def grant_consent(
         user_agent=user_agent,
     )
     db.add(consent)
-    await db.flush()
+    _active_cache(db).add((user_id, consent_type))
 
     await audit_service.log_event(
         db,
@@ -50,6 +82,8 @@ async def grant_consent(
         ip_address=ip_address,
     )
 
+    await db.flush()
+
     return consent
 
 
@@ -71,6 +105,7 @@ async def revoke_consent(
     consent.granted = False
     consent.revoked_at = datetime.now(timezone.utc)
     await db.flush()
+    _active_cache(db).discard((user_id, consent_type))
 
     await audit_service.log_event(
         db,
@@ -91,9 +126,39 @@ async def check_consent(
     user_id: uuid.UUID,
     consent_type: ConsentType,
 ) -> bool:
-    """Check if a specific consent is currently active (granted and not revoked)."""
+    """Check if a specific consent is currently active (granted and not revoked).
+
+    Active results are remembered on the session, so repeated checks within a
+    request (e.g. several coach memory calls) cost one query. Misses are not
+    cached and always re-checked.
+    """
+    cache = _active_cache(db)
+    if (user_id, consent_type) in cache:
+        return True
     consent = await _get_active_consent(db, user_id, consent_type)
-    return consent is not None
+    if consent is None:
+        return False
+    cache.add((user_id, consent_type))
+    return True
+
+
+async def check_consents(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    consent_types: Iterable[ConsentType],
+) -> dict[ConsentType, bool]:
+    """Check several consent types at once with a single IN query."""
+    consent_types = list(consent_types)
+    result = await db.execute(
+        select(ConsentRecord.consent_type).where(
+            ConsentRecord.user_id == user_id,
+            ConsentRecord.consent_type.in_(consent_types),
+            ConsentRecord.granted == True,  # noqa: E712
+            ConsentRecord.revoked_at == None,  # noqa: E711
+        )
+    )
+    active = set(result.scalars().all())
+    return {ct: ct in active for ct in consent_types}
 
 
 async def get_all_consents(
@@ -116,11 +181,7 @@ async def _get_active_consent(
     consent_type: ConsentType,
 ) -> ConsentRecord | None:
     """Find the currently active (granted=True, not revoked) consent of a given type."""
-    stmt = select(ConsentRecord).where(
-        ConsentRecord.user_id == user_id,
-        ConsentRecord.consent_type == consent_type,
-        ConsentRecord.granted == True,  # noqa: E712
-        ConsentRecord.revoked_at == None,  # noqa: E711
+    result = await db.execute(
+        _ACTIVE_CONSENT, {"user_id": user_id, "consent_type": consent_type}
     )
-    result = await db.execute(stmt)
     return result.scalar_one_or_none()
@@ -19,7 +19,7 @@ from app.models.audit import AuditLogEvent
 from app.models.consent import ConsentRecord
 from app.models.session import Session
 from app.models.user import User, UserStatus
-from app.services import audit_service, vault_service
+from app.services import audit_service, consent_service, vault_service
 
 # PII fields in audit detail that must be scrubbed
 _PII_DETAIL_KEYS = {"email", "ip_address", "user_agent", "password"}
@@ -73,6 +73,7 @@ async def delete_user_data(
     await db.execute(
         delete(ConsentRecord).where(ConsentRecord.user_id == user_id)
     )
+    consent_service.forget_consents(db, user_id)
 
     # 5. Anonymize audit trail: scrub PII from detail, clear ip_address
     result = await db.execute(
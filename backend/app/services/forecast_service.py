@@ -17,6 +17,7 @@ Design principles (per PRD):
 
 import uuid
 from collections import defaultdict
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from statistics import mean, stdev
@@ -341,6 +342,10 @@ async def compute_forecast(
     1. Current account balances
     2. Recurring pattern projections
     3. Historical spending patterns (average + volatility)
+
+    Does not commit: the reads, snapshot insert and audit event commit or
+    roll back together with the caller's transaction. POST /forecast/compute
+    commits explicitly before it responds.
     """
     today = _today_utc()
     today_end = today + timedelta(hours=23, minutes=59, seconds=59)
@@ -535,6 +540,31 @@ async def get_latest_forecast(
     return result.scalar_one_or_none()
 
 
+async def get_latest_summary(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+) -> dict | None:
+    """Get only the dashboard summary columns of the most recent snapshot.
+
+    Skips the large daily_balances / assumptions JSON columns.
+    """
+    result = await db.execute(
+        select(
+            ForecastSnapshot.safe_to_spend_today,
+            ForecastSnapshot.safe_to_spend_week,
+            ForecastSnapshot.projected_end_balance,
+            ForecastSnapshot.confidence,
+            ForecastSnapshot.urgency_score,
+            ForecastSnapshot.computed_at,
+        )
+        .where(ForecastSnapshot.user_id == user_id)
+        .order_by(ForecastSnapshot.computed_at.desc())
+        .limit(1)
+    )
+    row = result.first()
+    return dict(row._mapping) if row is not None else None
+
+
 async def get_forecast_history(
     db: AsyncSession,
     user_id: uuid.UUID,
@@ -549,3 +579,20 @@ async def get_forecast_history(
         .limit(limit)
     )
     return list(result.scalars().all())
+
+
+async def stream_forecast_history(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    *,
+    limit: int = 10,
+) -> AsyncIterator[ForecastSnapshot]:
+    """Yield recent forecast snapshots one at a time from a server-side cursor."""
+    result = await db.stream_scalars(
+        select(ForecastSnapshot)
+        .where(ForecastSnapshot.user_id == user_id)
+        .order_by(ForecastSnapshot.computed_at.desc())
+        .limit(limit)
+    )
+    async for snapshot in result:
+        yield snapshot
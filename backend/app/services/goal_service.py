@@ -6,12 +6,26 @@ All writes audit-logged.
 import uuid
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.base import generate_uuid
 from app.models.goal import Goal, GoalPriority, GoalType, UserConstraint
 from app.services import audit_service
 
+# A user's goals and constraints, oldest first
+_USER_GOALS = (
+    select(Goal)
+    .where(Goal.user_id == bindparam("user_id"))
+    .order_by(Goal.created_at.asc())
+)
+_ACTIVE_USER_GOALS = _USER_GOALS.where(Goal.is_active == True)  # noqa: E712
+_USER_CONSTRAINTS = (
+    select(UserConstraint)
+    .where(UserConstraint.user_id == bindparam("user_id"))
+    .order_by(UserConstraint.created_at.asc())
+)
+
 
 async def create_goal(
     db: AsyncSession,
@@ -27,6 +41,7 @@ async def create_goal(
 ) -> Goal:
     """Create a new financial goal for a user."""
     goal = Goal(
+        id=generate_uuid(),
         user_id=user_id,
         goal_type=goal_type,
         title=title,
@@ -36,7 +51,6 @@ async def create_goal(
         target_date=target_date,
     )
     db.add(goal)
-    await db.flush()
 
     await audit_service.log_event(
         db,
@@ -54,6 +68,8 @@ async def create_goal(
         ip_address=ip_address,
     )
 
+    await db.flush()
+
     return goal
 
 
@@ -64,11 +80,8 @@ async def get_goals(
     active_only: bool = True,
 ) -> list[Goal]:
     """List goals for a user."""
-    stmt = select(Goal).where(Goal.user_id == user_id)
-    if active_only:
-        stmt = stmt.where(Goal.is_active == True)  # noqa: E712
-    stmt = stmt.order_by(Goal.created_at.asc())
-    result = await db.execute(stmt)
+    stmt = _ACTIVE_USER_GOALS if active_only else _USER_GOALS
+    result = await db.execute(stmt, {"user_id": user_id})
     return list(result.scalars().all())
 
 
@@ -112,6 +125,7 @@ async def create_constraint(
 ) -> UserConstraint:
     """Create a user financial constraint."""
     constraint = UserConstraint(
+        id=generate_uuid(),
         user_id=user_id,
         constraint_type=constraint_type,
         label=label,
@@ -119,7 +133,6 @@ async def create_constraint(
         notes=notes,
     )
     db.add(constraint)
-    await db.flush()
 
     await audit_service.log_event(
         db,
@@ -136,6 +149,8 @@ async def create_constraint(
         ip_address=ip_address,
     )
 
+    await db.flush()
+
     return constraint
 
 
@@ -144,11 +159,7 @@ async def get_constraints(
     user_id: uuid.UUID,
 ) -> list[UserConstraint]:
     """List all constraints for a user."""
-    result = await db.execute(
-        select(UserConstraint)
-        .where(UserConstraint.user_id == user_id)
-        .order_by(UserConstraint.created_at.asc())
-    )
+    result = await db.execute(_USER_CONSTRAINTS, {"user_id": user_id})
     return list(result.scalars().all())
 
 
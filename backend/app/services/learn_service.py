@@ -4,14 +4,35 @@ All writes audit-logged.
 """
 
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
 from app.models.learn import LessonDefinition, LessonProgress, LessonStatus
 from app.services import audit_service
 
+# ETag of the last lesson list served per category filter. Lessons only
+# change when seeded, and seed_lessons clears this.
+lesson_list_etags = TTLCache(maxsize=64, ttl=300)
+
+# Hot read statements, built once at import; values are bound per call.
+_ACTIVE_LESSONS = (
+    select(LessonDefinition)
+    .where(LessonDefinition.is_active == True)  # noqa: E712
+    .order_by(LessonDefinition.display_order.asc())
+)
+_ACTIVE_LESSONS_BY_CATEGORY = _ACTIVE_LESSONS.where(
+    LessonDefinition.category == bindparam("category")
+)
+_USER_PROGRESS = (
+    select(LessonProgress)
+    .where(LessonProgress.user_id == bindparam("user_id"))
+    .order_by(LessonProgress.created_at.asc())
+)
+
 
 async def get_lessons(
     db: AsyncSession,
@@ -19,14 +40,10 @@ async def get_lessons(
     category: str | None = None,
 ) -> list[LessonDefinition]:
     """List all active lessons, optionally filtered by category."""
-    stmt = (
-        select(LessonDefinition)
-        .where(LessonDefinition.is_active == True)  # noqa: E712
-        .order_by(LessonDefinition.display_order.asc())
-    )
     if category:
-        stmt = stmt.where(LessonDefinition.category == category)
-    result = await db.execute(stmt)
+        result = await db.execute(_ACTIVE_LESSONS_BY_CATEGORY, {"category": category})
+    else:
+        result = await db.execute(_ACTIVE_LESSONS)
     return list(result.scalars().all())
 
 
@@ -48,14 +65,21 @@ async def get_user_progress(
     user_id: uuid.UUID,
 ) -> list[LessonProgress]:
     """Get all lesson progress for a user."""
-    result = await db.execute(
-        select(LessonProgress)
-        .where(LessonProgress.user_id == user_id)
-        .order_by(LessonProgress.created_at.asc())
-    )
+    result = await db.execute(_USER_PROGRESS, {"user_id": user_id})
     return list(result.scalars().all())
 
 
+async def stream_user_progress(
+    db: AsyncSession,
+    *,
+    user_id: uuid.UUID,
+) -> AsyncIterator[LessonProgress]:
+    """Yield lesson progress rows one at a time from a server-side cursor."""
+    result = await db.stream_scalars(_USER_PROGRESS, {"user_id": user_id})
+    async for progress in result:
+        yield progress
+
+
 async def get_progress_for_lesson(
     db: AsyncSession,
     *,
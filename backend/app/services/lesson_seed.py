@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.learn import LessonCategory, LessonDefinition
+from app.services import learn_service
 
 LESSONS = [
     # --- save_money (2) ---
@@ -263,12 +264,17 @@ async def seed_lessons(db: AsyncSession) -> int:
 
     Returns count of newly created lessons.
     """
+    # One code-only lookup for the whole seed; no ORM instances are loaded.
+    existing = set(
+        await db.scalars(
+            select(LessonDefinition.code).where(
+                LessonDefinition.code.in_([data["code"] for data in LESSONS])
+            )
+        )
+    )
     created = 0
     for lesson_data in LESSONS:
-        result = await db.execute(
-            select(LessonDefinition).where(LessonDefinition.code == lesson_data["code"])
-        )
-        if result.scalar_one_or_none() is not None:
+        if lesson_data["code"] in existing:
             continue
 
         sections = lesson_data["sections"]
@@ -286,4 +292,6 @@ async def seed_lessons(db: AsyncSession) -> int:
         created += 1
 
     await db.flush()
+    if created:
+        learn_service.lesson_list_etags.clear()
     return created
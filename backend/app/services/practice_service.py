@@ -13,7 +13,7 @@ import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.practice import (
@@ -27,6 +27,19 @@ from app.services import audit_service
 # Confidence is ALWAYS capped at medium for practice outputs (PRD rule)
 PRACTICE_CONFIDENCE_CAP = "medium"
 
+# Active scenarios in display order, optionally by category, and by id
+_ACTIVE_SCENARIOS = (
+    select(ScenarioDefinition)
+    .where(ScenarioDefinition.is_active == True)  # noqa: E712
+    .order_by(ScenarioDefinition.display_order.asc())
+)
+_ACTIVE_SCENARIOS_BY_CATEGORY = _ACTIVE_SCENARIOS.where(
+    ScenarioDefinition.category == bindparam("category")
+)
+_SCENARIO_BY_ID = select(ScenarioDefinition).where(
+    ScenarioDefinition.id == bindparam("scenario_id")
+)
+
 
 async def get_scenarios(
     db: AsyncSession,
@@ -34,14 +47,10 @@ async def get_scenarios(
     category: str | None = None,
 ) -> list[ScenarioDefinition]:
     """List all active scenarios, optionally filtered by category."""
-    stmt = (
-        select(ScenarioDefinition)
-        .where(ScenarioDefinition.is_active == True)  # noqa: E712
-        .order_by(ScenarioDefinition.display_order.asc())
-    )
     if category:
-        stmt = stmt.where(ScenarioDefinition.category == category)
-    result = await db.execute(stmt)
+        result = await db.execute(_ACTIVE_SCENARIOS_BY_CATEGORY, {"category": category})
+    else:
+        result = await db.execute(_ACTIVE_SCENARIOS)
     return list(result.scalars().all())
 
 
@@ -51,9 +60,7 @@ async def get_scenario(
     scenario_id: uuid.UUID,
 ) -> ScenarioDefinition:
     """Get a single scenario by ID."""
-    result = await db.execute(
-        select(ScenarioDefinition).where(ScenarioDefinition.id == scenario_id)
-    )
+    result = await db.execute(_SCENARIO_BY_ID, {"scenario_id": scenario_id})
     return result.scalar_one()
 
 
@@ -22,6 +22,7 @@ from statistics import mean, stdev
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.derived_views.cache import invalidate_user_views_on_commit
 from app.models.recurring import Confidence, Frequency, RecurringPattern
 from app.models.transaction import Transaction, TransactionType
 from app.services import audit_service
@@ -203,6 +204,7 @@ async def detect_patterns(
         patterns.append(pattern)
 
     await db.flush()
+    invalidate_user_views_on_commit(db, user_id)
 
     # Log detection
     await audit_service.log_event(
@@ -321,14 +321,16 @@ async def seed_scenarios(db: AsyncSession) -> int:
 
     Returns count of newly created scenarios.
     """
-    created = 0
-    for scenario_data in SCENARIOS:
-        result = await db.execute(
-            select(ScenarioDefinition).where(
-                ScenarioDefinition.code == scenario_data["code"]
+    existing = set(
+        await db.scalars(
+            select(ScenarioDefinition.code).where(
+                ScenarioDefinition.code.in_([data["code"] for data in SCENARIOS])
             )
         )
-        if result.scalar_one_or_none() is not None:
+    )
+    created = 0
+    for scenario_data in SCENARIOS:
+        if scenario_data["code"] in existing:
             continue
 
         scenario = ScenarioDefinition(
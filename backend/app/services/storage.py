@@ -6,12 +6,18 @@ Provides a pluggable storage backend. Default is local filesystem.
 No public access — files are served only through authenticated API endpoints.
 """
 
+import asyncio
 import os
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator
 from pathlib import Path
 
 
+class FileTooLargeError(ValueError):
+    """Raised by save_stream when the stream exceeds max_size bytes."""
+
+
 class StorageBackend(ABC):
     """Abstract storage backend for vault files."""
 
@@ -20,11 +26,53 @@ class StorageBackend(ABC):
         """Save file data. Returns the storage key."""
         ...
 
+    async def save_stream(
+        self,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        content_type: str,
+        *,
+        max_size: int | None = None,
+    ) -> int:
+        """Save file data from an async stream of chunks. Returns bytes written.
+
+        Raises FileTooLargeError (nothing stored) once max_size is exceeded.
+        Default buffers the chunks and calls save(); backends that can write
+        incrementally should override.
+        """
+        buf = bytearray()
+        async for chunk in chunks:
+            buf += chunk
+            if max_size is not None and len(buf) > max_size:
+                raise FileTooLargeError(key)
+        await self.save(key, bytes(buf), content_type)
+        return len(buf)
+
     @abstractmethod
     async def load(self, key: str) -> bytes:
         """Load file data by key. Raises FileNotFoundError if missing."""
         ...
 
+    async def open_stream(
+        self, key: str, chunk_size: int = 1 << 20
+    ) -> AsyncIterator[bytes]:
+        """Return an async iterator over the file in chunks.
+
+        Raises FileNotFoundError up front (not mid-iteration) if missing.
+        """
+        data = await self.load(key)
+
+        async def _chunks() -> AsyncIterator[bytes]:
+            view = memoryview(data)
+            for start in range(0, len(view), chunk_size):
+                yield bytes(view[start:start + chunk_size])
+
+        return _chunks()
+
+    def local_path(self, key: str) -> Path | None:
+        """Filesystem path for the key if the backend is disk-backed, else None."""
+        return None
+
     @abstractmethod
     async def delete(self, key: str) -> None:
         """Delete file by key. No-op if not found."""
@@ -40,7 +88,8 @@ class LocalStorageBackend(StorageBackend):
     """Local filesystem storage. Files stored in a private directory.
 
     Not suitable for production multi-server deployments,
-    but works for MVP single-server and testing.
+    but works for MVP single-server and testing. Blocking file calls run in
+    the default thread pool so the event loop keeps serving other requests.
     """
 
     def __init__(self, base_dir: str | None = None):
@@ -55,23 +104,47 @@ class LocalStorageBackend(StorageBackend):
         return self._base_dir / safe_key
 
     async def save(self, key: str, data: bytes, content_type: str) -> str:
-        path = self._path(key)
-        path.write_bytes(data)
+        await asyncio.to_thread(self._path(key).write_bytes, data)
         return key
 
-    async def load(self, key: str) -> bytes:
+    async def save_stream(
+        self,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        content_type: str,
+        *,
+        max_size: int | None = None,
+    ) -> int:
         path = self._path(key)
-        if not path.exists():
+        size = 0
+        f = await asyncio.to_thread(path.open, "wb")
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise FileTooLargeError(key)
+                await asyncio.to_thread(f.write, chunk)
+        except BaseException:
+            f.close()
+            await asyncio.to_thread(path.unlink, missing_ok=True)
+            raise
+        await asyncio.to_thread(f.close)
+        return size
+
+    async def load(self, key: str) -> bytes:
+        try:
+            return await asyncio.to_thread(self._path(key).read_bytes)
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {key}")
-        return path.read_bytes()
+
+    def local_path(self, key: str) -> Path | None:
+        return self._path(key)
 
     async def delete(self, key: str) -> None:
-        path = self._path(key)
-        if path.exists():
-            path.unlink()
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
 
     async def exists(self, key: str) -> bool:
-        return self._path(key).exists()
+        return await asyncio.to_thread(self._path(key).exists)
 
 
 class InMemoryStorageBackend(StorageBackend):
@@ -12,6 +12,8 @@ from decimal import Decimal
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.derived_views.cache import invalidate_user_views_on_commit
+from app.models.base import generate_uuid
 from app.models.category import Category
 from app.models.merchant import Merchant
 from app.models.transaction import Transaction, TransactionType
@@ -94,6 +96,7 @@ async def ingest_transaction(
         category_id = category.id if category else None
 
     txn = Transaction(
+        id=generate_uuid(),
         account_id=account_id,
         user_id=user_id,
         merchant_id=merchant.id,
@@ -109,7 +112,7 @@ async def ingest_transaction(
         provider_transaction_id=provider_transaction_id,
     )
     db.add(txn)
-    await db.flush()
+    invalidate_user_views_on_commit(db, user_id)
 
     await audit_service.log_event(
         db,
@@ -127,6 +130,8 @@ async def ingest_transaction(
         ip_address=ip_address,
     )
 
+    await db.flush()
+
     return txn
 
 
@@ -150,6 +155,7 @@ async def recategorize(
     old_category_id = txn.category_id
     txn.category_id = category_id
     await db.flush()
+    invalidate_user_views_on_commit(db, user_id)
 
     await audit_service.log_event(
         db,
@@ -8,15 +8,19 @@ Key rules:
 - delete_user_vault_items() hard-deletes DB rows + storage files (ship gate)
 """
 
+import asyncio
+import hashlib
 import uuid
+from collections.abc import AsyncIterable, AsyncIterator
 from datetime import datetime, timezone
+from pathlib import Path
 
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.vault import VaultItem, VaultItemType
 from app.services import audit_service
-from app.services.storage import generate_storage_key, get_storage
+from app.services.storage import FileTooLargeError, generate_storage_key, get_storage
 
 
 # Max file size: 10 MB
@@ -38,7 +42,7 @@ async def upload(
     user_id: uuid.UUID,
     filename: str,
     content_type: str,
-    data: bytes,
+    data: bytes | AsyncIterable[bytes],
     item_type: str = "receipt",
     description: str | None = None,
     transaction_id: uuid.UUID | None = None,
@@ -48,9 +52,12 @@ async def upload(
 
     Validates file size and content type.
     Stores file via storage backend and creates DB record.
+    `data` may be bytes or an async stream of chunks; a stream is written
+    through to storage without holding the whole file in memory.
     """
-    if len(data) > MAX_FILE_SIZE:
-        raise ValueError(f"File too large. Maximum size is {MAX_FILE_SIZE // (1024*1024)} MB.")
+    too_large = f"File too large. Maximum size is {MAX_FILE_SIZE // (1024*1024)} MB."
+    if isinstance(data, bytes) and len(data) > MAX_FILE_SIZE:
+        raise ValueError(too_large)
 
     if content_type not in ALLOWED_CONTENT_TYPES:
         raise ValueError(
@@ -70,7 +77,18 @@ async def upload(
     # Generate storage key and save file
     storage_key = generate_storage_key(user_id, filename)
     storage = get_storage()
-    await storage.save(storage_key, data, content_type)
+    digest = hashlib.sha256()
+    if isinstance(data, bytes):
+        digest.update(data)
+        await storage.save(storage_key, data, content_type)
+        file_size = len(data)
+    else:
+        try:
+            file_size = await storage.save_stream(
+                storage_key, _hashed(data, digest), content_type, max_size=MAX_FILE_SIZE
+            )
+        except FileTooLargeError:
+            raise ValueError(too_large)
 
     # Create DB record
     item = VaultItem(
@@ -78,10 +96,11 @@ async def upload(
         transaction_id=transaction_id,
         filename=filename,
         content_type=content_type,
-        file_size=len(data),
+        file_size=file_size,
         item_type=vault_type,
         storage_key=storage_key,
         description=description,
+        content_sha256=digest.hexdigest(),
     )
     db.add(item)
     await db.flush()
@@ -96,7 +115,7 @@ async def upload(
         detail={
             "filename": filename,
             "content_type": content_type,
-            "file_size": len(data),
+            "file_size": file_size,
             "item_type": vault_type.value,
         },
         ip_address=ip_address,
@@ -105,6 +124,13 @@ async def upload(
     return item
 
 
+async def _hashed(chunks: AsyncIterable[bytes], digest) -> AsyncIterator[bytes]:
+    """Pass chunks through, feeding each into `digest`."""
+    async for chunk in chunks:
+        digest.update(chunk)
+        yield chunk
+
+
 async def list_items(
     db: AsyncSession,
     *,
@@ -158,6 +184,28 @@ async def get_file_data(
     return item, data
 
 
+async def open_file(
+    db: AsyncSession,
+    *,
+    item_id: uuid.UUID,
+    user_id: uuid.UUID,
+) -> tuple[VaultItem, Path | AsyncIterator[bytes]]:
+    """Get vault item metadata and a source to stream the file from.
+
+    Disk-backed storage returns the file path (served with sendfile);
+    other backends return an async chunk iterator. Raises FileNotFoundError
+    before any bytes are sent if the file is missing.
+    """
+    item = await get_item(db, item_id=item_id, user_id=user_id)
+    storage = get_storage()
+    path = storage.local_path(item.storage_key)
+    if path is None:
+        return item, await storage.open_stream(item.storage_key)
+    if not await asyncio.to_thread(path.exists):
+        raise FileNotFoundError(f"File not found: {item.storage_key}")
+    return item, path
+
+
 async def link_to_transaction(
     db: AsyncSession,
     *,
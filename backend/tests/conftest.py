@@ -1,18 +1,24 @@
 """Shared test fixtures: in-memory SQLite DB, async session, test client."""
 
+import orjson
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.dependencies import get_db
+from app.dependencies import get_db, json_serializer
 from app.main import app
 from app.models.base import Base
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+test_engine = create_async_engine(
+    TEST_DATABASE_URL,
+    echo=False,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
+)
 
 
 # Enable foreign key enforcement in SQLite (off by default).
@@ -46,7 +52,9 @@ async def client(db_session: AsyncSession) -> AsyncClient:
     """Yield an httpx AsyncClient wired to the test DB."""
 
     async def _override_get_db():
+        # Commit like get_db does, so after-commit cache invalidation runs
         yield db_session
+        await db_session.commit()
 
     app.dependency_overrides[get_db] = _override_get_db
     transport = ASGITransport(app=app)
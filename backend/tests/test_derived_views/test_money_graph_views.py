@@ -1,5 +1,6 @@
 """Tests for derived views: UI reads only these, never raw provider data."""
 
+import uuid
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
@@ -8,9 +9,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.derived_views.money_graph import (
     account_summary_view,
+    get_transaction_view,
     money_graph_summary_view,
     recurring_patterns_view,
     transaction_list_view,
+    transaction_single_view,
 )
 from app.models.account import Account, AccountType
 from app.models.transaction import TransactionType
@@ -88,6 +91,35 @@ async def test_transaction_list_resolves_names(db_session: AsyncSession):
     assert "provider_transaction_id" not in v
 
 
+@pytest.mark.asyncio
+async def test_transaction_single_view_matches_list(db_session: AsyncSession):
+    """Single-row view of a just-ingested transaction matches its list entry."""
+    user, acct = await _setup(db_session)
+
+    txn = await transaction_service.ingest_transaction(
+        db_session,
+        account_id=acct.id,
+        user_id=user.id,
+        raw_description="STARBUCKS #1234 NYC",
+        amount=Decimal("5.75"),
+        transaction_type=TransactionType.debit,
+        transaction_date=datetime.now(timezone.utc),
+    )
+
+    single = await transaction_single_view(db_session, txn)
+    assert single["merchant_name"] == "Starbucks"
+    assert single["category_name"] == "Dining"
+
+    await db_session.commit()
+    # Compare against the stored row (SQLite drops tzinfo on read)
+    await db_session.refresh(txn)
+    single = await transaction_single_view(db_session, txn)
+    views = await transaction_list_view(db_session, user.id)
+    assert views == [single]
+    assert await get_transaction_view(db_session, user.id, txn.id) == single
+    assert await get_transaction_view(db_session, uuid.uuid4(), txn.id) is None
+
+
 @pytest.mark.asyncio
 async def test_recurring_patterns_expose_confidence(db_session: AsyncSession):
     """Recurring view exposes confidence + assumptions."""
@@ -160,3 +192,36 @@ async def test_money_graph_summary(db_session: AsyncSession):
     assert "monthly_spending" in summary
     assert "top_categories" in summary
     assert "top_merchants" in summary
+
+
+@pytest.mark.asyncio
+async def test_money_graph_summary_aggregates(db_session: AsyncSession):
+    """Summary totals and top merchants are aggregated per period."""
+    user, acct = await _setup(db_session)
+
+    now = datetime.now(timezone.utc)
+    for raw, amount, txn_type in [
+        ("STARBUCKS #1", "5.00", TransactionType.debit),
+        ("STARBUCKS #2", "4.50", TransactionType.debit),
+        ("NETFLIX", "15.99", TransactionType.debit),
+        ("PAYROLL DEPOSIT", "2000.00", TransactionType.credit),
+    ]:
+        await transaction_service.ingest_transaction(
+            db_session,
+            account_id=acct.id,
+            user_id=user.id,
+            raw_description=raw,
+            amount=Decimal(amount),
+            transaction_type=txn_type,
+            transaction_date=now,
+        )
+    await db_session.commit()
+
+    summary = await money_graph_summary_view(db_session, user.id)
+
+    assert Decimal(summary["monthly_income"]) == Decimal("2000.00")
+    assert Decimal(summary["monthly_spending"]) == Decimal("25.49")
+    merchants = {m["name"]: Decimal(m["total_spent"]) for m in summary["top_merchants"]}
+    assert len(merchants) == 2
+    assert Decimal("15.99") in merchants.values()
+    assert Decimal("9.50") in merchants.values()
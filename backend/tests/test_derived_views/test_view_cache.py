@@ -0,0 +1,46 @@
+"""Derived view caches: dropped only once the writing transaction commits, bounded per user."""
+
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.derived_views.cache import (
+    MAX_TRANSACTION_PAGES_PER_USER,
+    invalidate_user_views_on_commit,
+    summary_cache,
+    transaction_pages,
+)
+
+
+async def test_views_invalidated_after_commit(db_session: AsyncSession):
+    user_id = uuid.uuid4()
+    summary_cache.set(user_id, "stale")
+
+    invalidate_user_views_on_commit(db_session, user_id)
+    assert summary_cache.get(user_id) == "stale"
+
+    await db_session.commit()
+    assert summary_cache.get(user_id) is None
+
+
+async def test_rollback_discards_pending_invalidation(db_session: AsyncSession):
+    user_id = uuid.uuid4()
+    await db_session.execute(select(1))  # a write's transaction is open
+    invalidate_user_views_on_commit(db_session, user_id)
+    await db_session.rollback()
+
+    summary_cache.set(user_id, "current")
+    await db_session.commit()
+    assert summary_cache.get(user_id) == "current"
+
+
+def test_transaction_pages_bounded_per_user():
+    user_id = uuid.uuid4()
+    pages = transaction_pages(user_id)
+    for offset in range(MAX_TRANSACTION_PAGES_PER_USER + 10):
+        pages.set((None, 100, offset, None), [])
+
+    assert transaction_pages(user_id) is pages
+    assert pages.get((None, 100, 0, None)) is None
+    assert pages.get((None, 100, MAX_TRANSACTION_PAGES_PER_USER + 9, None)) == []
@@ -1,6 +1,10 @@
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from starlette.responses import PlainTextResponse
 
+from app.core.middleware import BodySizeLimitMiddleware, DBSessionMiddleware
+from app.dependencies import AsyncScopedSession, release_connection
 from app.main import app
 
 
@@ -28,3 +32,68 @@ async def test_404_returns_structured_json():
     assert data["error"] is True
     assert data["status_code"] == 404
     assert "request_id" in data
+
+
+@pytest.mark.asyncio
+async def test_large_json_responses_gzipped():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.json()["openapi"]
+
+        resp = await client.get("/health", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+
+
+@pytest.mark.asyncio
+async def test_db_session_scoped_per_request():
+    """One session per request, released when the request finishes."""
+    sessions = []
+
+    async def endpoint(scope, receive, send):
+        sessions.append(AsyncScopedSession())
+        sessions.append(AsyncScopedSession())
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    transport = ASGITransport(app=DBSessionMiddleware(endpoint))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/")
+        await client.get("/")
+
+    assert sessions[0] is sessions[1]
+    assert sessions[2] is sessions[3]
+    assert sessions[0] is not sessions[2]
+    assert not AsyncScopedSession.registry.registry
+
+
+def test_db_session_requires_request_scope():
+    with pytest.raises(RuntimeError):
+        AsyncScopedSession()
+
+
+@pytest.mark.asyncio
+async def test_release_connection_ends_transaction(db_session):
+    await db_session.execute(text("SELECT 1"))
+    assert db_session.in_transaction()
+    await release_connection(db_session)
+    assert not db_session.in_transaction()
+
+
+@pytest.mark.asyncio
+async def test_body_size_limit_rejects_by_content_length():
+    async def endpoint(scope, receive, send):
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    limited = BodySizeLimitMiddleware(endpoint, limits={"/upload": 10})
+    transport = ASGITransport(app=limited)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.post("/upload", content=b"x" * 11)
+        assert resp.status_code == 413
+        assert resp.json()["status_code"] == 413
+
+        resp = await client.post("/upload", content=b"x" * 10)
+        assert resp.status_code == 200
+
+        resp = await client.post("/other", content=b"x" * 11)
+        assert resp.status_code == 200
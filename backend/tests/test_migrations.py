@@ -0,0 +1,108 @@
+"""Alembic revisions bring a create_all-built database from before them up to date."""
+
+from pathlib import Path
+
+import pytest
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, select, text
+
+from app.models.base import Base
+from app.models.category import Category
+
+ALEMBIC_INI = Path(__file__).resolve().parents[1] / "alembic.ini"
+
+
+def _upgrade(conn) -> None:
+    """Run every revision's upgrade() in order on `conn`."""
+    script = ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+    with Operations.context(MigrationContext.configure(conn)):
+        for revision in reversed(list(script.walk_revisions())):
+            revision.module.upgrade()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    yield engine
+    engine.dispose()
+
+
+def test_upgrade_is_a_noop_on_a_fresh_schema(engine):
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        _upgrade(conn)
+    with engine.begin() as conn:
+        _upgrade(conn)
+
+
+def test_upgrade_merges_duplicate_system_categories(engine):
+    categories = Category.__table__
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        conn.execute(text("DROP INDEX uq_categories_system_name"))
+        first, second = (
+            conn.execute(
+                categories.insert().returning(categories.c.id),
+                {"name": "Groceries", "is_system": True},
+            ).scalar_one()
+            for _ in range(2)
+        )
+        conn.execute(
+            categories.insert(), {"name": "Snacks", "is_system": False, "parent_id": second}
+        )
+
+        _upgrade(conn)
+
+        rows = conn.execute(
+            select(categories.c.id).where(categories.c.name == "Groceries")
+        ).scalars().all()
+        assert rows == [first]
+        child_parent = conn.execute(
+            select(categories.c.parent_id).where(categories.c.name == "Snacks")
+        ).scalar_one()
+        assert child_parent == first
+        indexes = {ix["name"] for ix in inspect(conn).get_indexes("categories")}
+        assert "uq_categories_system_name" in indexes
+
+
+def test_upgrade_adds_vault_sha256_and_transaction_index(engine):
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        conn.execute(text("DROP INDEX ix_transactions_user_date_id"))
+        conn.execute(text("ALTER TABLE vault_items DROP COLUMN content_sha256"))
+
+        _upgrade(conn)
+
+        inspector = inspect(conn)
+        columns = {column["name"] for column in inspector.get_columns("vault_items")}
+        assert "content_sha256" in columns
+        indexes = {ix["name"] for ix in inspector.get_indexes("transactions")}
+        assert "ix_transactions_user_date_id" in indexes
+
+
+def test_upgrade_adds_bill_and_audit_indexes(engine):
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        conn.execute(text("DROP INDEX ix_recurring_patterns_user_active_amount"))
+        conn.execute(text("DROP INDEX ix_audit_log_events_entity_timestamp"))
+        conn.execute(text("DROP INDEX ix_audit_log_events_user_timestamp_id"))
+        conn.execute(
+            text("CREATE INDEX ix_audit_log_events_user_timestamp "
+                 "ON audit_log_events (user_id, timestamp)")
+        )
+
+        _upgrade(conn)
+
+        inspector = inspect(conn)
+        assert "ix_recurring_patterns_user_active_amount" in {
+            ix["name"] for ix in inspector.get_indexes("recurring_patterns")
+        }
+        audit_indexes = {ix["name"] for ix in inspector.get_indexes("audit_log_events")}
+        assert {
+            "ix_audit_log_events_entity_timestamp",
+            "ix_audit_log_events_user_timestamp_id",
+        } <= audit_indexes
+        assert "ix_audit_log_events_user_timestamp" not in audit_indexes
@@ -2,7 +2,7 @@
 
 Verifies that the coach endpoint safely handles:
 1. Unknown/malicious context_type strings (graceful degradation)
-2. Invalid mode values (rejected with 400)
+2. Invalid mode values (rejected with 422 by request validation)
 3. Invalid UUID context_id (rejected with 400)
 4. Missing required fields for explain/execute (rejected with 400)
 5. Injection attempts in free-text fields (no execution)
@@ -124,14 +124,14 @@ async def test_execute_unknown_context_type_graceful(
 async def test_invalid_mode_rejected(
     client: AsyncClient, db_session: AsyncSession, bad_mode: str
 ):
-    """Invalid modes are rejected with 400."""
+    """Invalid modes are rejected with 422."""
     headers = await _register_and_login(client)
     resp = await client.post(
         "/coach",
         headers=headers,
         json={"mode": bad_mode},
     )
-    assert resp.status_code == 400
+    assert resp.status_code == 422
 
 
 # --- Red-team: Invalid UUID context_id ---
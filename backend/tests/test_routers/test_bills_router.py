@@ -234,6 +234,30 @@ async def test_bill_summary(client: AsyncClient, db_session: AsyncSession):
     assert data["manual_count"] == 2
 
 
+@pytest.mark.asyncio
+async def test_bill_summary_refreshes_after_writes(client: AsyncClient, db_session: AsyncSession):
+    """Cached summary is dropped when a bill is created or toggled."""
+    headers, _ = await _register_and_login(client)
+
+    resp = await client.get("/bills/summary", headers=headers)
+    assert resp.json()["total_bills"] == 0
+
+    create = await client.post("/bills", json={
+        "label": "Rent", "estimated_amount": "900.00",
+        "frequency": "monthly", "next_expected_date": _future_date(),
+    }, headers=headers)
+    resp = await client.get("/bills/summary", headers=headers)
+    assert resp.json()["total_bills"] == 1
+    assert resp.json()["essential_count"] == 0
+
+    await client.post(
+        f"/bills/{create.json()['id']}/essential",
+        json={"is_essential": True}, headers=headers,
+    )
+    resp = await client.get("/bills/summary", headers=headers)
+    assert resp.json()["essential_count"] == 1
+
+
 @pytest.mark.asyncio
 async def test_bill_summary_empty(client: AsyncClient, db_session: AsyncSession):
     headers, _ = await _register_and_login(client)
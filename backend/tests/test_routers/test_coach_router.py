@@ -170,8 +170,8 @@ async def test_invalid_mode(client: AsyncClient, db_session: AsyncSession):
         json={"mode": "chat"},
         headers=headers,
     )
-    assert resp.status_code == 400
-    assert "Mode must be one of" in resp.json()["detail"]
+    assert resp.status_code == 422
+    assert resp.json()["errors"][0]["loc"] == ["body", "mode"]
 
 
 @pytest.mark.asyncio
@@ -285,6 +285,25 @@ async def test_get_memory_with_consent(client: AsyncClient, db_session: AsyncSes
     assert data["aggressiveness"] == "moderate"  # default
 
 
+@pytest.mark.asyncio
+async def test_get_memory_etag(client: AsyncClient, db_session: AsyncSession):
+    """GET /coach/memory returns 304 until preferences change."""
+    headers, user_id = await _register_and_login(client)
+    await _grant_consent(db_session, user_id, ConsentType.ai_memory)
+    await client.put("/coach/memory", json={"tone": "direct"}, headers=headers)
+
+    resp = await client.get("/coach/memory", headers=headers)
+    etag = resp.headers["ETag"]
+
+    resp = await client.get("/coach/memory", headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 304
+
+    await client.put("/coach/memory", json={"tone": "neutral"}, headers=headers)
+    resp = await client.get("/coach/memory", headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["tone"] == "neutral"
+
+
 @pytest.mark.asyncio
 async def test_put_memory_invalid_tone(client: AsyncClient, db_session: AsyncSession):
     """PUT /coach/memory rejects invalid tone value."""
@@ -69,11 +69,11 @@ async def test_consent_status(client: AsyncClient):
 
 @pytest.mark.asyncio
 async def test_invalid_consent_type(client: AsyncClient):
-    """POST /consent/grant with invalid consent_type returns 400."""
+    """POST /consent/grant with invalid consent_type returns 422."""
     token = await _register_and_login(client, "invalid-r@example.com")
     response = await client.post(
         "/consent/grant",
         json={"consent_type": "invalid_type"},
         headers={"X-Session-Token": token},
     )
-    assert response.status_code == 400
+    assert response.status_code == 422
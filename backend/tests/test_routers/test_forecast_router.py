@@ -1,5 +1,7 @@
 """Phase 4 router tests: forecast endpoints."""
 
+import json
+
 import pytest
 from decimal import Decimal
 from httpx import AsyncClient
@@ -109,6 +111,28 @@ async def test_get_latest_forecast_none(client: AsyncClient, db_session: AsyncSe
     assert resp.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_get_latest_forecast_refreshed_after_compute(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Cached latest snapshot is dropped when a new forecast is computed."""
+    headers, user_id = await _register_and_login(client)
+    acct = await _create_account(db_session, user_id)
+
+    first = (await client.post("/forecast/compute", headers=headers)).json()
+    resp = await client.get("/forecast/latest", headers=headers)
+    assert resp.json()["id"] == first["id"]
+
+    acct.available_balance = Decimal("100.00")
+    await db_session.flush()
+    second = (await client.post("/forecast/compute", headers=headers)).json()
+
+    resp = await client.get("/forecast/latest", headers=headers)
+    assert resp.json()["id"] == second["id"]
+    resp = await client.get("/forecast/summary", headers=headers)
+    assert Decimal(resp.json()["safe_to_spend_today"]) == Decimal("100.00")
+
+
 # --- Summary ---
 
 @pytest.mark.asyncio
@@ -158,6 +182,24 @@ async def test_get_forecast_history(client: AsyncClient, db_session: AsyncSessio
     assert len(data) == 2
 
 
+@pytest.mark.asyncio
+async def test_stream_forecast_history_ndjson(client: AsyncClient, db_session: AsyncSession):
+    headers, user_id = await _register_and_login(client)
+    await _create_account(db_session, user_id)
+
+    await client.post("/forecast/compute", headers=headers)
+    await client.post("/forecast/compute", headers=headers)
+    await client.post("/forecast/compute", headers=headers)
+
+    resp = await client.get("/forecast/history.ndjson?limit=2", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(lines) == 2
+    assert "safe_to_spend_today" in lines[0]
+    assert "daily_balances" not in lines[0]
+
+
 @pytest.mark.asyncio
 async def test_get_forecast_history_empty(client: AsyncClient, db_session: AsyncSession):
     headers, _ = await _register_and_login(client)
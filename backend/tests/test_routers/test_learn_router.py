@@ -1,5 +1,7 @@
 """Phase 7 router tests: /learn endpoints."""
 
+import json
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -150,6 +152,51 @@ async def test_list_progress(client: AsyncClient, db_session: AsyncSession):
     assert len(resp.json()) == 1
 
 
+@pytest.mark.asyncio
+async def test_list_lessons_etag(client: AsyncClient, db_session: AsyncSession):
+    """GET /learn/lessons revalidates with If-None-Match -> 304."""
+    headers = await _register_and_login(client)
+    await seed_lessons(db_session)
+
+    resp = await client.get("/learn/lessons", headers=headers)
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert resp.headers["Cache-Control"] == "private, no-cache"
+
+    resp = await client.get(
+        "/learn/lessons", headers={**headers, "If-None-Match": etag}
+    )
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+    resp = await client.get(
+        "/learn/lessons?category=save_money", headers={**headers, "If-None-Match": etag}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_stream_progress_ndjson(client: AsyncClient, db_session: AsyncSession):
+    """GET /learn/progress.ndjson streams one progress record per line."""
+    headers = await _register_and_login(client)
+    await seed_lessons(db_session)
+
+    resp = await client.get("/learn/lessons", headers=headers)
+    lesson_id = resp.json()[0]["id"]
+    await client.post(
+        "/learn/start", json={"lesson_id": lesson_id}, headers=headers,
+    )
+
+    resp = await client.get("/learn/progress.ndjson", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(lines) == 1
+    assert lines[0]["lesson_id"] == lesson_id
+
+
 @pytest.mark.asyncio
 async def test_get_progress_for_lesson(client: AsyncClient, db_session: AsyncSession):
     """GET /learn/progress/{id} returns progress for specific lesson."""
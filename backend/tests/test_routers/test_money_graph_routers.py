@@ -3,6 +3,7 @@
 All endpoints return derived views only — no raw provider data leaked.
 """
 
+import uuid
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -129,6 +130,85 @@ async def test_create_and_list_transactions(client: AsyncClient, db_session: Asy
     assert len(txns) == 1
 
 
+@pytest.mark.asyncio
+async def test_list_transactions_cursor_pagination(
+    client: AsyncClient, db_session: AsyncSession
+):
+    await _seed_categories(db_session)
+    token = await _auth(client, "cursor-rt@example.com")
+    headers = {"X-Session-Token": token}
+
+    resp = await client.post(
+        "/accounts/manual",
+        json={
+            "account_type": "checking",
+            "institution_name": "Chase",
+            "account_name": "Main",
+        },
+        headers=headers,
+    )
+    account_id = resp.json()["id"]
+    now = datetime.now(timezone.utc)
+    for days_ago in range(3):
+        await client.post(
+            "/transactions",
+            json={
+                "account_id": account_id,
+                "raw_description": f"COFFEE {days_ago}",
+                "amount": "3.00",
+                "transaction_type": "debit",
+                "transaction_date": (now - timedelta(days=days_ago)).isoformat(),
+            },
+            headers=headers,
+        )
+
+    resp = await client.get("/transactions?limit=2", headers=headers)
+    first = resp.json()
+    assert [t["raw_description"] for t in first] == ["COFFEE 0", "COFFEE 1"]
+    cursor = resp.headers["x-next-cursor"]
+
+    resp = await client.get(f"/transactions?limit=2&cursor={cursor}", headers=headers)
+    assert [t["raw_description"] for t in resp.json()] == ["COFFEE 2"]
+    assert "x-next-cursor" not in resp.headers
+
+    resp = await client.get("/transactions?cursor=not-a-cursor", headers=headers)
+    assert resp.status_code == 400
+
+    for query in ("limit=0", "limit=501", "offset=-1"):
+        resp = await client.get(f"/transactions?{query}", headers=headers)
+        assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_invalid_enum_values_rejected(client: AsyncClient, db_session: AsyncSession):
+    token = await _auth(client, "enum-rt@example.com")
+    headers = {"X-Session-Token": token}
+
+    resp = await client.post(
+        "/accounts/manual",
+        json={
+            "account_type": "brokerage",
+            "institution_name": "Chase",
+            "account_name": "Main",
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 422
+
+    resp = await client.post(
+        "/transactions",
+        json={
+            "account_id": str(uuid.uuid4()),
+            "raw_description": "STARBUCKS #1",
+            "amount": "5.00",
+            "transaction_type": "refund",
+            "transaction_date": datetime.now(timezone.utc).isoformat(),
+        },
+        headers=headers,
+    )
+    assert resp.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_recategorize_transaction(client: AsyncClient, db_session: AsyncSession):
     await _seed_categories(db_session)
@@ -161,6 +241,10 @@ async def test_recategorize_transaction(client: AsyncClient, db_session: AsyncSe
     )
     txn_id = resp.json()["id"]
 
+    # Prime the cached transaction page
+    resp = await client.get("/transactions", headers=headers)
+    assert resp.json()[0]["category_name"] == "Dining"
+
     # Get groceries category ID
     cats = await category_service.get_system_categories(db_session)
     groceries = next(c for c in cats if c.name == "Groceries")
@@ -174,6 +258,10 @@ async def test_recategorize_transaction(client: AsyncClient, db_session: AsyncSe
     assert resp.status_code == 200
     assert resp.json()["category_name"] == "Groceries"
 
+    # Cached page was dropped by the write
+    resp = await client.get("/transactions", headers=headers)
+    assert resp.json()[0]["category_name"] == "Groceries"
+
 
 @pytest.mark.asyncio
 async def test_detect_and_list_recurring(client: AsyncClient, db_session: AsyncSession):
@@ -254,3 +342,36 @@ async def test_money_graph_summary(client: AsyncClient, db_session: AsyncSession
     assert "top_categories" in data
     assert "top_merchants" in data
     assert "assumptions" in data
+
+
+@pytest.mark.asyncio
+async def test_money_graph_summary_refreshed_after_write(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Cached summary is dropped when the user's balances change."""
+    token = await _auth(client, "summary-cache@example.com")
+    headers = {"X-Session-Token": token}
+
+    resp = await client.post(
+        "/accounts/manual",
+        json={
+            "account_type": "checking",
+            "institution_name": "Chase",
+            "account_name": "Main",
+            "current_balance": "3000.00",
+        },
+        headers=headers,
+    )
+    account_id = resp.json()["id"]
+
+    resp = await client.get("/money-graph/summary", headers=headers)
+    assert resp.json()["total_balance"] == "3000.00"
+
+    await client.patch(
+        f"/accounts/{account_id}/balance",
+        json={"current_balance": "1200.00"},
+        headers=headers,
+    )
+
+    resp = await client.get("/money-graph/summary", headers=headers)
+    assert resp.json()["total_balance"] == "1200.00"
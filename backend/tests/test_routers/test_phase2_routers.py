@@ -304,4 +304,4 @@ async def test_coach_invalid_mode(client: AsyncClient, db_session: AsyncSession)
         },
         headers=headers,
     )
-    assert resp.status_code == 400
+    assert resp.status_code == 422
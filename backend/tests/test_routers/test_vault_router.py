@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.storage import InMemoryStorageBackend, set_storage
+from app.services.storage import InMemoryStorageBackend, LocalStorageBackend, set_storage
 
 
 @pytest.fixture(autouse=True)
@@ -96,7 +96,14 @@ async def test_list_items(client: AsyncClient, db_session: AsyncSession):
 
     resp = await client.get("/vault", headers=headers)
     assert resp.status_code == 200
-    assert len(resp.json()) == 2
+    items = resp.json()
+    assert len(items) == 2
+    assert set(items[0]) == {
+        "id", "user_id", "transaction_id", "filename", "content_type",
+        "file_size", "item_type", "description", "uploaded_at",
+    }
+    assert {i["filename"] for i in items} == {"f1.jpg", "f2.jpg"}
+    assert items[0]["item_type"] == "receipt"
 
 
 @pytest.mark.asyncio
@@ -151,9 +158,101 @@ async def test_download_file(client: AsyncClient, db_session: AsyncSession):
     assert resp.status_code == 200
     assert resp.content == b"real file content"
     assert resp.headers["content-type"] == "image/jpeg"
+    assert resp.headers["content-length"] == str(len(b"real file content"))
     assert "attachment" in resp.headers["content-disposition"]
 
 
+@pytest.mark.asyncio
+async def test_download_pdf_not_gzipped(client: AsyncClient, db_session: AsyncSession):
+    """PDF downloads bypass gzip, keeping Content-Length and the identity ETag."""
+    headers = await _register_and_login(client)
+    data = b"%PDF-1.7 " + b"0" * 4096
+    uploaded = await _upload_file(
+        client, headers, filename="statement.pdf", content_type="application/pdf", data=data
+    )
+
+    resp = await client.get(
+        f"/vault/{uploaded['id']}/download",
+        headers={**headers, "Accept-Encoding": "gzip"},
+    )
+    assert resp.status_code == 200
+    assert "content-encoding" not in resp.headers
+    assert resp.headers["content-length"] == str(len(data))
+    assert resp.content == data
+
+
+@pytest.mark.asyncio
+async def test_download_etag(client: AsyncClient, db_session: AsyncSession):
+    """Download carries a content-hash ETag; a matching If-None-Match gets 304."""
+    import hashlib
+
+    headers = await _register_and_login(client)
+    uploaded = await _upload_file(client, headers, data=b"cache me")
+    url = f"/vault/{uploaded['id']}/download"
+
+    resp = await client.get(url, headers=headers)
+    assert resp.headers["etag"] == f'"{hashlib.sha256(b"cache me").hexdigest()}"'
+    assert "immutable" in resp.headers["cache-control"]
+
+    resp = await client.get(url, headers={**headers, "If-None-Match": resp.headers["etag"]})
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+
+@pytest.mark.asyncio
+async def test_get_item_etag(client: AsyncClient, db_session: AsyncSession):
+    """Item metadata is revalidated by ETag."""
+    headers = await _register_and_login(client)
+    uploaded = await _upload_file(client, headers)
+    url = f"/vault/{uploaded['id']}"
+
+    resp = await client.get(url, headers=headers)
+    assert resp.status_code == 200
+    etag = resp.headers["etag"]
+
+    resp = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_download_file_local_storage(
+    client: AsyncClient, db_session: AsyncSession, tmp_path
+):
+    """Disk-backed downloads are served straight from the stored file."""
+    set_storage(LocalStorageBackend(base_dir=str(tmp_path)))
+    headers = await _register_and_login(client)
+    uploaded = await _upload_file(client, headers, data=b"on disk")
+
+    resp = await client.get(f"/vault/{uploaded['id']}/download", headers=headers)
+    assert resp.status_code == 200
+    assert resp.content == b"on disk"
+    assert resp.headers["content-type"] == "image/jpeg"
+    assert resp.headers["content-disposition"] == 'attachment; filename="receipt.jpg"'
+
+    resp = await client.get(
+        f"/vault/{uploaded['id']}/download",
+        headers={**headers, "If-None-Match": resp.headers["etag"]},
+    )
+    assert resp.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_invalid_ids_rejected(client: AsyncClient, db_session: AsyncSession):
+    """Malformed UUIDs in path, query and body fail validation (422)."""
+    headers = await _register_and_login(client)
+    resp = await client.get("/vault/not-a-uuid", headers=headers)
+    assert resp.status_code == 422
+    resp = await client.get("/vault?transaction_id=not-a-uuid", headers=headers)
+    assert resp.status_code == 422
+    uploaded = await _upload_file(client, headers)
+    resp = await client.post(
+        f"/vault/{uploaded['id']}/link-transaction",
+        headers=headers,
+        json={"transaction_id": "not-a-uuid"},
+    )
+    assert resp.status_code == 422
+
+
 async def _create_transaction(db_session: AsyncSession, user_id: uuid.UUID) -> str:
     """Create a real transaction for FK-safe linking tests."""
     from sqlalchemy import select
@@ -1,6 +1,7 @@
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.account import AccountType
@@ -96,6 +97,61 @@ async def test_create_linked_account(db_session: AsyncSession):
     assert acct.last_synced_at is not None
 
 
+@pytest.mark.asyncio
+async def test_bulk_create_linked_accounts(db_session: AsyncSession):
+    user = await _create_user(db_session)
+    conn = Connection(
+        user_id=user.id,
+        provider="plaid",
+        provider_connection_id="conn_456",
+        status=ConnectionStatus.active,
+    )
+    db_session.add(conn)
+    await db_session.commit()
+    await db_session.refresh(conn)
+
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        accounts = await account_service.bulk_create_linked_accounts(
+            db_session,
+            user_id=user.id,
+            connection_id=conn.id,
+            accounts=[
+                {
+                    "account_type": AccountType.checking,
+                    "institution_name": "BoA",
+                    "account_name": "Checking",
+                    "current_balance": Decimal("250.00"),
+                },
+                {
+                    "account_type": AccountType.credit_card,
+                    "institution_name": "BoA",
+                    "account_name": "Visa",
+                },
+            ],
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    await db_session.commit()
+
+    # Both rows go out in one batched statement, not one INSERT per account
+    assert sum(s.startswith("INSERT INTO accounts") for s in statements) == 1
+    assert [a.account_name for a in accounts] == ["Checking", "Visa"]
+    assert all(a.connection_id == conn.id and a.last_synced_at for a in accounts)
+    assert accounts[1].current_balance == Decimal("0.00")
+
+    events = await audit_service.get_events_for_user(
+        db_session, user.id, event_type="account.created"
+    )
+    assert {e.entity_id for e in events} == {a.id for a in accounts}
+
+
 @pytest.mark.asyncio
 async def test_get_accounts(db_session: AsyncSession):
     user = await _create_user(db_session)
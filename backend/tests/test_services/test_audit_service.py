@@ -61,6 +61,34 @@ async def test_get_events_for_user_returns_all(db_session: AsyncSession):
         assert evt.event_type == f"test.event.{i}"
 
 
+@pytest.mark.asyncio
+async def test_get_events_for_user_keyset_pages(db_session: AsyncSession):
+    """Paging with `after` walks every event exactly once, in order."""
+    user = await _create_user(db_session)
+
+    for i in range(5):
+        await audit_service.log_event(
+            db_session,
+            user_id=user.id,
+            event_type=f"test.event.{i}",
+            entity_type="TestEntity",
+            entity_id=uuid.uuid4(),
+            action="test",
+        )
+    await db_session.commit()
+
+    first = await audit_service.get_events_for_user(db_session, user.id, limit=2)
+    second = await audit_service.get_events_for_user(
+        db_session, user.id, limit=2, after=audit_service.event_cursor(first[-1])
+    )
+    rest = await audit_service.get_events_for_user(
+        db_session, user.id, limit=2, after=audit_service.event_cursor(second[-1])
+    )
+
+    paged = [e.event_type for e in first + second + rest]
+    assert paged == [f"test.event.{i}" for i in range(5)]
+
+
 @pytest.mark.asyncio
 async def test_get_events_with_filters(db_session: AsyncSession):
     """Filter by event_type and entity_type."""
@@ -136,6 +164,11 @@ async def test_reconstruct_why(db_session: AsyncSession):
     assert chain[0].action == "grant"
     assert chain[1].action == "revoke"
 
+    streamed = [
+        event async for event in audit_service.stream_why(db_session, "ConsentRecord", entity_id)
+    ]
+    assert [e.id for e in streamed] == [e.id for e in chain]
+
 
 @pytest.mark.asyncio
 async def test_no_delete_pathway(db_session: AsyncSession):
@@ -1,5 +1,7 @@
 """Bill service tests: derived views, manual bills, essential toggle, summary."""
 
+import uuid
+
 import pytest
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
@@ -243,6 +245,26 @@ async def test_toggle_essential_audit_logged(db_session: AsyncSession):
     )
     events = result.scalars().all()
     assert len(events) == 1
+    assert events[0].detail["old_value"] is False
+
+
+@pytest.mark.asyncio
+async def test_toggle_essential_unchanged_and_missing(db_session: AsyncSession):
+    """Setting the current value is a no-op; an unknown bill raises."""
+    from sqlalchemy.exc import NoResultFound
+
+    user = await _create_user(db_session)
+    pattern = await _create_detected_pattern(db_session, user, is_essential=True)
+
+    updated = await bill_service.toggle_essential(
+        db_session, bill_id=pattern.id, user_id=user.id, is_essential=True,
+    )
+    assert updated.is_essential is True
+
+    with pytest.raises(NoResultFound):
+        await bill_service.toggle_essential(
+            db_session, bill_id=uuid.uuid4(), user_id=user.id, is_essential=True,
+        )
 
 
 # --- Update bill ---
@@ -284,6 +306,33 @@ async def test_update_bill_amount(db_session: AsyncSession):
     assert updated.estimated_amount == Decimal("1600.00")
 
 
+@pytest.mark.asyncio
+async def test_update_bill_unchanged_is_noop(db_session: AsyncSession):
+    """Re-sending current values writes no audit event."""
+    from sqlalchemy import select
+    from app.models.audit import AuditLogEvent
+
+    user = await _create_user(db_session)
+    now = datetime.now(timezone.utc)
+
+    bill = await bill_service.create_manual_bill(
+        db_session, user_id=user.id, label="Gym",
+        estimated_amount=Decimal("40.00"), frequency="monthly",
+        next_expected_date=now + timedelta(days=5),
+    )
+
+    updated = await bill_service.update_bill(
+        db_session, bill_id=bill.id, user_id=user.id,
+        label="Gym", estimated_amount=Decimal("40.00"), frequency="monthly",
+    )
+    assert updated.label == "Gym"
+
+    result = await db_session.execute(
+        select(AuditLogEvent).where(AuditLogEvent.event_type == "bill.updated")
+    )
+    assert result.scalars().all() == []
+
+
 # --- Deactivate ---
 
 @pytest.mark.asyncio
@@ -341,3 +390,42 @@ async def test_bill_summary_empty(db_session: AsyncSession):
 
     assert summary["total_bills"] == 0
     assert summary["total_monthly_estimate"] == Decimal("0.00")
+
+
+@pytest.mark.asyncio
+async def test_bill_summary_rounds_half_to_even(db_session: AsyncSession):
+    """A total ending in exactly half a cent rounds to the even cent."""
+    user = await _create_user(db_session)
+    await bill_service.create_manual_bill(
+        db_session, user_id=user.id, label="Water",
+        estimated_amount=Decimal("10.50"), frequency="quarterly",
+        next_expected_date=datetime.now(timezone.utc) + timedelta(days=5),
+    )
+
+    summary = await bill_service.get_bill_summary(db_session, user.id)
+
+    # 10.50 * 0.33 = 3.465
+    assert summary["total_monthly_estimate"] == Decimal("3.46")
+
+
+@pytest.mark.asyncio
+async def test_bill_summary_normalizes_frequencies(db_session: AsyncSession):
+    """Monthly estimate matches per-bill normalization across frequencies."""
+    user = await _create_user(db_session)
+    now = datetime.now(timezone.utc)
+
+    for frequency, amount in [
+        ("weekly", "10.01"), ("biweekly", "7.77"),
+        ("quarterly", "33.33"), ("annual", "99.99"),
+    ]:
+        await bill_service.create_manual_bill(
+            db_session, user_id=user.id, label=frequency,
+            estimated_amount=Decimal(amount), frequency=frequency,
+            next_expected_date=now + timedelta(days=5),
+        )
+
+    summary = await bill_service.get_bill_summary(db_session, user.id)
+
+    # 43.3433 + 16.8609 + 10.9989 + 8.29917, summed, then rounded to cents
+    assert summary["total_monthly_estimate"] == Decimal("79.50")
+    assert summary["total_bills"] == 4
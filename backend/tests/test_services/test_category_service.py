@@ -0,0 +1,48 @@
+"""Category service tests: system category seeding."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.category import SYSTEM_CATEGORIES
+from app.models.user import User
+from app.services import category_service
+
+
+@pytest.mark.asyncio
+async def test_seed_system_categories(db_session: AsyncSession):
+    """First seed inserts every system category."""
+    created = await category_service.seed_system_categories(db_session)
+    assert sorted(c.name for c in created) == sorted(c["name"] for c in SYSTEM_CATEGORIES)
+    assert all(c.is_system and c.user_id is None for c in created)
+
+
+@pytest.mark.asyncio
+async def test_seed_system_categories_idempotent(db_session: AsyncSession):
+    """Second seed inserts nothing and leaves no duplicates."""
+    await category_service.seed_system_categories(db_session)
+    created = await category_service.seed_system_categories(db_session)
+    assert created == []
+
+    system = await category_service.get_system_categories(db_session)
+    assert len(system) == len(SYSTEM_CATEGORIES)
+
+
+@pytest.mark.asyncio
+async def test_get_category_by_name_prefers_system(db_session: AsyncSession):
+    """System category wins over a same-named custom one; custom ones are per user."""
+    owner = User(email="cat-owner@test.com", password_hash="hashed")
+    other = User(email="cat-other@test.com", password_hash="hashed")
+    db_session.add_all([owner, other])
+    await db_session.flush()
+    await category_service.seed_system_categories(db_session)
+
+    await category_service.create_user_category(db_session, user_id=owner.id, name="Groceries")
+    custom = await category_service.create_user_category(db_session, user_id=owner.id, name="Pets")
+
+    groceries = await category_service.get_category_by_name(db_session, "Groceries", owner.id)
+    assert groceries.is_system is True
+
+    found = await category_service.get_category_by_name(db_session, "Pets", owner.id)
+    assert found.id == custom.id
+    assert await category_service.get_category_by_name(db_session, "Pets", other.id) is None
+    assert await category_service.get_category_by_name(db_session, "Pets") is None
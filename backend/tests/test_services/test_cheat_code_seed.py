@@ -1,7 +1,7 @@
 """Cheat code seed tests."""
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.cheat_code import CheatCodeDefinition, CheatCodeDifficulty
@@ -29,6 +29,19 @@ async def test_seed_is_idempotent(db_session: AsyncSession):
     assert len(all_defs) == 25  # Still 25, not 50
 
 
+@pytest.mark.asyncio
+async def test_seed_restores_missing_codes(db_session: AsyncSession):
+    definitions = await seed_cheat_codes(db_session)
+    missing = definitions[3].code
+    await db_session.execute(
+        delete(CheatCodeDefinition).where(CheatCodeDefinition.code == missing)
+    )
+    db_session.expunge_all()
+
+    reseeded = await seed_cheat_codes(db_session)
+    assert [d.code for d in reseeded] == [d.code for d in definitions]
+
+
 @pytest.mark.asyncio
 async def test_seed_includes_quick_win(db_session: AsyncSession):
     """At least one quick win (≤10 min) must exist for First Win support."""
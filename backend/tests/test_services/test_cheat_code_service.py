@@ -1,11 +1,13 @@
 """Cheat code service tests: start run, complete step, lifecycle."""
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.cheat_code import RunStatus
 from app.models.user import User
-from app.services import cheat_code_service, ranking_service
+from app.services import audit_service, cheat_code_service, ranking_service
 from app.services.cheat_code_seed import seed_cheat_codes
 
 
@@ -50,6 +52,22 @@ async def test_start_run_creates_steps(db_session: AsyncSession):
     assert all(s.status == RunStatus.not_started for s in steps)
 
 
+@pytest.mark.asyncio
+async def test_start_run_audit_detail_stores_ids_as_strings(db_session: AsyncSession):
+    user = await _create_user(db_session)
+    rec = await _setup_recommendation(db_session, user)
+
+    run = await cheat_code_service.start_run(
+        db_session, user_id=user.id, recommendation_id=rec.id
+    )
+    run_id, rec_id = run.id, rec.id
+    await db_session.flush()
+    db_session.expire_all()
+
+    events = await audit_service.reconstruct_why(db_session, "CheatCodeRun", run_id)
+    assert events[0].detail["recommendation_id"] == str(rec_id)
+
+
 @pytest.mark.asyncio
 async def test_complete_step(db_session: AsyncSession):
     user = await _create_user(db_session)
@@ -77,6 +95,59 @@ async def test_complete_step(db_session: AsyncSession):
     assert updated_run.completed_steps == 1
 
 
+@pytest.mark.asyncio
+async def test_complete_step_twice_counts_once(db_session: AsyncSession):
+    user = await _create_user(db_session)
+    rec = await _setup_recommendation(db_session, user)
+
+    run = await cheat_code_service.start_run(
+        db_session, user_id=user.id, recommendation_id=rec.id
+    )
+    for _ in range(2):
+        await cheat_code_service.complete_step(
+            db_session, run_id=run.id, user_id=user.id, step_number=1
+        )
+
+    updated_run = await cheat_code_service.get_run(
+        db_session, run_id=run.id, user_id=user.id
+    )
+    assert updated_run.completed_steps == 1
+    assert updated_run.status == RunStatus.in_progress
+
+
+@pytest.mark.asyncio
+async def test_complete_step_rejects_run_paused_mid_completion(db_session: AsyncSession):
+    """A run paused between the step and run writes is not moved on."""
+    user = await _create_user(db_session)
+    rec = await _setup_recommendation(db_session, user)
+    run = await cheat_code_service.start_run(
+        db_session, user_id=user.id, recommendation_id=rec.id
+    )
+    run_id = run.id
+    paused = []
+
+    def _pause_first(conn, cursor, statement, parameters, context, executemany):
+        # Stands in for a concurrent pause that lands just before the run UPDATE
+        if statement.startswith("UPDATE cheat_code_runs") and not paused:
+            paused.append(run_id)
+            cursor.execute(
+                "UPDATE cheat_code_runs SET status = 'paused' WHERE id = ?",
+                (run_id.hex,),
+            )
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _pause_first)
+    try:
+        with pytest.raises(NoResultFound):
+            await cheat_code_service.complete_step(
+                db_session, run_id=run_id, user_id=user.id, step_number=1
+            )
+    finally:
+        event.remove(engine, "before_cursor_execute", _pause_first)
+    assert paused
+    await db_session.rollback()
+
+
 @pytest.mark.asyncio
 async def test_complete_all_steps_completes_run(db_session: AsyncSession):
     user = await _create_user(db_session)
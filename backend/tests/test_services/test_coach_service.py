@@ -52,6 +52,34 @@ async def test_explain_cheat_code(db_session: AsyncSession):
     assert definitions[0].title in result["response"]
 
 
+@pytest.mark.asyncio
+async def test_definition_cache_survives_rollback(db_session: AsyncSession):
+    definitions = await seed_cheat_codes(db_session)
+    definition_id, title = definitions[0].id, definitions[0].title
+
+    await coach_service._get_definition(db_session, definition_id)
+    await db_session.rollback()  # expires every instance the session loaded
+
+    cached = await coach_service._get_definition(db_session, definition_id)
+    assert cached.title == title
+
+
+@pytest.mark.asyncio
+async def test_definition_cache_returns_frozen_detached_copy(db_session: AsyncSession):
+    definitions = await seed_cheat_codes(db_session)
+    definition_id = definitions[0].id
+    coach_service._definition_cache.clear()
+
+    missed = await coach_service._get_definition(db_session, definition_id)
+    hit = await coach_service._get_definition(db_session, definition_id)
+
+    assert hit is missed
+    assert missed not in db_session
+    assert isinstance(missed.steps, tuple)
+    with pytest.raises(TypeError):
+        missed.steps[0]["title"] = "changed"
+
+
 @pytest.mark.asyncio
 async def test_explain_unknown_context_type(db_session: AsyncSession):
     import uuid
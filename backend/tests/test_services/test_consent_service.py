@@ -68,6 +68,30 @@ async def test_revoke_consent(db_session: AsyncSession):
     assert is_granted is False
 
 
+@pytest.mark.asyncio
+async def test_check_consents_batch(db_session: AsyncSession):
+    """check_consents reports every requested type in one call."""
+    user = await _create_user(db_session)
+
+    await consent_service.grant_consent(
+        db_session, user_id=user.id, consent_type=ConsentType.data_access
+    )
+    await consent_service.grant_consent(
+        db_session, user_id=user.id, consent_type=ConsentType.ai_memory
+    )
+    await consent_service.revoke_consent(
+        db_session, user_id=user.id, consent_type=ConsentType.ai_memory
+    )
+    await db_session.commit()
+
+    granted = await consent_service.check_consents(db_session, user.id, ConsentType)
+    assert granted == {
+        ConsentType.data_access: True,
+        ConsentType.ai_memory: False,
+        ConsentType.terms_of_service: False,
+    }
+
+
 @pytest.mark.asyncio
 async def test_ai_memory_never_auto_granted(db_session: AsyncSession):
     """AI memory consent is never auto-granted; defaults OFF."""
@@ -178,3 +202,42 @@ async def test_duplicate_grant_returns_existing(db_session: AsyncSession):
     all_consents = await consent_service.get_all_consents(db_session, user.id)
     data_access = [c for c in all_consents if c.consent_type == ConsentType.data_access]
     assert len(data_access) == 1
+
+
+@pytest.mark.asyncio
+async def test_check_consent_cache_follows_revoke(db_session: AsyncSession):
+    """Cached active consent is dropped on revoke within the same session."""
+    user = await _create_user(db_session)
+
+    assert await consent_service.check_consent(
+        db_session, user.id, ConsentType.ai_memory
+    ) is False
+    await consent_service.grant_consent(
+        db_session, user_id=user.id, consent_type=ConsentType.ai_memory
+    )
+    assert await consent_service.check_consent(
+        db_session, user.id, ConsentType.ai_memory
+    ) is True
+
+    await consent_service.revoke_consent(
+        db_session, user_id=user.id, consent_type=ConsentType.ai_memory
+    )
+    assert await consent_service.check_consent(
+        db_session, user.id, ConsentType.ai_memory
+    ) is False
+
+
+@pytest.mark.asyncio
+async def test_check_consent_cache_dropped_on_rollback(db_session: AsyncSession):
+    """A grant that was rolled back is no longer reported active."""
+    user = await _create_user(db_session)
+    user_id = user.id
+
+    await consent_service.grant_consent(
+        db_session, user_id=user_id, consent_type=ConsentType.ai_memory
+    )
+    await db_session.rollback()
+
+    assert await consent_service.check_consent(
+        db_session, user_id, ConsentType.ai_memory
+    ) is False
@@ -496,3 +496,24 @@ async def test_get_latest_forecast_none(db_session: AsyncSession):
     user = await _create_user(db_session)
     result = await forecast_service.get_latest_forecast(db_session, user.id)
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_get_latest_summary(db_session: AsyncSession):
+    """Summary lookup returns only the dashboard columns of the newest snapshot."""
+    user = await _create_user(db_session)
+    await _create_checking_account(db_session, user, Decimal("1000.00"))
+
+    snapshot = await forecast_service.compute_forecast(db_session, user.id)
+
+    summary = await forecast_service.get_latest_summary(db_session, user.id)
+    assert summary is not None
+    assert summary["safe_to_spend_today"] == snapshot.safe_to_spend_today
+    assert summary["urgency_score"] == snapshot.urgency_score
+    assert "daily_balances" not in summary
+
+
+@pytest.mark.asyncio
+async def test_get_latest_summary_none(db_session: AsyncSession):
+    user = await _create_user(db_session)
+    assert await forecast_service.get_latest_summary(db_session, user.id) is None
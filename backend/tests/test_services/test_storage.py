@@ -4,6 +4,7 @@ import pytest
 import uuid
 
 from app.services.storage import (
+    FileTooLargeError,
     InMemoryStorageBackend,
     LocalStorageBackend,
     generate_storage_key,
@@ -82,6 +83,31 @@ async def test_local_storage_path_traversal(tmp_path):
     assert data == b"data"
 
 
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.asyncio
+async def test_local_storage_save_stream(tmp_path):
+    """LocalStorageBackend writes streamed chunks and returns the size."""
+    backend = LocalStorageBackend(base_dir=str(tmp_path))
+    size = await backend.save_stream("streamed", _chunks(b"ab", b"cd"), "text/plain")
+    assert size == 4
+    assert await backend.load("streamed") == b"abcd"
+
+
+@pytest.mark.asyncio
+async def test_local_storage_save_stream_too_large(tmp_path):
+    """Exceeding max_size raises and leaves no partial file behind."""
+    backend = LocalStorageBackend(base_dir=str(tmp_path))
+    with pytest.raises(FileTooLargeError):
+        await backend.save_stream(
+            "big", _chunks(b"abc", b"def"), "text/plain", max_size=4
+        )
+    assert not await backend.exists("big")
+
+
 def test_generate_storage_key():
     """generate_storage_key produces unique, safe keys."""
     uid = uuid.uuid4()
@@ -106,6 +106,46 @@ async def test_upload_too_large(db_session: AsyncSession):
         )
 
 
+@pytest.mark.asyncio
+async def test_upload_stream(db_session: AsyncSession):
+    """Upload accepts an async chunk stream; size is counted as it is written."""
+    user = await _create_user(db_session)
+
+    async def chunks():
+        yield b"fake "
+        yield b"image"
+
+    item = await vault_service.upload(
+        db_session,
+        user_id=user.id,
+        filename="receipt.jpg",
+        content_type="image/jpeg",
+        data=chunks(),
+    )
+    assert item.file_size == len(b"fake image")
+    assert await get_storage().load(item.storage_key) == b"fake image"
+
+
+@pytest.mark.asyncio
+async def test_upload_stream_too_large(db_session: AsyncSession):
+    """Streamed upload over MAX_FILE_SIZE is rejected and nothing is stored."""
+    user = await _create_user(db_session)
+
+    async def chunks():
+        yield b"x" * vault_service.MAX_FILE_SIZE
+        yield b"x"
+
+    with pytest.raises(ValueError, match="too large"):
+        await vault_service.upload(
+            db_session,
+            user_id=user.id,
+            filename="huge.jpg",
+            content_type="image/jpeg",
+            data=chunks(),
+        )
+    assert get_storage()._store == {}
+
+
 @pytest.mark.asyncio
 async def test_upload_invalid_content_type(db_session: AsyncSession):
     """Upload rejects unsupported content types."""
@@ -287,6 +327,36 @@ async def test_get_file_data(db_session: AsyncSession):
     assert data == b"file bytes here"
 
 
+@pytest.mark.asyncio
+async def test_open_file_streams_chunks(db_session: AsyncSession):
+    """open_file on non-disk storage yields the file as a chunk stream."""
+    user = await _create_user(db_session)
+    item = await vault_service.upload(
+        db_session, user_id=user.id,
+        filename="download.jpg", content_type="image/jpeg",
+        data=b"file bytes here",
+    )
+    fetched, source = await vault_service.open_file(
+        db_session, item_id=item.id, user_id=user.id
+    )
+    assert fetched.id == item.id
+    assert b"".join([chunk async for chunk in source]) == b"file bytes here"
+
+
+@pytest.mark.asyncio
+async def test_open_file_missing_raises(db_session: AsyncSession):
+    """open_file raises FileNotFoundError before streaming if storage lost the file."""
+    user = await _create_user(db_session)
+    item = await vault_service.upload(
+        db_session, user_id=user.id,
+        filename="gone.jpg", content_type="image/jpeg",
+        data=b"bytes",
+    )
+    await get_storage().delete(item.storage_key)
+    with pytest.raises(FileNotFoundError):
+        await vault_service.open_file(db_session, item_id=item.id, user_id=user.id)
+
+
 # --- link_to_transaction ---
 
 @pytest.mark.asyncio